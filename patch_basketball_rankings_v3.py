@@ -10,8 +10,14 @@ Run from /home/ledpi/LEDMatrix:
     python3 patch_basketball_rankings_v3.py
 """
 
+import contextlib
+import io
+import os
 import sys
 import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -24,6 +30,10 @@ FILES = [
 
 BACKUP_SUFFIX = f'.backup_before_rankings_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
 
+# Class-definition patterns used to track whether we're inside the Base class
+BASE_CLASS_RE = re.compile(rb'^class Base\w+Manager\(')
+MANAGER_CLASS_RE = re.compile(rb'^class \w+Manager\(')
+
 IMPORT_BLOCK = '''# Rankings service for AP Top 25 support
 try:
     from src.rankings_service import RankingsService
@@ -37,121 +47,159 @@ EXPANSION_CODE_TEMPLATE = '''
         # Expand ranking tokens (AP_TOP_25, AP_TOP_10) if rankings service available
         if RANKINGS_AVAILABLE and hasattr(self, 'favorite_teams') and self.favorite_teams:
             original_count = len(self.favorite_teams)
-            self.favorite_teams = RankingsService.expand_favorite_teams(
-                self.favorite_teams, 
+            self.favorite_teams = RankingsService.expand_favorite_teams_cached(
+                tuple(self.favorite_teams),
                 '{sport_key}'
             )
             if len(self.favorite_teams) != original_count:
                 self.logger.info(f"Expanded favorites from {{original_count}} to {{len(self.favorite_teams)}} teams")
 '''
 
+# Blocks rendered and encoded once at import time, one expansion block per sport_key
+IMPORT_BLOCK_BYTES = ('\n' + IMPORT_BLOCK.strip() + '\n\n').encode('utf-8')
+EXPANSION_BLOCKS = {
+    sport_key: (EXPANSION_CODE_TEMPLATE.format(sport_key=sport_key) + '\n').encode('utf-8')
+    for _, sport_key in FILES
+}
+
 
-def patch_file(filepath: Path, sport_key: str) -> bool:
-    """Patch a single file."""
+def patch_file(filepath: Path, sport_key: str, backup_suffix: str = BACKUP_SUFFIX) -> bool:
+    """Patch a single file, streaming it line by line into a temp file that replaces the original."""
     
     if not filepath.exists():
         print(f"  ERROR: File not found!")
         return False
     
-    content = filepath.read_text()
-    lines = content.split('\n')
-    
-    # Check if already patched
-    if 'RANKINGS_AVAILABLE' in content:
-        print(f"  Already patched!")
-        return True
-    
-    # Backup
-    backup = Path(str(filepath) + BACKUP_SUFFIX)
-    if not DRY_RUN:
-        backup.write_text(content)
-        print(f"  Created backup: {backup.name}")
+    expansion_block = EXPANSION_BLOCKS[sport_key]
     
-    new_lines = []
+    already_patched = False
+    import_found = False
     import_added = False
+    import_after_line = 0
+    super_found = False
     expansion_added = False
+    in_import_run = False
+    in_super_call = False
     in_base_class = False
-    base_class_super_found = False
     paren_depth = 0
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Add import after the existing imports (look for the from src.base_classes lines)
-        if not import_added and 'from src.base_classes' in line:
-            # Find the last import line
-            j = i
-            while j + 1 < len(lines) and (lines[j+1].strip().startswith('from ') or lines[j+1].strip().startswith('import ')):
-                j += 1
-            
-            # Add all lines up to and including last import
-            while i <= j:
-                new_lines.append(lines[i])
-                i += 1
-            
-            # Add import block
-            new_lines.append('')
-            for import_line in IMPORT_BLOCK.strip().split('\n'):
-                new_lines.append(import_line)
-            new_lines.append('')
-            import_added = True
-            print(f"  ✓ Added import block after line {j+1}")
-            continue
-        
-        # Track when we enter the Base class
-        if re.match(r'^class Base\w+Manager\(', line):
-            in_base_class = True
-        
-        # Track when we leave the Base class (next class definition)
-        if in_base_class and re.match(r'^class \w+Manager\(', line) and 'Base' not in line:
-            in_base_class = False
-        
-        new_lines.append(line)
-        
-        # Look for super().__init__ ONLY in the base class
-        if in_base_class and not expansion_added and 'super().__init__(' in line:
-            base_class_super_found = True
-            paren_depth = line.count('(') - line.count(')')
+    # Stream the patched output next to the original so os.replace() is atomic
+    tmp = tempfile.NamedTemporaryFile('wb', dir=filepath.parent, prefix=filepath.name + '.',
+                                      suffix='.tmp', delete=False)
+    try:
+        with filepath.open('rb') as src, tmp:
+            for lineno, line in enumerate(src, start=1):
+                # Check if already patched
+                if b'RANKINGS_AVAILABLE' in line:
+                    already_patched = True
+                    break
+                
+                # Extend the import run until the first non-import line, then add the import block
+                if in_import_run:
+                    if line.strip().startswith((b'from ', b'import ')):
+                        tmp.write(line)
+                        continue
+                    tmp.write(IMPORT_BLOCK_BYTES)
+                    in_import_run = False
+                    import_added = True
+                    import_after_line = lineno - 1
+                
+                tmp.write(line)
+                
+                # Collect a multi-line super().__init__() call until balanced
+                if in_super_call:
+                    paren_depth += line.count(b'(') - line.count(b')')
+                    if paren_depth <= 0:
+                        in_super_call = False
+                        tmp.write(expansion_block)
+                        expansion_added = True
+                    continue
+                
+                # Add import after the existing imports (look for the from src.base_classes lines)
+                if not import_found and b'from src.base_classes' in line:
+                    import_found = True
+                    in_import_run = True
+                    continue
+                
+                # Track when we enter the Base class
+                if BASE_CLASS_RE.match(line):
+                    in_base_class = True
+                
+                # Track when we leave the Base class (next class definition)
+                if in_base_class and MANAGER_CLASS_RE.match(line) and b'Base' not in line:
+                    in_base_class = False
+                
+                # Look for super().__init__ ONLY in the base class
+                if in_base_class and not super_found and b'super().__init__(' in line:
+                    super_found = True
+                    paren_depth = line.count(b'(') - line.count(b')')
+                    if paren_depth > 0:
+                        in_super_call = True
+                    else:
+                        tmp.write(expansion_block)
+                        expansion_added = True
             
-            # If multi-line call, collect until balanced
-            while paren_depth > 0 and i + 1 < len(lines):
-                i += 1
-                new_lines.append(lines[i])
-                paren_depth += lines[i].count('(') - lines[i].count(')')
-            
-            # Now add expansion code
-            expansion_code = EXPANSION_CODE_TEMPLATE.format(sport_key=sport_key)
-            for exp_line in expansion_code.split('\n'):
-                new_lines.append(exp_line)
-            expansion_added = True
-            print(f"  ✓ Added expansion code after base class super().__init__()")
-        
-        i += 1
-    
-    if not import_added:
+            # Blocks still pending at end of file
+            if not already_patched:
+                if in_import_run:
+                    tmp.write(IMPORT_BLOCK_BYTES)
+                    import_added = True
+                    import_after_line = lineno
+                if in_super_call:
+                    tmp.write(expansion_block)
+                    expansion_added = True
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    
+    if already_patched:
+        os.unlink(tmp.name)
+        print(f"  Already patched!")
+        return True
+    
+    if import_added:
+        print(f"  ✓ Added import block after line {import_after_line}")
+    else:
         print(f"  WARNING: Could not find import insertion point")
     
-    if not expansion_added:
+    if expansion_added:
+        print(f"  ✓ Added expansion code after base class super().__init__()")
+    else:
         print(f"  WARNING: Could not find base class super().__init__()")
     
-    # Write result
-    new_content = '\n'.join(new_lines)
-    
     if not DRY_RUN:
-        filepath.write_text(new_content)
+        # Backup the untouched original, then swap in the patched file
+        backup = Path(str(filepath) + backup_suffix)
+        shutil.copyfile(filepath, backup)
+        print(f"  Created backup: {backup.name}")
+        shutil.copymode(filepath, tmp.name)
+        os.replace(tmp.name, filepath)
         print(f"  ✓ Wrote patched file")
     else:
         print(f"  [DRY RUN] Would write patched file")
         # Show a preview
         if '--preview' in sys.argv:
             print("\n--- Preview of changes ---")
-            for j, new_line in enumerate(new_lines[70:130], start=71):
-                print(f"{j:4}: {new_line}")
+            with open(tmp.name, 'rb') as f:
+                for j, new_line in enumerate(f, start=1):
+                    if j > 130:
+                        break
+                    if j > 70:
+                        text = new_line.decode('utf-8').rstrip('\n')
+                        print(f"{j:4}: {text}")
+        os.unlink(tmp.name)
     
     return import_added and expansion_added
 
 
+def _patch_file_worker(filepath_str: str, sport_key: str, backup_suffix: str):
+    """Run patch_file in a worker process, capturing its output so it can be printed in order."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = patch_file(Path(filepath_str), sport_key, backup_suffix)
+    return result, output.getvalue()
+
+
 def main():
     print("=" * 60)
     print("NCAA Basketball Rankings Patch v3")
@@ -162,11 +210,19 @@ def main():
     
     success = 0
     
-    for filepath_str, sport_key in FILES:
-        filepath = Path(filepath_str)
-        print(f"\n--- {filepath.name} ---")
-        
-        if patch_file(filepath, sport_key):
+    # Each file is independent - patch them in parallel, then report in order
+    with ProcessPoolExecutor(max_workers=len(FILES)) as executor:
+        results = list(executor.map(
+            _patch_file_worker,
+            [filepath_str for filepath_str, _ in FILES],
+            [sport_key for _, sport_key in FILES],
+            [BACKUP_SUFFIX] * len(FILES),
+        ))
+    
+    for (filepath_str, _), (patched, output) in zip(FILES, results):
+        print(f"\n--- {Path(filepath_str).name} ---")
+        print(output, end='')
+        if patched:
             success += 1
     
     print("\n" + "=" * 60)
@@ -10,6 +10,13 @@ from pathlib import Path
 
 FLIGHT_MANAGER = Path.home() / "LEDMatrix" / "src" / "flight_manager.py"
 
+def replace_once(content, old, new):
+    """Replace the first occurrence of old with new in a single scan. Returns (content, replaced)."""
+    idx = content.find(old)
+    if idx < 0:
+        return content, False
+    return content[:idx] + new + content[idx + len(old):], True
+
 def main():
     if not FLIGHT_MANAGER.exists():
         print(f"ERROR: {FLIGHT_MANAGER} not found!")
@@ -17,10 +24,10 @@ def main():
     
     # Backup original
     backup = FLIGHT_MANAGER.with_suffix('.py.backup_icons')
-    shutil.copy(FLIGHT_MANAGER, backup)
+    shutil.copyfile(FLIGHT_MANAGER, backup)
     print(f"Created backup: {backup}")
     
-    content = FLIGHT_MANAGER.read_text()
+    content = FLIGHT_MANAGER.read_bytes().decode('utf-8')
     
     # === PATCH 1: Add MIL_HELO and STAR to icon_files ===
     old_icons = """icon_files = {
@@ -41,8 +48,8 @@ def main():
             'STAR': 'star.png'
         }"""
     
-    if old_icons in content:
-        content = content.replace(old_icons, new_icons)
+    content, patched = replace_once(content, old_icons, new_icons)
+    if patched:
         print("✓ Patched icon_files to add MIL_HELO and STAR")
     elif 'MIL_HELO' in content:
         print("⊘ icon_files already has MIL_HELO")
@@ -94,35 +101,54 @@ def main():
         
         return 'UNK\''''
     
-    new_infer = '''    def _infer_aircraft_type(self, callsign: str, altitude_ft: int, speed_knots: int) -> str:
+    new_infer = '''    # Military callsign prefixes grouped by length, so each length is one set lookup
+    MILITARY_PREFIXES_BY_LEN = (
+        (3, frozenset({'RCH', 'CNV', 'PAT'})),
+        (4, frozenset({'EVAC', 'ARMY', 'NAVY', 'DUKE', 'HAWK', 'IRON', 'RAID', 'BONE'})),
+        (5, frozenset({'REACH', 'TETON', 'GUARD', 'VIPER', 'STEEL', 'BLADE', 'SABER',
+                       'BOXER', 'KARMA', 'SKULL', 'DEATH'})),
+        (6, frozenset({'RESCUE', 'TOPCAT'})),
+        (7, frozenset({'DUSTOFF'})),
+    )
+    
+    # Helicopter callsign substrings
+    HELI_PATTERNS = ('LIFE', 'MEDEVAC', 'HELI', 'COPTER', 'AIR1', 'MERCY', 'DUSTOFF')
+    
+    # Commercial airline ICAO codes (all 3 letters - matched against callsign[:3])
+    AIRLINE_CODES = frozenset({'AAL', 'UAL', 'DAL', 'SWA', 'JBU', 'ASA', 'FFT', 'NKS', 
+                               'SKW', 'ENY', 'RPA', 'EDV', 'FDX', 'UPS', 'GTI', 'ABX',
+                               'EJA', 'LXJ', 'XOJ', 'TVS', 'XAJ', 'LEA', 'WWI'})
+    
+    # Callsign-only flags, cached because the same aircraft is seen every refresh
+    # {callsign: (is_military, is_helo, is_airline, is_n_number)}
+    _callsign_flags_cache = {}
+    _CALLSIGN_FLAGS_CACHE_SIZE = 4096
+    
+    def _get_callsign_flags(self, callsign: str) -> tuple:
+        """Return the cached (is_military, is_helo, is_airline, is_n_number) flags for a callsign."""
+        flags = self._callsign_flags_cache.get(callsign)
+        if flags is None:
+            # Normalized only on a cache miss: the in-repo ingest loops already
+            # strip/uppercase callsigns, but the ingest loop of the file this
+            # script patches only strips them
+            text = (callsign or '').upper().strip()
+            flags = (
+                any(text[:length] in prefixes for length, prefixes in self.MILITARY_PREFIXES_BY_LEN),
+                any(pattern in text for pattern in self.HELI_PATTERNS),
+                text[:3] in self.AIRLINE_CODES,
+                text.startswith('N') and len(text) <= 6,
+            )
+            if len(self._callsign_flags_cache) >= self._CALLSIGN_FLAGS_CACHE_SIZE:
+                self._callsign_flags_cache.clear()
+            self._callsign_flags_cache[callsign] = flags
+        return flags
+    
+    def _infer_aircraft_type(self, callsign: str, altitude_ft: int, speed_knots: int) -> str:
         """
         Infer aircraft type from callsign patterns and flight characteristics.
         Returns type_code: MIL, MIL_HELO, JET, HELO, GA, or UNK
         """
-        callsign = (callsign or '').upper().strip()
-        
-        # Military patterns
-        military_patterns = ['REACH', 'TETON', 'EVAC', 'RESCUE', 'ARMY', 'NAVY', 
-                           'GUARD', 'DUKE', 'HAWK', 'VIPER', 'RCH', 'CNV', 'PAT',
-                           'IRON', 'STEEL', 'BLADE', 'SABER', 'TOPCAT', 'BOXER',
-                           'KARMA', 'RAID', 'SKULL', 'BONE', 'DEATH', 'DUSTOFF']
-        
-        # Helicopter patterns
-        heli_patterns = ['LIFE', 'MEDEVAC', 'HELI', 'COPTER', 'AIR1', 'MERCY', 'DUSTOFF']
-        
-        # Check military first
-        is_military = False
-        for pattern in military_patterns:
-            if callsign.startswith(pattern):
-                is_military = True
-                break
-        
-        # Check helicopter patterns
-        is_helo = False
-        for pattern in heli_patterns:
-            if pattern in callsign:
-                is_helo = True
-                break
+        is_military, is_helo, is_airline, is_n_number = self._get_callsign_flags(callsign)
         
         # Military helicopter (military callsign + helo indicator OR low/slow military)
         if is_military:
@@ -142,25 +168,21 @@ def main():
             return 'HELO'
         
         # Commercial airlines
-        airlines = ['AAL', 'UAL', 'DAL', 'SWA', 'JBU', 'ASA', 'FFT', 'NKS', 
-                   'SKW', 'ENY', 'RPA', 'EDV', 'FDX', 'UPS', 'GTI', 'ABX',
-                   'EJA', 'LXJ', 'XOJ', 'TVS', 'XAJ', 'LEA', 'WWI']
-        for code in airlines:
-            if callsign.startswith(code):
-                return 'JET'
+        if is_airline:
+            return 'JET'
         
         # High altitude = jet
         if altitude_ft and altitude_ft > 25000:
             return 'JET'
         
         # N-numbers = general aviation
-        if callsign.startswith('N') and len(callsign) <= 6:
+        if is_n_number:
             return 'GA'
         
         return 'UNK\''''
     
-    if old_infer in content:
-        content = content.replace(old_infer, new_infer)
+    content, patched = replace_once(content, old_infer, new_infer)
+    if patched:
         print("✓ Patched _infer_aircraft_type for MIL_HELO detection")
     elif 'MIL_HELO' in content and '_infer_aircraft_type' in content:
         print("⊘ _infer_aircraft_type may already have MIL_HELO")
@@ -191,7 +213,7 @@ def main():
     new_display_icon = """        # Check if military aircraft (show star prefix)
         is_military = aircraft_type in ('MIL', 'MIL_HELO')
         
-        # Get aircraft icon (will be resized to 12x12)
+        # Get aircraft icon (resized to 12x12 unless the loader already did)
         icon = self.aircraft_icons.get(aircraft_type)
         star_icon = self.aircraft_icons.get('STAR') if is_military else None
         
@@ -214,7 +236,8 @@ def main():
             img.paste(small_star, (current_x, 1), small_star if small_star.mode == 'RGBA' else None)
             current_x += star_width + star_spacing
         
-        # Draw aircraft icon if available (resize to 12x12)
+        # Draw aircraft icon if available (resize to 12x12; legacy loaders
+        # that this script doesn't patch still load icons at 16x16)
         if icon:
             small_icon = icon.resize((12, 12), Image.LANCZOS) if icon.size != (12, 12) else icon
             img.paste(small_icon, (current_x, 1), small_icon if small_icon.mode == 'RGBA' else None)
@@ -224,8 +247,8 @@ def main():
         text_x = current_x
         draw.text((text_x, 0), callsign, fill=self.COLORS['orange'], font=font_callsign)"""
     
-    if old_display_icon in content:
-        content = content.replace(old_display_icon, new_display_icon)
+    content, patched = replace_once(content, old_display_icon, new_display_icon)
+    if patched:
         print("✓ Patched _create_flight_display for star prefix on military")
     elif 'is_military = aircraft_type' in content:
         print("⊘ _create_flight_display may already have star prefix")
@@ -233,7 +256,7 @@ def main():
         print("✗ Could not find _create_flight_display icon section to patch (may need manual edit)")
     
     # Write patched content
-    FLIGHT_MANAGER.write_text(content)
+    FLIGHT_MANAGER.write_bytes(content.encode('utf-8'))
     print(f"\n✓ Saved patched file: {FLIGHT_MANAGER}")
     print("\nRestart service to apply: sudo systemctl restart ledmatrix")
     return True
@@ -9,9 +9,12 @@ Usage:
     python3 patch_ncaa_basketball_rankings.py [--dry-run]
 """
 
+import contextlib
+import io
 import sys
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -38,21 +41,33 @@ except ImportError:
     logging.getLogger(__name__).warning("rankings_service not available - AP_TOP_25 tokens won't expand")
 '''
 
+# Last import line before class/def/logger - the import block goes after it
+IMPORT_RE = re.compile(r'((?:from|import)\s+[\w.]+.*\n)(?=\s*(?:class|def|#\s*-{3,}|logger\s*=))', re.MULTILINE)
+
+# Where self.favorite_teams is set - the expansion code goes after it
+FAVORITES_RE = re.compile(r"(self\.favorite_teams\s*=\s*self\.mode_config\.get\(['\"]favorite_teams['\"],\s*\[\]\))")
+
 # The expansion code template (sport_id will be substituted)
 EXPANSION_CODE_TEMPLATE = '''
         # Expand ranking tokens (AP_TOP_25, AP_TOP_10, etc.) if service available
         if RANKINGS_AVAILABLE and self.favorite_teams:
             original_count = len(self.favorite_teams)
-            self.favorite_teams = RankingsService.expand_favorite_teams(
-                self.favorite_teams, 
+            self.favorite_teams = RankingsService.expand_favorite_teams_cached(
+                tuple(self.favorite_teams),
                 '{sport_id}'
             )
             if len(self.favorite_teams) != original_count:
                 self.logger.info(f"Expanded favorites from {{original_count}} to {{len(self.favorite_teams)}} teams")
 '''
 
+# Expansion code rendered once per sport_id at import time
+EXPANSION_CODE = {
+    sport_id: EXPANSION_CODE_TEMPLATE.format(sport_id=sport_id)
+    for sport_id in TARGET_FILES.values()
+}
 
-def patch_file(filename, sport_id):
+
+def patch_file(filename, sport_id, backup_suffix=BACKUP_SUFFIX):
     """Apply the patch to a basketball manager file."""
     
     target_path = Path('src') / filename
@@ -62,24 +77,23 @@ def patch_file(filename, sport_id):
         return False
     
     # Read current content
-    content = target_path.read_text()
+    data = target_path.read_bytes()
     
-    # Check if already patched
-    if 'RankingsService' in content:
+    # Check if already patched (on the raw bytes, before paying for a decode)
+    if b'RankingsService' in data:
         print(f"  ✓ {filename} already patched (RankingsService found)")
         return True
     
+    content = data.decode('utf-8')
+    
     # Create backup
     if not DRY_RUN:
-        backup_path = target_path.with_suffix(target_path.suffix + BACKUP_SUFFIX)
-        shutil.copy(target_path, backup_path)
+        backup_path = target_path.with_suffix(target_path.suffix + backup_suffix)
+        shutil.copyfile(target_path, backup_path)
         print(f"  Created backup: {backup_path.name}")
     
     # Add import after existing imports
-    # Look for the last import line before class/def/logger
-    import_pattern = r'((?:from|import)\s+[\w.]+.*\n)(?=\s*(?:class|def|#\s*-{3,}|logger\s*=))'
-    
-    match = re.search(import_pattern, content, re.MULTILINE)
+    match = IMPORT_RE.search(content)
     if match:
         insert_pos = match.end()
         content = content[:insert_pos] + IMPORT_BLOCK + content[insert_pos:]
@@ -95,14 +109,10 @@ def patch_file(filename, sport_id):
             print(f"  ✓ Added import block (at top)")
     
     # Find where to add expansion code
-    # Look for where self.favorite_teams is set
-    favorites_pattern = r"(self\.favorite_teams\s*=\s*self\.mode_config\.get\(['\"]favorite_teams['\"],\s*\[\]\))"
-    
-    match = re.search(favorites_pattern, content)
+    match = FAVORITES_RE.search(content)
     if match:
         insert_pos = match.end()
-        expansion_code = EXPANSION_CODE_TEMPLATE.format(sport_id=sport_id)
-        content = content[:insert_pos] + expansion_code + content[insert_pos:]
+        content = content[:insert_pos] + EXPANSION_CODE[sport_id] + content[insert_pos:]
         print(f"  ✓ Added favorites expansion code for '{sport_id}'")
     else:
         print(f"  WARNING: Could not find favorite_teams assignment in {filename}")
@@ -113,12 +123,20 @@ def patch_file(filename, sport_id):
     if DRY_RUN:
         print(f"  DRY RUN - would write {len(content)} bytes")
     else:
-        target_path.write_text(content)
+        target_path.write_bytes(content.encode('utf-8'))
         print(f"  ✓ Wrote patched file")
     
     return True
 
 
+def _patch_file_worker(filename, sport_id, backup_suffix):
+    """Run patch_file in a worker process, capturing its output so it can be printed in order."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = patch_file(filename, sport_id, backup_suffix)
+    return result, output.getvalue()
+
+
 def main():
     print("=" * 60)
     print("NCAA Basketball Rankings Patch")
@@ -129,9 +147,19 @@ def main():
     
     success_count = 0
     
-    for filename, sport_id in TARGET_FILES.items():
+    # Each file is independent - patch them in parallel, then report in order
+    with ProcessPoolExecutor(max_workers=len(TARGET_FILES)) as executor:
+        results = list(executor.map(
+            _patch_file_worker,
+            TARGET_FILES.keys(),
+            TARGET_FILES.values(),
+            [BACKUP_SUFFIX] * len(TARGET_FILES),
+        ))
+    
+    for filename, (patched, output) in zip(TARGET_FILES, results):
         print(f"\n--- {filename} ---")
-        if patch_file(filename, sport_id):
+        print(output, end='')
+        if patched:
             success_count += 1
     
     print("\n" + "=" * 60)
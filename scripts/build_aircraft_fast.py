@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Build the optional compiled helpers in place:
+
+- src/aircraft_fast.pyx: per-aircraft geometry for aircraft_lookup.py
+- src/faa_fast.pyx: per-row MASTER.txt classification for faa_database.py
+
+Needs Cython and a C compiler (cython3 and build-essential are installed by
+first_time_install.sh). The display works without them; both modules fall
+back to pure Python when an extension isn't built.
+
+Usage:
+    python3 scripts/build_aircraft_fast.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Extension, setup
+    except ImportError as e:
+        print(f"✗ Cannot build aircraft_fast: {e}")
+        print("  Install with: sudo apt install cython3 python3-setuptools")
+        return 1
+
+    os.chdir(PROJECT_ROOT)
+    extensions = [
+        Extension(
+            "src.aircraft_fast",
+            ["src/aircraft_fast.pyx"],
+            # No -ffast-math, and no fused multiply-add: results must match the
+            # pure Python fallback bit for bit
+            extra_compile_args=["-O3", "-march=native", "-ffp-contract=off"],
+            libraries=["m"],
+        ),
+        Extension(
+            "src.faa_fast",
+            ["src/faa_fast.pyx"],
+            # memmem() is a GNU extension
+            define_macros=[("_GNU_SOURCE", None)],
+            extra_compile_args=["-O3", "-march=native"],
+        ),
+    ]
+    setup(
+        name="ledmatrix-aircraft-fast",
+        ext_modules=cythonize(extensions, quiet=True),
+        script_args=["build_ext", "--inplace"],
+    )
+
+    print("✓ Built src/aircraft_fast and src/faa_fast")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
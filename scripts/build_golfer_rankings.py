@@ -4,68 +4,58 @@ Build golfer rankings JSON by searching ESPN for each name.
 Uses OWGR top 100 (men) and Rolex Rankings (women).
 """
 
-import json
-import urllib.request
-import urllib.parse
-import time
+import os
 import sys
 
-# OWGR Top 50 Men (as of Dec 2025 approximate)
-MEN_GOLFERS = [
-    "Scottie Scheffler", "Xander Schauffele", "Rory McIlroy", "Jon Rahm",
-    "Collin Morikawa", "Ludvig Aberg", "Wyndham Clark", "Viktor Hovland",
-    "Patrick Cantlay", "Tommy Fleetwood", "Hideki Matsuyama", "Sahith Theegala",
-    "Tony Finau", "Shane Lowry", "Sungjae Im", "Russell Henley",
-    "Matt Fitzpatrick", "Tom Kim", "Brian Harman", "Keegan Bradley",
-    "Corey Conners", "Max Homa", "Akshay Bhatia", "Robert MacIntyre",
-    "Cameron Young", "Sepp Straka", "Jason Day", "Si Woo Kim",
-    "Adam Scott", "Byeong Hun An", "Justin Thomas", "Denny McCarthy",
-    "Billy Horschel", "Davis Thompson", "Maverick McNealy", "Cameron Smith",
-    "Taylor Moore", "Aaron Rai", "Christiaan Bezuidenhout", "Jordan Spieth",
-    "Dustin Johnson", "Tiger Woods", "Brooks Koepka", "Bryson DeChambeau",
-    "Phil Mickelson", "Rickie Fowler", "Justin Rose", "Sergio Garcia",
-    "Adam Hadwin", "Min Woo Lee"
-]
+from espn_client import (
+    REQUEST_TIMEOUT, SEARCH_URL, SESSION, PlayerSearch, clear_cache,
+    dump_json_file, load_json_file, load_source_players, parse_response
+)
 
-# Rolex Women's Rankings Top 30
-WOMEN_GOLFERS = [
-    "Nelly Korda", "Lydia Ko", "Hannah Green", "Lilia Vu", "Jin Young Ko",
-    "Ruoning Yin", "Ayaka Furue", "Charley Hull", "Celine Boutier", "Rose Zhang",
-    "Minjee Lee", "Amy Yang", "Nasa Hataoka", "Haeran Ryu", "Brooke Henderson",
-    "Jeeno Thitikul", "Lexi Thompson", "Georgia Hall", "Yuka Saso", "Ally Ewing",
-    "Atthaya Thitikul", "Lauren Coughlin", "Megan Khang", "Andrea Lee", "Leona Maguire"
-]
+OUTPUT_PATH = '/home/ledpi/LEDMatrix/data/golfer_rankings.json'
+
+# Name lists live in data/source_players.json (shared with the tennis builder)
+SOURCE_PLAYERS, SOURCE_HASH = load_source_players()
+# OWGR top 50 men, Rolex women's rankings, Champions Tour notables
+MEN_GOLFERS = SOURCE_PLAYERS['golf']['pga']
+WOMEN_GOLFERS = SOURCE_PLAYERS['golf']['lpga']
+CHAMPIONS_GOLFERS = SOURCE_PLAYERS['golf']['champions-tour']
 
-# Champions Tour notable players
-CHAMPIONS_GOLFERS = [
-    "Bernhard Langer", "Ernie Els", "Fred Couples", "Vijay Singh", 
-    "Padraig Harrington", "Steve Stricker", "Jim Furyk", "Stewart Cink",
-    "Retief Goosen", "David Duval", "Y.E. Yang", "Richard Bland"
+# (rankings key, display label, names in rank order)
+TOURS = [
+    ('pga', 'PGA Tour', MEN_GOLFERS),
+    ('lpga', 'LPGA Tour', WOMEN_GOLFERS),
+    ('champions-tour', 'Champions Tour', CHAMPIONS_GOLFERS),
 ]
 
-def search_espn(name):
-    """Search ESPN for a golfer and return their ID."""
-    try:
-        query = urllib.parse.quote(name)
-        url = f"https://site.web.api.espn.com/apis/common/v3/search?query={query}&limit=3&type=player"
-        
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-        
-        items = data.get('items', [])
-        # Find golf result
-        for item in items:
-            if item.get('sport') == 'golf':
-                return {
-                    'id': item['id'],
-                    'name': item['displayName'],
-                    'league': item.get('league', 'pga')
-                }
-        return None
-    except Exception as e:
-        print(f"  Error searching {name}: {e}", file=sys.stderr)
-        return None
+def _golf_results(query, limit):
+    """Run an ESPN player search and yield the golf hits in result form.
+    
+    Results are built lazily, so a caller that only wants the first match
+    stops as soon as it sees one.
+    """
+    response = SESSION.get(
+        SEARCH_URL,
+        params={'query': query, 'limit': limit, 'type': 'player'},
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    data = parse_response(response)
+    
+    for item in data.get('items', []):
+        if item.get('sport') == 'golf':
+            yield {
+                'id': item['id'],
+                'name': item['displayName'],
+                'league': item.get('league', 'pga')
+            }
+
+def _report_error(name, e):
+    print(f"  Error searching {name}: {e}", file=sys.stderr)
+
+GOLF_SEARCH = PlayerSearch(_golf_results, 3, _report_error)
+search_espn = GOLF_SEARCH.search
+resolve_names = GOLF_SEARCH.resolve_names
 
 def build_rankings():
     """Build the complete rankings JSON."""
@@ -73,52 +63,49 @@ def build_rankings():
         "last_updated": "2025-12-16",
         "source": "OWGR/Rolex Rankings (ESPN IDs)",
         "note": "Run build_golfer_rankings.py to refresh",
+        "source_hash": SOURCE_HASH,
         "pga": [],
         "lpga": [],
         "champions-tour": []
     }
     
-    print("Building PGA Tour rankings...")
-    for i, name in enumerate(MEN_GOLFERS, 1):
-        result = search_espn(name)
-        if result:
-            rankings["pga"].append({
-                "rank": i,
-                "id": result['id'],
-                "name": result['name']
-            })
-            print(f"  {i}. {result['name']} (ID: {result['id']})")
-        else:
-            print(f"  {i}. {name} - NOT FOUND")
-        time.sleep(0.3)  # Rate limiting
+    # Reuse IDs from the previous run so only new names hit the search API
+    existing = {}
+    if os.path.exists(OUTPUT_PATH):
+        try:
+            prev = load_json_file(OUTPUT_PATH)
+            # Same name lists as last time and every golfer was found: nothing to rebuild
+            if prev.get('source_hash') == SOURCE_HASH and all(
+                len(prev.get(tour, [])) == len(names) for tour, _, names in TOURS
+            ):
+                print("Player lists unchanged since the last build; keeping it")
+                return prev
+            for tour, _, _ in TOURS:
+                for p in prev.get(tour, []):
+                    if p.get('id'):
+                        existing[p['name']] = {'id': p['id'], 'name': p['name']}
+            print(f"Loaded {len(existing)} existing golfer IDs")
+        except Exception as e:
+            print(f"  Could not read {OUTPUT_PATH}: {e}", file=sys.stderr)
     
-    print("\nBuilding LPGA Tour rankings...")
-    for i, name in enumerate(WOMEN_GOLFERS, 1):
-        result = search_espn(name)
-        if result:
-            rankings["lpga"].append({
-                "rank": i,
-                "id": result['id'],
-                "name": result['name']
-            })
-            print(f"  {i}. {result['name']} (ID: {result['id']})")
-        else:
-            print(f"  {i}. {name} - NOT FOUND")
-        time.sleep(0.3)
+    # One lookup pass over every tour, so all missing names share the worker pool
+    all_names = dict.fromkeys(name for _, _, names in TOURS for name in names)
+    found = dict(existing)
+    found.update(resolve_names([name for name in all_names if name not in existing]))
     
-    print("\nBuilding Champions Tour rankings...")
-    for i, name in enumerate(CHAMPIONS_GOLFERS, 1):
-        result = search_espn(name)
-        if result:
-            rankings["champions-tour"].append({
-                "rank": i,
-                "id": result['id'],
-                "name": result['name']
-            })
-            print(f"  {i}. {result['name']} (ID: {result['id']})")
-        else:
-            print(f"  {i}. {name} - NOT FOUND")
-        time.sleep(0.3)
+    for tour, label, names in TOURS:
+        print(f"\nBuilding {label} rankings...")
+        for i, name in enumerate(names, 1):
+            result = found.get(name)
+            if result:
+                rankings[tour].append({
+                    "rank": i,
+                    "id": result['id'],
+                    "name": result['name']
+                })
+                print(f"  {i}. {result['name']} (ID: {result['id']})")
+            else:
+                print(f"  {i}. {name} - NOT FOUND")
     
     return rankings
 
@@ -127,20 +114,21 @@ if __name__ == '__main__':
     print("Building Golfer Rankings JSON")
     print("=" * 50)
     
-    rankings = build_rankings()
+    if '--no-cache' in sys.argv:
+        clear_cache()
     
-    # Save to file
-    output_path = '/home/ledpi/LEDMatrix/data/golfer_rankings.json'
+    rankings = build_rankings()
     
     # Ensure directory exists
-    import os
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(rankings, f, indent=2)
+    written = dump_json_file(rankings, OUTPUT_PATH)
     
     print(f"\n{'=' * 50}")
-    print(f"Saved to {output_path}")
+    if written:
+        print(f"Saved to {OUTPUT_PATH}")
+    else:
+        print(f"No changes; left {OUTPUT_PATH} untouched")
     print(f"PGA: {len(rankings['pga'])} golfers")
     print(f"LPGA: {len(rankings['lpga'])} golfers")
     print(f"Champions: {len(rankings['champions-tour'])} golfers")
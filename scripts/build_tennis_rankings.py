@@ -6,16 +6,21 @@ Similar to golf rankings builder - fetches current rankings and verifies IDs.
 Usage:
     python3 build_tennis_rankings.py           # Build/update rankings
     python3 build_tennis_rankings.py --verify  # Verify existing IDs only
+    python3 build_tennis_rankings.py --no-cache  # Ignore cached ESPN responses
 """
 
-import json
-import requests
-import time
 import os
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 
+from espn_client import (
+    MAX_WORKERS, REQUEST_TIMEOUT, SEARCH_URL, SESSION, PlayerSearch, clear_cache,
+    dump_json_file, load_json_file, load_source_players, parse_response
+)
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,39 +32,44 @@ logger = logging.getLogger(__name__)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_PATH = os.path.join(SCRIPT_DIR, '..', 'data', 'tennis_rankings.json')
 
+# ESPN endpoints
+ATHLETE_URL = 'https://site.api.espn.com/apis/site/v2/sports/tennis/athletes/{player_id}'
 
-def search_espn_player(name: str) -> dict:
+
+def _tennis_results(query: str, limit: int):
     """
-    Search ESPN for a tennis player by name.
-    Returns player info with verified ESPN ID.
+    Run an ESPN player search and yield the tennis hits in result form.
+    Results are built lazily, so a caller that only wants the first match
+    stops as soon as it sees one.
     """
-    try:
-        # Clean name for search
-        search_name = name.replace("'", "").strip()
-        url = f"https://site.web.api.espn.com/apis/common/v3/search?query={search_name}&limit=5&type=player"
-        
-        response = requests.get(url, timeout=10)
-        if response.status_code != 200:
-            logger.warning(f"Search API returned {response.status_code} for '{name}'")
-            return None
-        
-        data = response.json()
-        items = data.get('items', [])
-        
-        # Find tennis player
-        for item in items:
-            if item.get('sport', '').lower() == 'tennis':
-                return {
-                    'id': str(item.get('id', '')),
-                    'name': item.get('displayName', name),
-                    'found': True
-                }
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error searching for '{name}': {e}")
-        return None
+    # Clean name for search
+    search_name = query.replace("'", "").strip()
+    response = SESSION.get(
+        SEARCH_URL,
+        params={'query': search_name, 'limit': limit, 'type': 'player'},
+        timeout=REQUEST_TIMEOUT
+    )
+    if response.status_code != 200:
+        logger.warning(f"Search API returned {response.status_code} for '{query}'")
+        return
+    
+    data = parse_response(response)
+    for item in data.get('items', []):
+        if item.get('sport', '').lower() == 'tennis':
+            yield {
+                'id': str(item.get('id', '')),
+                'name': item.get('displayName', query),
+                'found': True
+            }
+
+
+def _report_error(name: str, e: Exception):
+    logger.error(f"Error searching for '{name}': {e}")
+
+
+TENNIS_SEARCH = PlayerSearch(_tennis_results, 5, _report_error)
+search_espn_player = TENNIS_SEARCH.search
+resolve_names = TENNIS_SEARCH.resolve_names
 
 
 def verify_player_id(player_id: str, expected_name: str) -> bool:
@@ -67,11 +77,10 @@ def verify_player_id(player_id: str, expected_name: str) -> bool:
     Verify a player ID is valid by checking ESPN athlete endpoint.
     """
     try:
-        url = f"https://site.api.espn.com/apis/site/v2/sports/tennis/athletes/{player_id}"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(ATHLETE_URL.format(player_id=player_id), timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_response(response)
             actual_name = data.get('athlete', {}).get('displayName', '')
             return expected_name.lower() in actual_name.lower() or actual_name.lower() in expected_name.lower()
         
@@ -81,113 +90,23 @@ def verify_player_id(player_id: str, expected_name: str) -> bool:
         return False
 
 
-def build_rankings():
+def _build_group(tour: str, players: list, existing_players: dict, search_results: dict) -> tuple:
     """
-    Build tennis rankings file with verified ESPN IDs.
+    Build the output entries for one tour's players.
+    Logs one summary line for the tour; misses are logged individually.
+    Returns (verified players, names not found).
     """
-    logger.info("Building tennis rankings...")
-    
-    # Load existing rankings if available
-    existing_players = {}
-    if os.path.exists(OUTPUT_PATH):
-        try:
-            with open(OUTPUT_PATH, 'r') as f:
-                data = json.load(f)
-                for p in data.get('players', []):
-                    existing_players[p['name']] = p
-            logger.info(f"Loaded {len(existing_players)} existing players")
-        except:
-            pass
-    
-    # Current top players (manually curated list)
-    players_to_add = [
-        # ATP Top 25 + Notable
-        {"name": "Jannik Sinner", "tour": "ATP", "rank": 1, "country": "ITA"},
-        {"name": "Alexander Zverev", "tour": "ATP", "rank": 2, "country": "GER"},
-        {"name": "Carlos Alcaraz", "tour": "ATP", "rank": 3, "country": "ESP"},
-        {"name": "Taylor Fritz", "tour": "ATP", "rank": 4, "country": "USA"},
-        {"name": "Daniil Medvedev", "tour": "ATP", "rank": 5, "country": "RUS"},
-        {"name": "Casper Ruud", "tour": "ATP", "rank": 6, "country": "NOR"},
-        {"name": "Novak Djokovic", "tour": "ATP", "rank": 7, "country": "SRB"},
-        {"name": "Alex de Minaur", "tour": "ATP", "rank": 8, "country": "AUS"},
-        {"name": "Andrey Rublev", "tour": "ATP", "rank": 9, "country": "RUS"},
-        {"name": "Grigor Dimitrov", "tour": "ATP", "rank": 10, "country": "BUL"},
-        {"name": "Tommy Paul", "tour": "ATP", "rank": 11, "country": "USA"},
-        {"name": "Stefanos Tsitsipas", "tour": "ATP", "rank": 12, "country": "GRE"},
-        {"name": "Holger Rune", "tour": "ATP", "rank": 13, "country": "DEN"},
-        {"name": "Hubert Hurkacz", "tour": "ATP", "rank": 14, "country": "POL"},
-        {"name": "Frances Tiafoe", "tour": "ATP", "rank": 15, "country": "USA"},
-        {"name": "Jack Draper", "tour": "ATP", "rank": 16, "country": "GBR"},
-        {"name": "Ugo Humbert", "tour": "ATP", "rank": 17, "country": "FRA"},
-        {"name": "Lorenzo Musetti", "tour": "ATP", "rank": 18, "country": "ITA"},
-        {"name": "Karen Khachanov", "tour": "ATP", "rank": 19, "country": "RUS"},
-        {"name": "Sebastian Korda", "tour": "ATP", "rank": 20, "country": "USA"},
-        {"name": "Ben Shelton", "tour": "ATP", "rank": 21, "country": "USA"},
-        {"name": "Felix Auger-Aliassime", "tour": "ATP", "rank": 22, "country": "CAN"},
-        {"name": "Arthur Fils", "tour": "ATP", "rank": 23, "country": "FRA"},
-        {"name": "Alejandro Tabilo", "tour": "ATP", "rank": 24, "country": "CHI"},
-        {"name": "Tomas Machac", "tour": "ATP", "rank": 25, "country": "CZE"},
-        # ATP Notable/Legends
-        {"name": "Nick Kyrgios", "tour": "ATP", "rank": 99, "country": "AUS"},
-        {"name": "Rafael Nadal", "tour": "ATP", "rank": 99, "country": "ESP"},
-        {"name": "Roger Federer", "tour": "ATP", "rank": 99, "country": "SUI"},
-        {"name": "Andy Murray", "tour": "ATP", "rank": 99, "country": "GBR"},
-        {"name": "Stan Wawrinka", "tour": "ATP", "rank": 99, "country": "SUI"},
-        {"name": "Denis Shapovalov", "tour": "ATP", "rank": 50, "country": "CAN"},
-        {"name": "Gael Monfils", "tour": "ATP", "rank": 40, "country": "FRA"},
-        {"name": "Matteo Berrettini", "tour": "ATP", "rank": 35, "country": "ITA"},
-        {"name": "Cameron Norrie", "tour": "ATP", "rank": 45, "country": "GBR"},
-        {"name": "Francisco Cerundolo", "tour": "ATP", "rank": 26, "country": "ARG"},
-        
-        # WTA Top 25 + Notable
-        {"name": "Aryna Sabalenka", "tour": "WTA", "rank": 1, "country": "BLR"},
-        {"name": "Iga Swiatek", "tour": "WTA", "rank": 2, "country": "POL"},
-        {"name": "Coco Gauff", "tour": "WTA", "rank": 3, "country": "USA"},
-        {"name": "Jasmine Paolini", "tour": "WTA", "rank": 4, "country": "ITA"},
-        {"name": "Qinwen Zheng", "tour": "WTA", "rank": 5, "country": "CHN"},
-        {"name": "Elena Rybakina", "tour": "WTA", "rank": 6, "country": "KAZ"},
-        {"name": "Jessica Pegula", "tour": "WTA", "rank": 7, "country": "USA"},
-        {"name": "Emma Navarro", "tour": "WTA", "rank": 8, "country": "USA"},
-        {"name": "Daria Kasatkina", "tour": "WTA", "rank": 9, "country": "RUS"},
-        {"name": "Barbora Krejcikova", "tour": "WTA", "rank": 10, "country": "CZE"},
-        {"name": "Danielle Collins", "tour": "WTA", "rank": 11, "country": "USA"},
-        {"name": "Paula Badosa", "tour": "WTA", "rank": 12, "country": "ESP"},
-        {"name": "Anna Kalinskaya", "tour": "WTA", "rank": 13, "country": "RUS"},
-        {"name": "Madison Keys", "tour": "WTA", "rank": 14, "country": "USA"},
-        {"name": "Mirra Andreeva", "tour": "WTA", "rank": 15, "country": "RUS"},
-        {"name": "Marta Kostyuk", "tour": "WTA", "rank": 16, "country": "UKR"},
-        {"name": "Beatriz Haddad Maia", "tour": "WTA", "rank": 17, "country": "BRA"},
-        {"name": "Diana Shnaider", "tour": "WTA", "rank": 18, "country": "RUS"},
-        {"name": "Donna Vekic", "tour": "WTA", "rank": 19, "country": "CRO"},
-        {"name": "Karolina Muchova", "tour": "WTA", "rank": 20, "country": "CZE"},
-        {"name": "Victoria Azarenka", "tour": "WTA", "rank": 21, "country": "BLR"},
-        {"name": "Maria Sakkari", "tour": "WTA", "rank": 22, "country": "GRE"},
-        {"name": "Leylah Fernandez", "tour": "WTA", "rank": 23, "country": "CAN"},
-        {"name": "Liudmila Samsonova", "tour": "WTA", "rank": 24, "country": "RUS"},
-        {"name": "Katie Boulter", "tour": "WTA", "rank": 25, "country": "GBR"},
-        # WTA Notable/Legends
-        {"name": "Serena Williams", "tour": "WTA", "rank": 99, "country": "USA"},
-        {"name": "Venus Williams", "tour": "WTA", "rank": 99, "country": "USA"},
-        {"name": "Naomi Osaka", "tour": "WTA", "rank": 50, "country": "JPN"},
-        {"name": "Emma Raducanu", "tour": "WTA", "rank": 55, "country": "GBR"},
-        {"name": "Caroline Wozniacki", "tour": "WTA", "rank": 99, "country": "DEN"},
-        {"name": "Bianca Andreescu", "tour": "WTA", "rank": 60, "country": "CAN"},
-        {"name": "Sloane Stephens", "tour": "WTA", "rank": 65, "country": "USA"},
-        {"name": "Petra Kvitova", "tour": "WTA", "rank": 70, "country": "CZE"},
-        {"name": "Elina Svitolina", "tour": "WTA", "rank": 30, "country": "UKR"},
-        {"name": "Caroline Garcia", "tour": "WTA", "rank": 35, "country": "FRA"},
-    ]
-    
     verified_players = []
     failed = []
+    reused = 0
     
-    for player in players_to_add:
+    for player in players:
         name = player['name']
         
         # Check if we already have a verified ID
         if name in existing_players and existing_players[name].get('id'):
             existing = existing_players[name]
-            logger.info(f"Using existing ID for {name}: {existing['id']}")
+            reused += 1
             verified_players.append({
                 'id': existing['id'],
                 'name': name,
@@ -197,9 +116,7 @@ def build_rankings():
             })
             continue
         
-        # Search ESPN for player
-        logger.info(f"Searching ESPN for {name}...")
-        result = search_espn_player(name)
+        result = search_results.get(name)
         
         if result and result.get('id'):
             verified_players.append({
@@ -209,24 +126,77 @@ def build_rankings():
                 'rank': player['rank'],
                 'country': player['country']
             })
-            logger.info(f"  Found: ID {result['id']}")
         else:
             failed.append(name)
             logger.warning(f"  NOT FOUND: {name}")
-        
-        # Rate limiting
-        time.sleep(0.3)
+    
+    logger.info(
+        f"{tour}: {len(verified_players)}/{len(players)} players "
+        f"({reused} existing, {len(verified_players) - reused} found, {len(failed)} not found)"
+    )
+    return verified_players, failed
+
+
+def build_rankings():
+    """
+    Build tennis rankings file with verified ESPN IDs.
+    """
+    logger.info("Building tennis rankings...")
+    
+    # Load existing rankings if available
+    existing_players = {}
+    previous = None
+    if os.path.exists(OUTPUT_PATH):
+        try:
+            data = load_json_file(OUTPUT_PATH)
+            previous = data
+            for p in data.get('players', []):
+                existing_players[p['name']] = p
+            logger.info(f"Loaded {len(existing_players)} existing players")
+        except:
+            pass
+    
+    # Current top players (manually curated list in data/source_players.json)
+    source_players, source_hash = load_source_players()
+    players_to_add = source_players['tennis']
+    
+    # Same player list as last time and every player was found: nothing to rebuild
+    if (previous is not None and previous.get('source_hash') == source_hash
+            and previous.get('stats', {}).get('failed') == 0):
+        logger.info("Player list unchanged since the last build; keeping it")
+        return previous
+    
+    verified_players = []
+    failed = []
+    
+    # Look up every player without a stored ID in parallel, keeping list order for the output
+    search_results = resolve_names([
+        p['name'] for p in players_to_add
+        if not (p['name'] in existing_players and existing_players[p['name']].get('id'))
+    ])
+    
+    # ATP and WTA are assembled independently; their lookups above already shared one pool
+    groups = defaultdict(list)
+    for player in players_to_add:
+        groups[player['tour']].append(player)
+    tour_counts = Counter()
+    for tour, group in groups.items():
+        group_verified, group_failed = _build_group(tour, group, existing_players, search_results)
+        verified_players.extend(group_verified)
+        failed.extend(group_failed)
+        tour_counts[tour] += len(group_verified)
     
     # Save results
     output_data = {
         'last_updated': datetime.now().strftime('%Y-%m-%d'),
         'version': '1.0',
         'description': 'Tennis player rankings with verified ESPN IDs',
+        'source_hash': source_hash,
         'players': verified_players,
         'stats': {
             'total': len(verified_players),
-            'atp': len([p for p in verified_players if p['tour'] == 'ATP']),
-            'wta': len([p for p in verified_players if p['tour'] == 'WTA']),
+            'atp': tour_counts['ATP'],
+            'wta': tour_counts['WTA'],
             'failed': len(failed)
         }
     }
@@ -234,10 +204,14 @@ def build_rankings():
     # Ensure data directory exists
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
     
-    with open(OUTPUT_PATH, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    # Keep the old date if nothing else changed so the file is not rewritten
+    if previous is not None and {**previous, 'last_updated': output_data['last_updated']} == output_data:
+        output_data['last_updated'] = previous['last_updated']
     
-    logger.info(f"\nResults saved to {OUTPUT_PATH}")
+    if dump_json_file(output_data, OUTPUT_PATH):
+        logger.info(f"\nResults saved to {OUTPUT_PATH}")
+    else:
+        logger.info(f"\nNo changes; left {OUTPUT_PATH} untouched")
     logger.info(f"Total verified: {len(verified_players)} (ATP: {output_data['stats']['atp']}, WTA: {output_data['stats']['wta']})")
     
     if failed:
@@ -256,25 +230,23 @@ def verify_existing():
         logger.error(f"Rankings file not found: {OUTPUT_PATH}")
         return
     
-    with open(OUTPUT_PATH, 'r') as f:
-        data = json.load(f)
+    data = load_json_file(OUTPUT_PATH)
     
     players = data.get('players', [])
     valid = 0
     invalid = []
     
-    for player in players:
-        pid = player.get('id', '')
-        name = player.get('name', '')
-        
-        if verify_player_id(pid, name):
+    ids = [player.get('id', '') for player in players]
+    names = [player.get('name', '') for player in players]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        checks = list(executor.map(verify_player_id, ids, names))
+    
+    for pid, name, ok in zip(ids, names, checks):
+        if ok:
             valid += 1
-            logger.info(f"✓ {name} (ID: {pid})")
         else:
             invalid.append(name)
             logger.warning(f"✗ {name} (ID: {pid}) - INVALID")
-        
-        time.sleep(0.2)
     
     logger.info(f"\nVerification complete: {valid}/{len(players)} valid")
     if invalid:
@@ -282,6 +254,9 @@ def verify_existing():
 
 
 if __name__ == '__main__':
+    if '--no-cache' in sys.argv:
+        clear_cache()
+    
     if '--verify' in sys.argv:
         verify_existing()
     else:
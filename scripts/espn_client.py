@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Shared ESPN client for the rankings builders (build_golfer_rankings.py and
+build_tennis_rankings.py).
+
+One rate-limited, keep-alive (and, with requests-cache installed, on-disk
+cached) session for every ESPN request, the JSON file helpers, and the
+name -> ESPN ID resolution both builders use. Each builder only supplies
+how to turn a search response into its sport's results.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# orjson is optional - fall back to the stdlib json module if it isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(SCRIPT_DIR, '..', 'data', '.espn_cache')
+SOURCE_PATH = os.path.join(SCRIPT_DIR, '..', 'data', 'source_players.json')
+SEARCH_URL = 'https://site.web.api.espn.com/apis/common/v3/search'
+# (connect, read): fail fast on an unreachable host, allow slow bodies
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by all worker threads.
+
+    Refills at `rate` tokens per second up to `capacity`, so short bursts go
+    out immediately while the sustained rate stays at `rate` requests/s.
+    slow_down() lets the server push the rate down when it starts answering 429.
+    """
+
+    def __init__(self, rate, capacity, min_rate=0.5):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Take the token now, even if it has to be paid back by waiting
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+
+    def slow_down(self):
+        """Halve the sustained rate (down to min_rate) and drop any saved-up burst."""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0)
+
+
+MAX_WORKERS = 8
+RATE_LIMITER = TokenBucket(rate=5, capacity=10)
+
+
+class BackoffRetry(Retry):
+    """Retry policy that also backs the shared token bucket off on every 429."""
+
+    def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+        if response is not None and response.status == 429:
+            RATE_LIMITER.slow_down()
+        return super().increment(method, url, response, error, *args, **kwargs)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for the rate limiter before going to the network.
+
+    Responses served from the on-disk cache never reach the adapter, so they
+    are not throttled.
+    """
+
+    def send(self, request, **kwargs):
+        RATE_LIMITER.wait()
+        return super().send(request, **kwargs)
+
+
+# One keep-alive session for every ESPN lookup (skips a TLS handshake per player)
+if REQUESTS_CACHE_AVAILABLE:
+    # Name -> ID lookups rarely change, so re-runs are served from disk
+    SESSION = requests_cache.CachedSession(
+        cache_name=CACHE_PATH,
+        backend='sqlite',
+        expire_after=timedelta(days=7),
+        allowable_codes=(200,)
+    )
+else:
+    SESSION = requests.Session()
+SESSION.mount('https://', RateLimitedAdapter(
+    pool_connections=1,
+    pool_maxsize=20,
+    # Retry-After is honoured on 429/503; other 5xx back off 0.5 s, 1 s, 2 s, ...
+    max_retries=BackoffRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=['GET']
+    )
+))
+# Keep requests' default Accept-Encoding (gzip, deflate): ESPN compresses the
+# search JSON and requests decodes it transparently
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+
+
+def clear_cache():
+    """Drop the cached ESPN responses (the builders' --no-cache flag)."""
+    if REQUESTS_CACHE_AVAILABLE:
+        SESSION.cache.clear()
+
+
+def load_json_file(path: str):
+    """Read and parse a JSON file in a single read."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json_file(data, path: str) -> bool:
+    """Write data as JSON atomically, skipping the write if the file already matches.
+
+    Returns True if the file was written.
+    """
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2).encode('utf-8')
+
+    # Leave the file (and its mtime) alone when nothing changed
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == encoded:
+                return False
+
+    # Write to a temp file and swap it in so a crash never leaves a truncated file
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(encoded)
+    os.replace(tmp_path, path)
+    return True
+
+
+def parse_response(response):
+    """Decode a JSON response body straight from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def load_source_players() -> tuple:
+    """Read the curated player lists; returns (lists, md5 of the file's bytes)."""
+    with open(SOURCE_PATH, 'rb') as f:
+        raw = f.read()
+    players = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    return players, hashlib.md5(raw).hexdigest()
+
+
+class PlayerSearch:
+    """Name -> ESPN player lookups for one sport.
+
+    results(query, limit) runs the ESPN search and yields that sport's hits
+    as result dicts (with at least 'name'); on_error(query, exception) reports
+    a failed search, which then counts as not found.
+    """
+
+    def __init__(self, results, limit, on_error):
+        self.results = results
+        self.limit = limit
+        self.on_error = on_error
+        # Per-run memo of name searches, stored as hashable tuples; errors
+        # raise out of it and so are never cached
+        self._search_cached = lru_cache(maxsize=1024)(self._search)
+
+    def _search(self, normalized_name):
+        result = next(self.results(normalized_name, self.limit), None)
+        return tuple(result.items()) if result else None
+
+    def search(self, name):
+        """First result for a name, or None."""
+        try:
+            cached = self._search_cached(' '.join(name.split()).casefold())
+            return dict(cached) if cached else None
+        except Exception as e:
+            self.on_error(name, e)
+            return None
+
+    def search_surname(self, surname):
+        """Search once for a shared surname; returns {casefolded name: result}."""
+        try:
+            return {result['name'].casefold(): result for result in self.results(surname, 50)}
+        except Exception as e:
+            self.on_error(surname, e)
+            return {}
+
+    def resolve_names(self, names):
+        """Look up names, using one search per surname shared by several players.
+
+        Names that the surname search does not match exactly fall back to a
+        per-name search. Returns {name: result or None}.
+        """
+        by_surname = defaultdict(list)
+        for name in names:
+            by_surname[name.split()[-1]].append(name)
+        shared = [surname for surname, group in by_surname.items() if len(group) > 1]
+
+        found = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for surname, index in zip(shared, executor.map(self.search_surname, shared)):
+                for name in by_surname[surname]:
+                    if name.casefold() in index:
+                        found[name] = index[name.casefold()]
+
+            remaining = [name for name in names if name not in found]
+            found.update(zip(remaining, executor.map(self.search, remaining)))
+        return found
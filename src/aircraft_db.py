@@ -24,15 +24,21 @@ Integration with FlightLiveManager:
 """
 
 import sqlite3
+import codecs
 import csv
 import os
 import sys
 import time
 import logging
+import queue
+import threading
 import requests
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, Union
 from datetime import datetime
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +49,139 @@ OPENSKY_CSV_URL = "https://opensky-network.org/datasets/metadata/aircraft-databa
 DEFAULT_DB_PATH = os.path.expanduser("~/LEDMatrix/data/aircraft.db")
 DEFAULT_CSV_PATH = os.path.expanduser("~/LEDMatrix/data/aircraft-database.csv")
 
+# Built once so every lookup passes sqlite3 the identical string and hits its
+# prepared-statement cache instead of re-parsing the query. icao24 is stored
+# as a 3-byte BLOB and handed back as the usual lowercase hex string.
+LOOKUP_SQL = """
+    SELECT 
+        lower(hex(icao24)) as icao24,
+        registration,
+        manufacturerName as manufacturer,
+        model,
+        typecode,
+        operator,
+        operatorCallsign as operator_callsign,
+        owner,
+        country,
+        display_type
+    FROM aircraft
+    WHERE icao24 = ?
+"""
+
+# Exact presence bitmap over the whole 24-bit address space (2MB), stored in
+# the meta table at build time. One bit per icao24, big-endian address order.
+PRESENCE_BITMAP_BYTES = (1 << 24) // 8
+
+# (total, with_manufacturer, with_model) in one pass; recorded in the meta
+# table at build time so get_stats() doesn't have to scan
+COUNTS_SQL = """
+    SELECT 
+        COUNT(*),
+        COALESCE(SUM(manufacturerName IS NOT NULL AND manufacturerName != ''), 0),
+        COALESCE(SUM(model IS NOT NULL AND model != ''), 0)
+    FROM aircraft
+"""
+
+# lookup_many() IN-list queries, keyed by base query and placeholder count so
+# each size is built once and stays in sqlite3's statement cache
+_LOOKUP_MANY_SQL: Dict[tuple, str] = {}
+_LOOKUP_MANY_CHUNK = 500  # Stay well under SQLite's bound-variable limit
+
+
+def _lookup_many_sql(lookup_sql: str, count: int) -> str:
+    """Get the IN-list version of `lookup_sql` for `count` icao24 codes."""
+    sql = _LOOKUP_MANY_SQL.get((lookup_sql, count))
+    if sql is None:
+        placeholders = ','.join('?' * count)
+        sql = lookup_sql.replace('WHERE icao24 = ?', f'WHERE icao24 IN ({placeholders})')
+        _LOOKUP_MANY_SQL[(lookup_sql, count)] = sql
+    return sql
+
+
+def _normalize_icao24(icao24: str) -> str:
+    """
+    Lowercase and strip an icao24 code.
+    
+    Feeds from the flight APIs already give clean lowercase 6-character
+    codes; those are returned as-is without building new strings.
+    """
+    if len(icao24) == 6 and icao24.isalnum() and (icao24.islower() or icao24.isdigit()):
+        return icao24
+    return icao24.lower().strip()
+
+
+def _display_type(manufacturer: Optional[str], model: Optional[str], typecode: Optional[str]) -> Optional[str]:
+    """Build the full (untruncated) get_display_string() text from raw columns."""
+    if manufacturer and model:
+        # Full: "Boeing 737-824"
+        return f"{manufacturer} {model}"
+    elif manufacturer and typecode:
+        # Partial: "Boeing B738"
+        return f"{manufacturer} {typecode}"
+    elif model:
+        # Model only: "737-824"
+        return model
+    elif typecode:
+        # Typecode only: "B738"
+        return typecode
+    return None
+
+
+def _cache_key(icao24: str) -> Union[int, str]:
+    """
+    Lookup-cache key for a normalized icao24: the 24-bit address as an int
+    (cheaper to hash and store than the string), or the string itself for
+    anything that isn't 6 hex digits.
+    """
+    if len(icao24) == 6 and icao24.isascii() and icao24.isalnum():
+        try:
+            return int(icao24, 16)
+        except ValueError:
+            pass
+    return icao24
+
+
+def _row_to_result(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert a lookup row to a dict, cleaning up empty strings to None."""
+    result = dict(row)
+    for key in result:
+        if result[key] == '':
+            result[key] = None
+    return result
+
+
+class _ConnPool:
+    """
+    Fixed-size pool of read-only connections to one database.
+    
+    A single sqlite3 connection serializes its queries, so lookups from the
+    display thread and the web API would queue behind each other. LIFO order
+    hands out the most recently used connection, whose page cache and
+    prepared statements are the warmest.
+    """
+    
+    def __init__(self, factory: Callable[[], sqlite3.Connection], size: int):
+        self._queue: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        for _ in range(size):
+            self._queue.put(factory())
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the with-block."""
+        conn = self._queue.get()
+        try:
+            yield conn
+        finally:
+            self._queue.put(conn)
+    
+    def close(self) -> None:
+        """Close every pooled connection (call once no lookups are running)."""
+        while True:
+            try:
+                self._queue.get_nowait().close()
+            except queue.Empty:
+                break
+
 
 class AircraftDatabase:
     """
@@ -52,43 +191,156 @@ class AircraftDatabase:
     information for aircraft based on their Mode S transponder hex code.
     """
     
-    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+    POOL_SIZE = 4  # Read-only connections shared by concurrent lookups
+    
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, in_memory: bool = False):
         """
         Initialize the aircraft database.
         
         Args:
             db_path: Path to SQLite database file
+            in_memory: Copy the whole database into RAM at startup (~50MB) so
+                lookups never touch the SD card; off by default for
+                memory-constrained Pis
         """
         self.db_path = db_path
+        self.in_memory = in_memory
+        self._memory_uri: Optional[str] = None
         self.conn = None
+        self._pool: Optional[_ConnPool] = None
+        self._blob_keys = True  # False for databases built with TEXT icao24
+        self._lookup_sql = LOOKUP_SQL
+        self._ready = False
+        self._counts = None  # (total, with_manufacturer, with_model), computed once
+        self._presence: Optional[bytes] = None  # Presence bitmap, if the build has one
         self._connect()
         
-        # Simple in-memory cache for recently looked up aircraft
-        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        # LRU cache of recent lookups (most recently used at the end)
+        self._cache: "OrderedDict[Union[int, str], Optional[Dict[str, Any]]]" = OrderedDict()
         self._cache_max_size = 500  # Keep last 500 lookups
+        self._cache_lock = threading.Lock()
+        
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open one read-only connection to the database (or its in-memory copy)."""
+        if self._memory_uri:
+            conn = sqlite3.connect(self._memory_uri, uri=True, check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only=1")
+            return conn
+        
+        # The database is only ever replaced wholesale by --setup, so open it
+        # read-only and immutable: SQLite can skip file locking entirely
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=ro&immutable=1'
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA mmap_size=268435456")  # Map up to 256MB instead of read() calls
+        conn.execute("PRAGMA cache_size=-20000")    # ~20MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA query_only=1")
+        return conn
+    
+    def _load_into_memory(self) -> sqlite3.Connection:
+        """
+        Copy the database file into a shared-cache in-memory database.
         
+        Returns the connection that keeps the copy alive (used as self.conn);
+        pool connections opened afterwards attach to the same copy.
+        """
+        memory_uri = f"file:aircraft_db_{id(self)}?mode=memory&cache=shared"
+        memory = sqlite3.connect(memory_uri, uri=True, check_same_thread=False, cached_statements=256)
+        disk = self._open_connection()
+        try:
+            disk.backup(memory)
+        except BaseException:
+            memory.close()
+            raise
+        finally:
+            disk.close()
+        memory.row_factory = sqlite3.Row
+        memory.execute("PRAGMA query_only=1")
+        self._memory_uri = memory_uri
+        return memory
+    
     def _connect(self) -> None:
-        """Establish database connection."""
+        """Open the main connection plus the lookup connection pool."""
         if os.path.exists(self.db_path):
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
+            if self.in_memory:
+                try:
+                    self.conn = self._load_into_memory()
+                    logger.info(f"Aircraft database loaded into memory: {self.db_path}")
+                except (sqlite3.Error, MemoryError) as e:
+                    logger.warning(f"Could not load aircraft database into memory, reading from disk: {e}")
+            if self.conn is None:
+                self.conn = self._open_connection()
+            self._pool = _ConnPool(self._open_connection, self.POOL_SIZE)
+            self._detect_schema()
+            self._ready = self._probe_ready()
+            self._load_presence()
             logger.debug(f"Connected to aircraft database: {self.db_path}")
         else:
             logger.warning(f"Aircraft database not found: {self.db_path}")
             logger.warning("Run 'python3 aircraft_db.py --setup' to download and create database")
             self.conn = None
     
-    def is_ready(self) -> bool:
-        """Check if database is available and populated."""
-        if not self.conn:
-            return False
+    def _detect_schema(self) -> None:
+        """
+        Adapt the lookup query to older database builds: TEXT icao24 keys
+        instead of BLOB, and no precomputed display_type column.
+        """
         try:
-            cursor = self.conn.execute("SELECT COUNT(*) FROM aircraft")
-            count = cursor.fetchone()[0]
-            return count > 0
+            columns = {row['name']: row['type'] for row in self.conn.execute("PRAGMA table_info(aircraft)")}
+        except sqlite3.Error:
+            return
+        self._blob_keys = columns.get('icao24', 'BLOB').upper() == 'BLOB'
+        sql = LOOKUP_SQL
+        if not self._blob_keys:
+            sql = sql.replace('lower(hex(icao24)) as icao24', 'icao24')
+        if columns and 'display_type' not in columns:
+            sql = sql.replace(',\n        display_type', '')
+        self._lookup_sql = sql
+    
+    def _load_presence(self) -> None:
+        """Load the build-time presence bitmap (older databases don't have one)."""
+        try:
+            row = self.conn.execute("SELECT v FROM meta WHERE k = 'presence'").fetchone()
+        except sqlite3.Error:
+            return
+        if row and isinstance(row[0], bytes) and len(row[0]) == PRESENCE_BITMAP_BYTES:
+            self._presence = row[0]
+    
+    def _may_exist(self, key) -> bool:
+        """False only if the presence bitmap proves the key isn't in the table."""
+        if self._presence is None or len(key) != 3:
+            return True
+        n = int.from_bytes(key, 'big')
+        return bool(self._presence[n >> 3] & (1 << (n & 7)))
+    
+    def _db_key(self, icao24: str):
+        """
+        Convert a normalized icao24 to the value stored in the table.
+        
+        Returns None if the code is not valid hex (it can't be in a BLOB-keyed table).
+        """
+        if not self._blob_keys:
+            return icao24
+        try:
+            return bytes.fromhex(icao24)
+        except ValueError:
+            return None
+    
+    def _probe_ready(self) -> bool:
+        """Check once at connect time that the aircraft table has rows."""
+        try:
+            cursor = self.conn.execute("SELECT 1 FROM aircraft LIMIT 1")
+            return cursor.fetchone() is not None
         except sqlite3.Error:
             return False
     
+    def is_ready(self) -> bool:
+        """Check if database is available and populated."""
+        # The file is opened immutable, so the connect-time probe stays valid
+        return self.conn is not None and self._ready
+    
     def lookup(self, icao24: str) -> Optional[Dict[str, Any]]:
         """
         Look up aircraft information by icao24 hex code.
@@ -114,55 +366,88 @@ class AircraftDatabase:
             return None
         
         # Normalize icao24 to lowercase
-        icao24 = icao24.lower().strip()
+        icao24 = _normalize_icao24(icao24)
+        cache_key = _cache_key(icao24)
         
         # Check cache first
-        if icao24 in self._cache:
-            return self._cache[icao24]
+        with self._cache_lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+        
+        key = self._db_key(icao24)
+        if key is None or not self._may_exist(key):
+            return None
         
         try:
-            cursor = self.conn.execute("""
-                SELECT 
-                    icao24,
-                    registration,
-                    manufacturerName as manufacturer,
-                    model,
-                    typecode,
-                    operator,
-                    operatorCallsign as operator_callsign,
-                    owner,
-                    country
-                FROM aircraft
-                WHERE icao24 = ?
-            """, (icao24,))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                result = dict(row)
-                # Clean up empty strings to None
-                for key in result:
-                    if result[key] == '':
-                        result[key] = None
-            else:
-                result = None
-            
-            # Cache the result
-            self._cache[icao24] = result
-            
-            # Prune cache if too large
-            if len(self._cache) > self._cache_max_size:
-                # Remove oldest 100 entries
-                keys_to_remove = list(self._cache.keys())[:100]
-                for key in keys_to_remove:
-                    del self._cache[key]
+            with self._pool.connection() as conn:
+                row = conn.execute(self._lookup_sql, (key,)).fetchone()
+            result = _row_to_result(row) if row else None
             
+            self._cache_put(cache_key, result)
             return result
             
         except sqlite3.Error as e:
             logger.error(f"Database lookup error for {icao24}: {e}")
             return None
     
+    def lookup_many(self, icao24s: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up several aircraft at once.
+        
+        Cache hits are answered from memory; the misses are fetched with one
+        IN (...) query per 500 codes instead of one query each.
+        
+        Args:
+            icao24s: icao24 hex codes (any case / surrounding whitespace)
+            
+        Returns:
+            Dictionary keyed by normalized (lowercase) icao24; the value is
+            the same as lookup() would return, None when not found
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        if not self.conn:
+            return results
+        
+        misses = []
+        with self._cache_lock:
+            for icao24 in icao24s:
+                icao24 = _normalize_icao24(icao24)
+                if icao24 in results:
+                    continue
+                cache_key = _cache_key(icao24)
+                if cache_key in self._cache:
+                    self._cache.move_to_end(cache_key)
+                    results[icao24] = self._cache[cache_key]
+                else:
+                    results[icao24] = None
+                    key = self._db_key(icao24)
+                    if key is not None and self._may_exist(key):
+                        misses.append((icao24, cache_key, key))
+        
+        keys = [key for _, _, key in misses]
+        try:
+            with self._pool.connection() as conn:
+                for start in range(0, len(keys), _LOOKUP_MANY_CHUNK):
+                    chunk = keys[start:start + _LOOKUP_MANY_CHUNK]
+                    sql = _lookup_many_sql(self._lookup_sql, len(chunk))
+                    for row in conn.execute(sql, chunk).fetchall():
+                        results[row['icao24']] = _row_to_result(row)
+        except sqlite3.Error as e:
+            logger.error(f"Database batch lookup error: {e}")
+            return results
+        
+        for icao24, cache_key, _ in misses:
+            self._cache_put(cache_key, results[icao24])
+        return results
+    
+    def _cache_put(self, cache_key: Union[int, str], result: Optional[Dict[str, Any]]) -> None:
+        """Cache a lookup result, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > self._cache_max_size:
+                self._cache.popitem(last=False)
+    
     def get_display_string(self, icao24: str, max_length: int = 20) -> Optional[str]:
         """
         Get a formatted display string for the aircraft.
@@ -179,24 +464,12 @@ class AircraftDatabase:
         if not info:
             return None
         
-        # Build display string in priority order
-        manufacturer = info.get('manufacturer', '')
-        model = info.get('model', '')
-        typecode = info.get('typecode', '')
-        
-        if manufacturer and model:
-            # Full: "Boeing 737-824"
-            display = f"{manufacturer} {model}"
-        elif manufacturer and typecode:
-            # Partial: "Boeing B738"
-            display = f"{manufacturer} {typecode}"
-        elif model:
-            # Model only: "737-824"
-            display = model
-        elif typecode:
-            # Typecode only: "B738"
-            display = typecode
+        # Precomputed at build time; older databases don't have the column
+        if 'display_type' in info:
+            display = info['display_type']
         else:
+            display = _display_type(info.get('manufacturer'), info.get('model'), info.get('typecode'))
+        if not display:
             return None
         
         # Truncate if needed
@@ -221,20 +494,10 @@ class AircraftDatabase:
             return {'status': 'not_connected'}
         
         try:
-            cursor = self.conn.execute("SELECT COUNT(*) FROM aircraft")
-            total = cursor.fetchone()[0]
-            
-            cursor = self.conn.execute("""
-                SELECT COUNT(*) FROM aircraft 
-                WHERE manufacturerName IS NOT NULL AND manufacturerName != ''
-            """)
-            with_manufacturer = cursor.fetchone()[0]
-            
-            cursor = self.conn.execute("""
-                SELECT COUNT(*) FROM aircraft 
-                WHERE model IS NOT NULL AND model != ''
-            """)
-            with_model = cursor.fetchone()[0]
+            # Counts can't change under an immutable database: work them out once
+            if self._counts is None:
+                self._counts = self._read_counts()
+            total, with_manufacturer, with_model = self._counts
             
             # Get file size
             file_size_mb = os.path.getsize(self.db_path) / (1024 * 1024)
@@ -253,8 +516,28 @@ class AircraftDatabase:
         except sqlite3.Error as e:
             return {'status': 'error', 'error': str(e)}
     
+    def _read_counts(self) -> tuple:
+        """
+        Get (total, with_manufacturer, with_model), from the meta table when
+        the build recorded them, otherwise with one scan of the table.
+        """
+        try:
+            meta = dict(self.conn.execute(
+                "SELECT k, v FROM meta WHERE k IN ('total', 'with_manufacturer', 'with_model')"
+            ).fetchall())
+            if len(meta) == 3:
+                return meta['total'], meta['with_manufacturer'], meta['with_model']
+        except sqlite3.Error:
+            pass  # Older build without a meta table
+        
+        cursor = self.conn.execute(COUNTS_SQL)
+        return tuple(cursor.fetchone())
+    
     def close(self):
-        """Close database connection."""
+        """Close database connections."""
+        if self._pool:
+            self._pool.close()
+            self._pool = None
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -286,7 +569,7 @@ def download_csv(url: str = OPENSKY_CSV_URL, output_path: str = DEFAULT_CSV_PATH
         downloaded = 0
         
         with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
                 if chunk:
                     f.write(chunk)
                     downloaded += len(chunk)
@@ -302,40 +585,99 @@ def download_csv(url: str = OPENSKY_CSV_URL, output_path: str = DEFAULT_CSV_PATH
         return False
 
 
-def convert_csv_to_sqlite(csv_path: str = DEFAULT_CSV_PATH, db_path: str = DEFAULT_DB_PATH) -> bool:
+# Columns copied from the OpenSky CSV, in aircraft table order (display_type
+# is derived from them and stored last)
+CSV_COLUMNS = (
+    'icao24', 'registration', 'manufacturerName', 'model', 'typecode',
+    'operator', 'operatorCallsign', 'owner', 'country'
+)
+
+INSERT_SQL = """
+    INSERT OR REPLACE INTO aircraft 
+    (icao24, registration, manufacturerName, model, typecode, 
+     operator, operatorCallsign, owner, country, display_type)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _iter_aircraft_rows(reader: Iterator[list], counts: Dict[str, int]) -> Iterator[tuple]:
     """
-    Convert the OpenSky CSV to SQLite database.
+    Turn raw OpenSky CSV rows into aircraft table tuples.
+    
+    The first row is the header; columns are picked by a fixed index map
+    instead of building a dict per row. icao24 is packed into its 3-byte
+    BLOB form and the get_display_string() text is computed once here.
+    Rows without an icao24 are skipped, malformed rows (short, or a
+    non-hex icao24) are counted in counts['errors'].
+    """
+    header = next(reader, [])
+    positions = {name: i for i, name in enumerate(header)}
+    if all(name in positions for name in CSV_COLUMNS):
+        extract = itemgetter(*(positions[name] for name in CSV_COLUMNS))
+    else:
+        # Older/partial exports: absent columns read as empty
+        def extract(row):
+            return tuple(row[positions[name]] if name in positions else '' for name in CSV_COLUMNS)
+    
+    for row in reader:
+        if not row:
+            continue
+        try:
+            values = extract(row)
+            icao24 = values[0].strip()
+            # Skip rows without icao24
+            if not icao24:
+                continue
+            key = bytes.fromhex(icao24)
+        except (IndexError, ValueError) as e:
+            counts['errors'] += 1
+            if counts['errors'] <= 5:
+                logger.warning(f"Error processing row: {e}")
+            continue
+        
+        counts['rows'] += 1
+        if counts['rows'] % 10000 == 0:
+            print(f"\r  Processed: {counts['rows']:,} aircraft", end='')
+        fields = tuple(value.strip() for value in values[1:])
+        # fields: registration, manufacturerName, model, typecode, ...
+        yield (key,) + fields + (_display_type(fields[1], fields[2], fields[3]) or '',)
+
+
+def _load_csv_into_sqlite(lines: Iterable[str], db_path: str) -> bool:
+    """
+    Build the aircraft database at db_path from OpenSky CSV text lines.
     
     Args:
-        csv_path: Path to downloaded CSV
+        lines: CSV text, e.g. an open file or a decoded HTTP stream
         db_path: Path for output SQLite database
         
     Returns:
         True if successful, False otherwise
     """
-    print(f"\nConverting CSV to SQLite database...")
-    print(f"Input:  {csv_path}")
-    print(f"Output: {db_path}")
-    
-    if not os.path.exists(csv_path):
-        print(f"✗ CSV file not found: {csv_path}")
-        return False
-    
     # Ensure output directory exists
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
-    # Remove existing database
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    # Build next to the target and swap it in at the end, so a failed run
+    # leaves the previous database untouched
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
     
     try:
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(tmp_path)
         cursor = conn.cursor()
         
-        # Create table with only the columns we need
+        # Throwaway bulk-load settings: the temp file is discarded on failure
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        
+        # Create table with only the columns we need. WITHOUT ROWID stores the
+        # rows in the primary key B-tree itself, so a lookup is one traversal,
+        # and the 3-byte BLOB key keeps that tree small.
         cursor.execute("""
             CREATE TABLE aircraft (
-                icao24 TEXT PRIMARY KEY,
+                icao24 BLOB PRIMARY KEY,
                 registration TEXT,
                 manufacturerName TEXT,
                 model TEXT,
@@ -343,74 +685,48 @@ def convert_csv_to_sqlite(csv_path: str = DEFAULT_CSV_PATH, db_path: str = DEFAU
                 operator TEXT,
                 operatorCallsign TEXT,
                 owner TEXT,
-                country TEXT
-            )
+                country TEXT,
+                display_type TEXT
+            ) WITHOUT ROWID
         """)
         
-        # Create index on icao24 for fast lookups
-        cursor.execute("CREATE INDEX idx_icao24 ON aircraft(icao24)")
-        
-        # Read CSV and insert rows
-        row_count = 0
-        error_count = 0
-        
-        with open(csv_path, 'r', encoding='utf-8', errors='replace') as f:
-            # The CSV uses single quotes around values, need custom handling
-            reader = csv.DictReader(f, quotechar="'")
-            
-            batch = []
-            batch_size = 10000
-            
-            for row in reader:
-                try:
-                    # Extract only columns we need
-                    aircraft = (
-                        row.get('icao24', '').lower().strip(),
-                        row.get('registration', '').strip(),
-                        row.get('manufacturerName', '').strip(),
-                        row.get('model', '').strip(),
-                        row.get('typecode', '').strip(),
-                        row.get('operator', '').strip(),
-                        row.get('operatorCallsign', '').strip(),
-                        row.get('owner', '').strip(),
-                        row.get('country', '').strip()
-                    )
-                    
-                    # Skip rows without icao24
-                    if aircraft[0]:
-                        batch.append(aircraft)
-                        row_count += 1
-                    
-                    # Insert in batches for performance
-                    if len(batch) >= batch_size:
-                        cursor.executemany("""
-                            INSERT OR REPLACE INTO aircraft 
-                            (icao24, registration, manufacturerName, model, typecode, 
-                             operator, operatorCallsign, owner, country)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, batch)
-                        conn.commit()
-                        print(f"\r  Processed: {row_count:,} aircraft", end='')
-                        batch = []
-                        
-                except Exception as e:
-                    error_count += 1
-                    if error_count <= 5:
-                        logger.warning(f"Error processing row: {e}")
-            
-            # Insert remaining batch
-            if batch:
-                cursor.executemany("""
-                    INSERT OR REPLACE INTO aircraft 
-                    (icao24, registration, manufacturerName, model, typecode, 
-                     operator, operatorCallsign, owner, country)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, batch)
-                conn.commit()
+        # No separate icao24 index: the PRIMARY KEY already provides one, and a
+        # second B-tree would only slow down the bulk insert below
+        
+        # Read CSV and insert rows: one generator feeding one executemany, all
+        # inside a single transaction
+        counts = {'rows': 0, 'errors': 0}
+        
+        # The CSV uses single quotes around values, need custom handling
+        reader = csv.reader(lines, quotechar="'")
+        cursor.executemany(INSERT_SQL, _iter_aircraft_rows(reader, counts))
+        conn.commit()
+        row_count = counts['rows']
+        error_count = counts['errors']
+        
+        # Presence bitmap: lookups for codes that aren't in the table (military,
+        # new registrations) are answered without touching SQLite
+        presence = bytearray(PRESENCE_BITMAP_BYTES)
+        for (key,) in cursor.execute("SELECT icao24 FROM aircraft"):
+            if len(key) == 3:
+                n = int.from_bytes(key, 'big')
+                presence[n >> 3] |= 1 << (n & 7)
+        cursor.execute("CREATE TABLE meta (k TEXT PRIMARY KEY, v)")
+        cursor.execute("INSERT INTO meta VALUES ('presence', ?)", (bytes(presence),))
+        
+        # Row counts for get_stats()
+        total, with_manufacturer, with_model = cursor.execute(COUNTS_SQL).fetchone()
+        cursor.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('total', total),
+            ('with_manufacturer', with_manufacturer),
+            ('with_model', with_model),
+        ])
+        conn.commit()
         
         # Optimize database
         cursor.execute("VACUUM")
         conn.close()
+        os.replace(tmp_path, db_path)
         
         # Report results
         db_size = os.path.getsize(db_path) / (1024 * 1024)
@@ -425,6 +741,98 @@ def convert_csv_to_sqlite(csv_path: str = DEFAULT_CSV_PATH, db_path: str = DEFAU
         print(f"\n✗ Conversion failed: {e}")
         import traceback
         traceback.print_exc()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def convert_csv_to_sqlite(csv_path: str = DEFAULT_CSV_PATH, db_path: str = DEFAULT_DB_PATH) -> bool:
+    """
+    Convert the OpenSky CSV to SQLite database.
+    
+    Args:
+        csv_path: Path to downloaded CSV
+        db_path: Path for output SQLite database
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    print(f"\nConverting CSV to SQLite database...")
+    print(f"Input:  {csv_path}")
+    print(f"Output: {db_path}")
+    
+    if not os.path.exists(csv_path):
+        print(f"✗ CSV file not found: {csv_path}")
+        return False
+    
+    with open(csv_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        return _load_csv_into_sqlite(f, db_path)
+
+
+def _iter_text_lines(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Decode a byte stream into text lines, keeping the line endings.
+    
+    Only '\n' ends a line (csv handles '\r\n' itself), so characters that
+    str.splitlines() would also break on stay inside their field.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def _tee_lines(lines: Iterable[str], copy) -> Iterator[str]:
+    """Pass lines through unchanged while writing each one to `copy`."""
+    for line in lines:
+        copy.write(line)
+        yield line
+
+
+def stream_csv_to_sqlite(url: str = OPENSKY_CSV_URL, db_path: str = DEFAULT_DB_PATH,
+                         csv_copy_path: Optional[str] = None) -> bool:
+    """
+    Download the OpenSky CSV and build the SQLite database in one pass.
+    
+    The response is parsed as it arrives instead of being written to disk
+    and read back, halving SD card I/O during setup.
+    
+    Args:
+        url: URL to download from
+        db_path: Path for output SQLite database
+        csv_copy_path: If set, also save the raw CSV here (for --keep-csv)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    print(f"Downloading aircraft database from OpenSky Network...")
+    print(f"URL: {url}")
+    print(f"Output: {db_path}")
+    print(f"This may take a few minutes (~100MB file)...")
+    
+    try:
+        with requests.get(url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            lines = _iter_text_lines(response.iter_content(chunk_size=65536))
+            
+            if not csv_copy_path:
+                return _load_csv_into_sqlite(lines, db_path)
+            
+            os.makedirs(os.path.dirname(csv_copy_path), exist_ok=True)
+            with open(csv_copy_path, 'w', encoding='utf-8', newline='') as copy:
+                success = _load_csv_into_sqlite(_tee_lines(lines, copy), db_path)
+            if success:
+                print(f"✓ CSV saved: {csv_copy_path}")
+            return success
+        
+    except requests.RequestException as e:
+        print(f"\n✗ Download failed: {e}")
         return False
 
 
@@ -433,7 +841,7 @@ def setup_database(keep_csv: bool = False) -> bool:
     Complete setup: download CSV and convert to SQLite.
     
     Args:
-        keep_csv: If True, keep the CSV file after conversion
+        keep_csv: If True, also save a copy of the CSV
         
     Returns:
         True if successful
@@ -443,20 +851,12 @@ def setup_database(keep_csv: bool = False) -> bool:
     print("=" * 60)
     print()
     
-    # Step 1: Download CSV
-    if not download_csv():
-        return False
-    
-    # Step 2: Convert to SQLite
-    if not convert_csv_to_sqlite():
+    # Steps 1-2: Download the CSV straight into SQLite, only writing the
+    # CSV to disk when it should be kept
+    if not stream_csv_to_sqlite(csv_copy_path=DEFAULT_CSV_PATH if keep_csv else None):
         return False
     
-    # Step 3: Optionally remove CSV to save space
-    if not keep_csv and os.path.exists(DEFAULT_CSV_PATH):
-        os.remove(DEFAULT_CSV_PATH)
-        print(f"\n✓ Removed CSV file to save space")
-    
-    # Step 4: Test the database
+    # Step 3: Test the database
     print("\n" + "=" * 60)
     print("Testing Database")
     print("=" * 60)
@@ -469,6 +869,12 @@ def setup_database(keep_csv: bool = False) -> bool:
         print(f"  With manufacturer: {stats['coverage_manufacturer']}")
         print(f"  With model: {stats['coverage_model']}")
         
+        # The WITHOUT ROWID table is its own covering index: expect a single
+        # "SEARCH aircraft USING PRIMARY KEY (icao24=?)" step
+        plan = db.conn.execute("EXPLAIN QUERY PLAN " + db._lookup_sql, (db._db_key('000000'),)).fetchall()
+        for step in plan:
+            print(f"  Lookup plan: {step['detail']}")
+        
         # Test a lookup
         test_codes = ['a0a0a0', 'a12345', '4ca000']
         print(f"\nSample lookups:")
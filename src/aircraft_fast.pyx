@@ -0,0 +1,48 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled per-aircraft geometry for src/aircraft_lookup.py.
+
+calculate_bearing() and calculate_distance_km() run once per aircraft per
+radar refresh on the Pi; these are the same formulas with C doubles and
+libm, so each call skips the interpreter's float boxing and math-module
+dispatch. aircraft_lookup.py uses them when this module has been built
+(python3 scripts/build_aircraft_fast.py) and its pure Python versions
+otherwise.
+"""
+
+from libc.math cimport asin, atan2, cos, sin, sqrt
+
+cdef double SECTORS_PER_RADIAN = 1.2732395447351628  # 4 / pi: 8 compass sectors per turn
+cdef double DEG_TO_RAD = 0.017453292519943295
+cdef double KM_PER_DEGREE = 111.0
+cdef double EARTH_RADIUS_KM = 6371.0
+
+
+cpdef int bearing_index(double home_lat, double home_lon, double target_lat,
+                        double target_lon, double cos_home) noexcept nogil:
+    """Index into aircraft_lookup._DIRECTIONS (N, NE, ... NW) from home to target."""
+    cdef double dx = (target_lon - home_lon) * cos_home
+    cdef double dy = target_lat - home_lat
+    # Same sector arithmetic as calculate_bearing(): atan2 is in (-4, 4]
+    # sectors, +8.5 makes it positive and centers each sector
+    return <int>(atan2(dx, dy) * SECTORS_PER_RADIAN + 8.5) & 7
+
+
+cpdef double flat_distance_km(double home_lat, double home_lon, double target_lat,
+                              double target_lon, double cos_home) noexcept nogil:
+    """Euclidean (flat-earth) distance in km, as calculate_distance_km()."""
+    cdef double dx = (target_lon - home_lon) * KM_PER_DEGREE * cos_home
+    cdef double dy = (target_lat - home_lat) * KM_PER_DEGREE
+    return sqrt(dx * dx + dy * dy)
+
+
+cpdef double haversine_km(double lat1, double lon1, double lat2, double lon2) noexcept nogil:
+    """Great-circle distance in km, as aircraft_lookup._haversine_km()."""
+    cdef double phi1 = lat1 * DEG_TO_RAD
+    cdef double phi2 = lat2 * DEG_TO_RAD
+    cdef double s_dphi = sin((phi2 - phi1) / 2)
+    cdef double s_dlambda = sin((lon2 - lon1) * DEG_TO_RAD / 2)
+    cdef double a = s_dphi * s_dphi + cos(phi1) * cos(phi2) * s_dlambda * s_dlambda
+    if a > 1.0:
+        a = 1.0
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
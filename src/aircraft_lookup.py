@@ -20,8 +20,42 @@ import time
 import math
 import json
 import os
+import re
 import logging
-from typing import Dict, Optional
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+from requests.adapters import HTTPAdapter
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit: the function runs as plain Python."""
+        return lambda func: func
+
+# Compiled bearing/distance helpers, built by scripts/build_aircraft_fast.py
+try:
+    from src.aircraft_fast import (
+        bearing_index as _fast_bearing_index,
+        flat_distance_km as _fast_flat_distance_km,
+        haversine_km as _fast_haversine_km,
+    )
+    FAST_EXT_AVAILABLE = True
+except ImportError:
+    FAST_EXT_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +68,35 @@ _aircraft_db_initialized = False
 _faa_db = None
 _faa_db_initialized = False
 
-# Fallback cache for hexdb.io lookups
-_fallback_cache = {}
-_fallback_cache_loaded = False
-_fallback_cache_path = "/home/ledpi/LEDMatrix/data/aircraft_fallback_cache.json"
+# The same instances once they've reported is_ready(), so the hot paths skip
+# the getter call and readiness check (neither database goes un-ready again)
+_cached_aircraft_db = None
+_cached_faa_db = None
+
+# Fallback cache for hexdb.io lookups (LRU order, most recently used at the end),
+# in front of a small SQLite file holding one row per aircraft
+_fallback_cache = OrderedDict()
+_fallback_cache_max_size = 5000
+_fallback_cache_path = "/home/ledpi/LEDMatrix/data/aircraft_fallback_cache.db"
+_legacy_fallback_cache_path = "/home/ledpi/LEDMatrix/data/aircraft_fallback_cache.json"
+_fallback_db = None
+_fallback_db_lock = threading.Lock()
 _last_fallback_request = 0
 _fallback_rate_limit = 1.0  # Minimum seconds between API calls
 
+# Memoized lookup_aircraft_info() results (found aircraft only; LRU order)
+_info_cache = OrderedDict()
+_info_cache_max_size = 4096
+_info_cache_lock = threading.Lock()
+
+# Shared hexdb.io session so consecutive misses reuse one keep-alive connection
+# instead of a new TCP + TLS handshake each
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_session.headers.update({
+    'User-Agent': 'LEDMatrix/1.0 (https://github.com/yourusername/LEDMatrix; contact@example.com)'
+})
+
 
 def _get_aircraft_db():
     """
@@ -110,33 +166,133 @@ def _get_faa_db():
     return None
 
 
-def _load_fallback_cache() -> None:
-    """Load the hexdb.io fallback cache from disk."""
-    global _fallback_cache, _fallback_cache_loaded
+def _ready_aircraft_db():
+    """_get_aircraft_db(), or None until that instance is_ready()."""
+    global _cached_aircraft_db
     
-    if _fallback_cache_loaded:
-        return
+    if _cached_aircraft_db is None:
+        db = _get_aircraft_db()
+        if db and db.is_ready():
+            _cached_aircraft_db = db
+    return _cached_aircraft_db
+
+
+def _ready_faa_db():
+    """_get_faa_db(), or None until that instance is_ready()."""
+    global _cached_faa_db
     
-    _fallback_cache_loaded = True
+    if _cached_faa_db is None:
+        db = _get_faa_db()
+        if db and db.is_ready():
+            _cached_faa_db = db
+    return _cached_faa_db
+
+
+def _get_fallback_db():
+    """
+    Open (creating if needed) the SQLite file behind the fallback cache.
+    Call with _fallback_db_lock held. Returns None if it can't be opened.
+    """
+    global _fallback_db
+    
+    if _fallback_db is not None:
+        return _fallback_db
     
     try:
-        if os.path.exists(_fallback_cache_path):
-            with open(_fallback_cache_path, 'r') as f:
-                _fallback_cache = json.load(f)
-            logger.debug(f"Loaded {len(_fallback_cache)} entries from fallback cache")
-    except Exception as e:
-        logger.debug(f"Fallback cache not available: {e}")
-        _fallback_cache = {}
+        os.makedirs(os.path.dirname(_fallback_cache_path), exist_ok=True)
+        conn = sqlite3.connect(_fallback_cache_path, check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS fallback (icao24 TEXT PRIMARY KEY, payload TEXT)")
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.debug(f"Fallback cache database not available: {e}")
+        return None
+    
+    _fallback_db = conn
+    _import_legacy_fallback_cache(conn)
+    return conn
 
 
-def _save_fallback_cache() -> None:
-    """Save the hexdb.io fallback cache to disk."""
+def _import_legacy_fallback_cache(conn) -> None:
+    """One-time import of the old JSON fallback cache into an empty database."""
+    if not os.path.exists(_legacy_fallback_cache_path):
+        return
+    
     try:
-        os.makedirs(os.path.dirname(_fallback_cache_path), exist_ok=True)
-        with open(_fallback_cache_path, 'w') as f:
-            json.dump(_fallback_cache, f)
+        if conn.execute("SELECT 1 FROM fallback LIMIT 1").fetchone():
+            return
+        with open(_legacy_fallback_cache_path, 'r') as f:
+            legacy = json.load(f)
+        conn.executemany(
+            "INSERT OR REPLACE INTO fallback VALUES (?, ?)",
+            ((icao24, json.dumps(result) if result else None) for icao24, result in legacy.items())
+        )
+        conn.commit()
+        logger.info(f"Imported {len(legacy)} entries from legacy fallback cache")
     except Exception as e:
-        logger.debug(f"Failed to save fallback cache: {e}")
+        logger.debug(f"Failed to import legacy fallback cache: {e}")
+
+
+def _remember_fallback_result(icao24: str, result: Optional[Dict]) -> None:
+    """Put a result in the in-memory LRU, evicting the least recently used entry."""
+    _fallback_cache[icao24] = result
+    if len(_fallback_cache) > _fallback_cache_max_size:
+        _fallback_cache.popitem(last=False)
+
+
+def _read_fallback_result(icao24: str):
+    """
+    Read one stored hexdb.io result from disk.
+    
+    Returns (found, result); result is None for a cached "not found".
+    """
+    with _fallback_db_lock:
+        conn = _get_fallback_db()
+        if conn is None:
+            return False, None
+        try:
+            row = conn.execute("SELECT payload FROM fallback WHERE icao24 = ?", (icao24,)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Fallback cache read failed for {icao24}: {e}")
+            return False, None
+    
+    if row is None:
+        return False, None
+    return True, json.loads(row[0]) if row[0] else None
+
+
+def _cache_fallback_result(icao24: str, result: Optional[Dict]) -> None:
+    """Store a hexdb.io result (None = not found) in memory and on disk."""
+    _remember_fallback_result(icao24, result)
+    
+    # Persist just this row instead of rewriting the whole cache
+    with _fallback_db_lock:
+        conn = _get_fallback_db()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO fallback VALUES (?, ?)",
+                (icao24, json.dumps(result) if result else None)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to save fallback cache entry: {e}")
+
+
+# Substring -> display name, checked in order (first match wins)
+_MFR_MAP = (
+    ('BOEING', 'Boeing'),
+    ('AIRBUS', 'Airbus'),
+    ('CESSNA', 'Cessna'),
+    ('PIPER', 'Piper'),
+    ('EMBRAER', 'Embraer'),
+    ('BOMBARDIER', 'Bombardier'),
+    ('GULFSTREAM', 'Gulfstream'),
+    ('BEECH', 'Beechcraft'),  # Also matches BEECHCRAFT
+    ('CIRRUS', 'Cirrus'),
+    ('MOONEY', 'Mooney'),
+    ('DIAMOND', 'Diamond'),
+)
 
 
 def _shorten_manufacturer(manufacturer: str) -> str:
@@ -145,31 +301,10 @@ def _shorten_manufacturer(manufacturer: str) -> str:
         return ''
     
     upper = manufacturer.upper()
-    
-    if 'BOEING' in upper:
-        return 'Boeing'
-    elif 'AIRBUS' in upper:
-        return 'Airbus'
-    elif 'CESSNA' in upper:
-        return 'Cessna'
-    elif 'PIPER' in upper:
-        return 'Piper'
-    elif 'EMBRAER' in upper:
-        return 'Embraer'
-    elif 'BOMBARDIER' in upper:
-        return 'Bombardier'
-    elif 'GULFSTREAM' in upper:
-        return 'Gulfstream'
-    elif 'BEECHCRAFT' in upper or 'BEECH' in upper:
-        return 'Beechcraft'
-    elif 'CIRRUS' in upper:
-        return 'Cirrus'
-    elif 'MOONEY' in upper:
-        return 'Mooney'
-    elif 'DIAMOND' in upper:
-        return 'Diamond'
-    else:
-        return manufacturer.title()[:12]
+    for substring, name in _MFR_MAP:
+        if substring in upper:
+            return name
+    return manufacturer.title()[:12]
 
 
 def _fallback_lookup(icao24: str) -> Dict:
@@ -184,18 +319,21 @@ def _fallback_lookup(icao24: str) -> Dict:
         Dict with display_type, typecode, registration, operator, source
         Empty dict if not found
     """
-    global _last_fallback_request, _fallback_cache
+    global _last_fallback_request
     
-    # Ensure cache is loaded
-    _load_fallback_cache()
-    
-    # Check cache first
+    # Check the in-memory cache first, then the on-disk one
     if icao24 in _fallback_cache:
+        _fallback_cache.move_to_end(icao24)
         cached = _fallback_cache[icao24]
         if cached:
             return cached
         return {}
     
+    found, cached = _read_fallback_result(icao24)
+    if found:
+        _remember_fallback_result(icao24, cached)
+        return cached or {}
+    
     # Rate limit - be nice to free API
     current_time = time.time()
     if current_time - _last_fallback_request < _fallback_rate_limit:
@@ -204,15 +342,14 @@ def _fallback_lookup(icao24: str) -> Dict:
     try:
         _last_fallback_request = current_time
         url = f"https://hexdb.io/api/v1/aircraft/{icao24}"
-        response = requests.get(url, timeout=5)
+        response = _session.get(url, timeout=5)
         
         if response.status_code == 200:
             data = response.json()
             
             # Check for "not found" response
             if data.get('status') == '404' or data.get('error'):
-                _fallback_cache[icao24] = None
-                _save_fallback_cache()
+                _cache_fallback_result(icao24, None)
                 return {}
             
             # Build result
@@ -235,15 +372,13 @@ def _fallback_lookup(icao24: str) -> Dict:
             result['source'] = 'hexdb.io'
             
             # Cache the result
-            _fallback_cache[icao24] = result
-            _save_fallback_cache()
+            _cache_fallback_result(icao24, result)
             
             logger.debug(f"Fallback lookup success: {icao24} -> {result.get('display_type', 'unknown')}")
             return result
             
         elif response.status_code == 404:
-            _fallback_cache[icao24] = None
-            _save_fallback_cache()
+            _cache_fallback_result(icao24, None)
             return {}
         else:
             return {}
@@ -261,6 +396,10 @@ def lookup_aircraft_info(icao24: str) -> Dict:
     """
     Look up aircraft make/model from database, with hexdb.io fallback.
     
+    Found aircraft are memoized, so the same icao24 on every radar refresh
+    is a dict lookup. Empty results aren't: the hexdb.io fallback may have
+    been skipped by its rate limit and should be retried.
+    
     Args:
         icao24: ICAO 24-bit aircraft address (hex string, e.g., 'a12345')
     
@@ -273,11 +412,29 @@ def lookup_aircraft_info(icao24: str) -> Dict:
         - source: Data source ('local' or 'hexdb.io')
         
         Empty dict if aircraft not found in any database.
+        The dict is the caller's own copy.
     """
+    with _info_cache_lock:
+        cached = _info_cache.get(icao24)
+        if cached is not None:
+            _info_cache.move_to_end(icao24)
+            return dict(cached)
+    
+    result = _lookup_aircraft_info_uncached(icao24)
+    if result:
+        with _info_cache_lock:
+            _info_cache[icao24] = dict(result)
+            if len(_info_cache) > _info_cache_max_size:
+                _info_cache.popitem(last=False)
+    return result
+
+
+def _lookup_aircraft_info_uncached(icao24: str) -> Dict:
+    """Do the database / hexdb.io lookup behind lookup_aircraft_info()."""
     info = None
     
     # Try local database first
-    aircraft_db = _get_aircraft_db()
+    aircraft_db = _ready_aircraft_db()
     if aircraft_db:
         info = aircraft_db.lookup(icao24)
     
@@ -285,7 +442,11 @@ def lookup_aircraft_info(icao24: str) -> Dict:
     if not info:
         return _fallback_lookup(icao24)
     
-    # Build result from local database
+    return _local_result(info)
+
+
+def _local_result(info: Dict) -> Dict:
+    """Build a lookup_aircraft_info() result from a local database row."""
     result = {}
     manufacturer = info.get('manufacturer', '')
     model = info.get('model', '')
@@ -307,6 +468,101 @@ def lookup_aircraft_info(icao24: str) -> Dict:
     return result
 
 
+# Columns returned by lookup_aircraft_info_bulk(), one list each
+INFO_FIELDS = ('display_type', 'typecode', 'registration', 'operator', 'source')
+
+
+def lookup_aircraft_info_bulk(icao24s: Sequence[str]) -> Dict[str, List]:
+    """
+    lookup_aircraft_info() for a whole radar sweep at once.
+    
+    Aircraft not already memoized are fetched from the local database with
+    one batched query (AircraftDatabase.lookup_many) instead of one query
+    each; only those still missing go to the hexdb.io fallback.
+    
+    Args:
+        icao24s: ICAO 24-bit aircraft addresses
+    
+    Returns:
+        Dict mapping each of INFO_FIELDS to a list with one value per
+        aircraft, in the same order as icao24s (None where unknown)
+    """
+    infos = [None] * len(icao24s)
+    misses = {}
+    with _info_cache_lock:
+        for i, icao24 in enumerate(icao24s):
+            cached = _info_cache.get(icao24)
+            if cached is not None:
+                _info_cache.move_to_end(icao24)
+                infos[i] = cached
+            else:
+                misses.setdefault(icao24, []).append(i)
+    
+    if misses:
+        found = {}
+        aircraft_db = _ready_aircraft_db()
+        if aircraft_db:
+            found = aircraft_db.lookup_many(misses)
+        
+        for icao24, positions in misses.items():
+            info = found.get(icao24.lower().strip())
+            result = _local_result(info) if info else _fallback_lookup(icao24)
+            if result:
+                with _info_cache_lock:
+                    _info_cache[icao24] = dict(result)
+                    if len(_info_cache) > _info_cache_max_size:
+                        _info_cache.popitem(last=False)
+                for i in positions:
+                    infos[i] = result
+    
+    empty = {}
+    return {field: [(info or empty).get(field) for info in infos] for field in INFO_FIELDS}
+
+
+# ============================================
+# Callsign classification tables
+# ============================================
+
+# Military callsign prefixes (FAA DB doesn't track military)
+_MILITARY_PREFIXES = frozenset([
+    'REACH', 'TETON', 'EVAC', 'RESCUE', 'ARMY', 'NAVY',
+    'GUARD', 'DUKE', 'HAWK', 'VIPER', 'RCH', 'CNV', 'PAT',
+    'IRON', 'STEEL', 'BLADE', 'SABER', 'TOPCAT', 'BOXER',
+    'KARMA', 'RAID', 'SKULL', 'BONE', 'DEATH', 'DUSTOFF',
+])
+
+# Helicopter words, matched anywhere in the callsign with one regex search
+_HELI_PATTERNS = ('LIFE', 'MEDEVAC', 'HELI', 'COPTER', 'AIR1', 'MERCY', 'DUSTOFF')
+_HELI_PATTERN = re.compile('|'.join(map(re.escape, _HELI_PATTERNS)))
+
+# Civil callsign prefix -> type, in priority order (cargo BEFORE passenger airlines!)
+_CIVIL_PREFIX_TYPES = {}
+for _type, _prefixes in (
+    ('UPS', ['UPS']),
+    ('FDX', ['FDX', 'FXE']),                  # FedEx and FedEx Feeder
+    ('AMAZON', ['GTI', 'ATN', 'ABX']),        # Atlas/Amazon partners
+    ('DHL', ['DHL', 'BCS', 'DAE']),           # DHL and partners
+    # Other cargo carriers -> generic cargo icon
+    ('CARGO', ['KFS', 'CLX', 'MPH', 'PAC', 'SQC', 'BOX', 'GEC',
+               'ICL', 'NCR', 'AHK', 'CAL', 'CKS', 'NCA', 'POL']),
+    # Commercial passenger airlines (known ICAO prefixes)
+    ('JET', ['AAL', 'UAL', 'DAL', 'SWA', 'JBU', 'ASA', 'FFT', 'NKS',
+             'SKW', 'ENY', 'RPA', 'EDV', 'EJA', 'LXJ', 'XOJ', 'TVS',
+             'XAJ', 'LEA', 'WWI', 'VIR', 'BAW', 'AFR', 'DLH', 'KLM']),
+):
+    for _prefix in _prefixes:
+        _CIVIL_PREFIX_TYPES.setdefault(_prefix, _type)
+del _type, _prefixes, _prefix
+
+# Distinct prefix lengths, so a lookup slices the callsign once per length
+# instead of calling startswith() once per prefix
+_MILITARY_PREFIX_LENGTHS = tuple(sorted({len(p) for p in _MILITARY_PREFIXES}))
+
+# First three letters of every military prefix (none is shorter): most live
+# callsigns are airline flights, which this one lookup rules out as military
+_MILITARY_HEADS = frozenset(p[:3] for p in _MILITARY_PREFIXES)
+
+
 def infer_aircraft_type(callsign: str, altitude_ft: Optional[int] = None, 
                         speed_knots: Optional[int] = None, icao24: Optional[str] = None) -> str:
     """
@@ -335,19 +591,41 @@ def infer_aircraft_type(callsign: str, altitude_ft: Optional[int] = None,
     """
     callsign = (callsign or '').upper().strip()
     
-    # === STEP 1: Check military patterns first (FAA DB doesn't track military) ===
-    military_patterns = ['REACH', 'TETON', 'EVAC', 'RESCUE', 'ARMY', 'NAVY', 
-                        'GUARD', 'DUKE', 'HAWK', 'VIPER', 'RCH', 'CNV', 'PAT',
-                        'IRON', 'STEEL', 'BLADE', 'SABER', 'TOPCAT', 'BOXER',
-                        'KARMA', 'RAID', 'SKULL', 'BONE', 'DEATH', 'DUSTOFF']
+    # The heuristics only compare altitude/speed against fixed thresholds, so
+    # collapse them to one representative value per band; the memoized result
+    # is then exact while repeat sightings of an aircraft still hit the cache
+    if altitude_ft:
+        altitude_ft = 1 if altitude_ft < 5000 else (25001 if altitude_ft > 25000 else 5000)
+    else:
+        altitude_ft = None
+    if speed_knots:
+        speed_knots = 1 if speed_knots < 180 else 180
+    else:
+        speed_knots = None
     
-    heli_patterns = ['LIFE', 'MEDEVAC', 'HELI', 'COPTER', 'AIR1', 'MERCY', 'DUSTOFF']
+    # The FAA database can become ready mid-session (first download), so its
+    # readiness is part of the key: heuristic answers memoized before then
+    # are not reused once it can answer
+    return _infer_aircraft_type_cached(callsign, altitude_ft, speed_knots, icao24,
+                                       _ready_faa_db() is not None)
+
+
+@lru_cache(maxsize=4096)
+def _infer_aircraft_type_cached(callsign: str, altitude_ft: Optional[int],
+                                speed_knots: Optional[int], icao24: Optional[str],
+                                faa_ready: bool) -> str:
+    """
+    infer_aircraft_type() body, for a normalized callsign and banded
+    altitude/speed; faa_ready says whether _ready_faa_db() had a database.
+    """
+    head3 = callsign[:3]
     
-    is_military = any(callsign.startswith(p) for p in military_patterns)
-    is_helo_callsign = any(p in callsign for p in heli_patterns)
+    # === STEP 1: Check military patterns first (FAA DB doesn't track military) ===
+    is_military = (head3 in _MILITARY_HEADS and
+                   any(callsign[:n] in _MILITARY_PREFIXES for n in _MILITARY_PREFIX_LENGTHS))
     
     if is_military:
-        if is_helo_callsign:
+        if _HELI_PATTERN.search(callsign):
             return 'MIL_HELO'
         # Low and slow military = likely helicopter (keep this heuristic for military)
         if altitude_ft and speed_knots and altitude_ft < 5000 and speed_knots < 180:
@@ -355,8 +633,8 @@ def infer_aircraft_type(callsign: str, altitude_ft: Optional[int] = None,
         return 'MIL'
     
     # === STEP 2: Try FAA database lookup (definitive for US civil aircraft) ===
-    faa_db = _get_faa_db()
-    if faa_db and faa_db.is_ready():
+    faa_db = _cached_faa_db if faa_ready else None
+    if faa_db:
         faa_type = faa_db.get_aircraft_type(icao24=icao24, callsign=callsign)
         if faa_type:
             # FAA database is authoritative - trust it completely!
@@ -366,44 +644,56 @@ def infer_aircraft_type(callsign: str, altitude_ft: Optional[int] = None,
     # === STEP 3: Fallback heuristics for non-US aircraft ===
     
     # Civilian helicopter callsign patterns
-    if is_helo_callsign:
+    if _HELI_PATTERN.search(callsign):
         return 'HELO'
     
-    # Specific cargo carriers (check BEFORE passenger airlines!)
-    if callsign.startswith('UPS'):
-        return 'UPS'
-    if callsign.startswith(('FDX', 'FXE')):  # FedEx and FedEx Feeder
-        return 'FDX'
-    if callsign.startswith(('GTI', 'ATN', 'ABX')):  # Atlas/Amazon partners
-        return 'AMAZON'
-    if callsign.startswith(('DHL', 'BCS', 'DAE')):  # DHL and partners
-        return 'DHL'
-    
-    # Other cargo carriers -> generic cargo icon
-    other_cargo = ['KFS', 'CLX', 'MPH', 'PAC', 'SQC', 'BOX', 'GEC',
-                   'ICL', 'NCR', 'AHK', 'CAL', 'CKS', 'NCA', 'POL']
-    if any(callsign.startswith(code) for code in other_cargo):
-        return 'CARGO'
-    
-    # Commercial passenger airlines (known ICAO prefixes)
-    airlines = ['AAL', 'UAL', 'DAL', 'SWA', 'JBU', 'ASA', 'FFT', 'NKS', 
-               'SKW', 'ENY', 'RPA', 'EDV', 'EJA', 'LXJ', 'XOJ', 'TVS', 
-               'XAJ', 'LEA', 'WWI', 'VIR', 'BAW', 'AFR', 'DLH', 'KLM']
-    if any(callsign.startswith(code) for code in airlines):
-        return 'JET'
+    # Specific cargo carriers, generic cargo, then passenger airlines
+    # (every civil prefix is a three-letter ICAO designator)
+    prefix_type = _CIVIL_PREFIX_TYPES.get(head3)
+    if prefix_type:
+        return prefix_type
     
     # High altitude = jet
     if altitude_ft and altitude_ft > 25000:
         return 'JET'
     
-    # N-numbers without FAA data = probably GA
-    if callsign.startswith('N') and len(callsign) <= 6:
+    # N-numbers without FAA data = probably GA (N1 .. N99999 / N123AB:
+    # registrations may end in letters, so no digits-only check)
+    if len(callsign) <= 6 and callsign[:1] == 'N':
         return 'GA'
     
     return 'UNK'
 
 
-def calculate_bearing(home_lat: float, home_lon: float, target_lat: float, target_lon: float) -> str:
+def clear_caches() -> None:
+    """Drop memoized lookup_aircraft_info() / infer_aircraft_type() results."""
+    with _info_cache_lock:
+        _info_cache.clear()
+    _infer_aircraft_type_cached.cache_clear()
+
+
+# Great-circle (haversine) distances instead of the flat-earth approximation;
+# only worth it for large radii, where 111 km/degree drifts
+USE_HAVERSINE = os.environ.get('AIRCRAFT_USE_HAVERSINE', 'false').lower() == 'true'
+EARTH_RADIUS_KM = 6371.0
+
+_DIRECTIONS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+_SECTORS_PER_RADIAN = 4 / math.pi  # 8 compass sectors per full turn
+
+
+@lru_cache(maxsize=4)
+def cos_home_lat(home_lat: float) -> float:
+    """
+    Longitude scale factor at home_lat for the flat-earth approximation.
+    
+    home_lat doesn't change across a sweep, so callers compute this once and
+    pass it to calculate_bearing() / calculate_distance_km() as cos_home.
+    """
+    return math.cos(math.radians(home_lat))
+
+
+def calculate_bearing(home_lat: float, home_lon: float, target_lat: float, target_lon: float,
+                      cos_home: Optional[float] = None) -> str:
     """
     Calculate compass direction from home to target coordinates.
     
@@ -412,41 +702,124 @@ def calculate_bearing(home_lat: float, home_lon: float, target_lat: float, targe
         home_lon: Home longitude
         target_lat: Target latitude
         target_lon: Target longitude
+        cos_home: cos_home_lat(home_lat), if the caller already has it
     
     Returns:
         Cardinal/intercardinal direction: N, NE, E, SE, S, SW, W, NW
     """
-    dx = (target_lon - home_lon) * math.cos(math.radians(home_lat))
+    if cos_home is None:
+        cos_home = cos_home_lat(home_lat)
+    if FAST_EXT_AVAILABLE:
+        return _DIRECTIONS[_fast_bearing_index(home_lat, home_lon, target_lat, target_lon, cos_home)]
+    
+    dx = (target_lon - home_lon) * cos_home
     dy = target_lat - home_lat
     
-    angle = math.degrees(math.atan2(dx, dy))
-    if angle < 0:
-        angle += 360
+    # atan2 is in (-pi, pi]: in sector units that's (-4, 4], and +8.5 makes it
+    # positive and centers each sector on its direction, so the truncated
+    # value masked to 0..7 is the index - no degree conversion or wrap branch
+    index = int(math.atan2(dx, dy) * _SECTORS_PER_RADIAN + 8.5) & 7
+    return _DIRECTIONS[index]
+
+
+@njit(cache=True, fastmath=True)
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance in km (compiled to native code when numba is installed).
     
-    directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-    index = int((angle + 22.5) / 45) % 8
-    return directions[index]
+    numba compiles on the first call, so only USE_HAVERSINE setups pay for it,
+    and cache=True keeps the machine code on disk for later starts.
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
 
 
-def calculate_distance_km(home_lat: float, home_lon: float, target_lat: float, target_lon: float) -> float:
+def calculate_distance_km(home_lat: float, home_lon: float, target_lat: float, target_lon: float,
+                          cos_home: Optional[float] = None) -> float:
     """
     Calculate approximate distance in km from home to target.
-    Uses simple Euclidean approximation (accurate for small distances).
+    Uses simple Euclidean approximation (accurate for small distances),
+    or haversine when USE_HAVERSINE is set.
     
     Args:
         home_lat: Home latitude
         home_lon: Home longitude
         target_lat: Target latitude
         target_lon: Target longitude
+        cos_home: cos_home_lat(home_lat), if the caller already has it
     
     Returns:
         Distance in kilometers
     """
-    dx = (target_lon - home_lon) * 111.0 * math.cos(math.radians(home_lat))
+    if USE_HAVERSINE:
+        if FAST_EXT_AVAILABLE:
+            return _fast_haversine_km(home_lat, home_lon, target_lat, target_lon)
+        return _haversine_km(home_lat, home_lon, target_lat, target_lon)
+    
+    if cos_home is None:
+        cos_home = cos_home_lat(home_lat)
+    if FAST_EXT_AVAILABLE:
+        return _fast_flat_distance_km(home_lat, home_lon, target_lat, target_lon, cos_home)
+    dx = (target_lon - home_lon) * 111.0 * cos_home
     dy = (target_lat - home_lat) * 111.0
     return math.sqrt(dx * dx + dy * dy)
 
 
+def calculate_bearings(home_lat: float, home_lon: float,
+                       target_lats: Sequence[float], target_lons: Sequence[float]) -> List[str]:
+    """
+    calculate_bearing() for a whole radar sweep at once.
+    
+    With NumPy the sweep is a handful of array operations instead of one
+    Python-level call per aircraft; without it, falls back to a loop.
+    
+    Returns:
+        Directions in the same order as the targets
+    """
+    cos_home = cos_home_lat(home_lat)
+    if not NUMPY_AVAILABLE:
+        return [calculate_bearing(home_lat, home_lon, lat, lon, cos_home)
+                for lat, lon in zip(target_lats, target_lons)]
+    
+    dx = (np.asarray(target_lons, dtype=float) - home_lon) * cos_home
+    dy = np.asarray(target_lats, dtype=float) - home_lat
+    
+    # Same sector arithmetic as calculate_bearing(); map the indices through
+    # the tuple so every result is one of the same (interned) direction
+    # strings rather than a fresh str copied out of a NumPy unicode array
+    index = (np.arctan2(dx, dy) * _SECTORS_PER_RADIAN + 8.5).astype(np.int64) & 7
+    return [_DIRECTIONS[i] for i in index.tolist()]
+
+
+def calculate_distances_km(home_lat: float, home_lon: float,
+                           target_lats: Sequence[float], target_lons: Sequence[float]) -> List[float]:
+    """
+    calculate_distance_km() for a whole radar sweep at once (see calculate_bearings).
+    
+    Returns:
+        Distances in kilometers, in the same order as the targets
+    """
+    if not NUMPY_AVAILABLE:
+        cos_home = cos_home_lat(home_lat)
+        return [calculate_distance_km(home_lat, home_lon, lat, lon, cos_home)
+                for lat, lon in zip(target_lats, target_lons)]
+    
+    if USE_HAVERSINE:
+        phi1 = math.radians(home_lat)
+        phi2 = np.radians(np.asarray(target_lats, dtype=float))
+        dlambda = np.radians(np.asarray(target_lons, dtype=float) - home_lon)
+        a = np.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+        return (2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(1.0, a)))).tolist()
+    
+    dx = (np.asarray(target_lons, dtype=float) - home_lon) * 111.0 * cos_home_lat(home_lat)
+    dy = (np.asarray(target_lats, dtype=float) - home_lat) * 111.0
+    return np.sqrt(dx * dx + dy * dy).tolist()
+
+
 # ============================================
 # Module status check
 # ============================================
@@ -464,19 +837,24 @@ def get_status() -> Dict:
         'fallback_cache_entries': 0
     }
     
-    aircraft_db = _get_aircraft_db()
-    if aircraft_db and aircraft_db.is_ready():
+    aircraft_db = _ready_aircraft_db()
+    if aircraft_db:
         status['aircraft_db'] = True
         stats = aircraft_db.get_stats()
         status['aircraft_db_count'] = stats.get('total_aircraft', 0)
     
-    faa_db = _get_faa_db()
-    if faa_db and faa_db.is_ready():
+    faa_db = _ready_faa_db()
+    if faa_db:
         status['faa_db'] = True
         stats = faa_db.get_stats()
         status['faa_db_count'] = stats.get('aircraft_count', 0)
     
-    _load_fallback_cache()
-    status['fallback_cache_entries'] = len(_fallback_cache)
+    with _fallback_db_lock:
+        conn = _get_fallback_db()
+        if conn is not None:
+            try:
+                status['fallback_cache_entries'] = conn.execute("SELECT COUNT(*) FROM fallback").fetchone()[0]
+            except sqlite3.Error:
+                pass
     
     return status
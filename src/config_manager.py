@@ -1,7 +1,36 @@
+import copy
 import json
 import os
+import shutil
 from typing import Dict, Any, Optional
 
+# orjson is optional - fall back to the stdlib json module if it isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json_file(path: str) -> Any:
+    """Read and parse a JSON file in a single read."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json_file(data: Any, path: str) -> None:
+    """Serialize data to JSON in memory and write it with a single write."""
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2, separators=(',', ': ')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(encoded)
+
+
 class ConfigManager:
     def __init__(self, config_path: str = None, secrets_path: str = None):
         # Use current working directory as base
@@ -25,23 +54,13 @@ class ConfigManager:
             
             # Load main config
             print(f"Attempting to load config from: {os.path.abspath(self.config_path)}")
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = _load_json_file(self.config_path)
 
             # Migrate config to add any new items from template
             self._migrate_config()
 
-            # Load and merge secrets if they exist (be permissive on errors)
-            if os.path.exists(self.secrets_path):
-                try:
-                    with open(self.secrets_path, 'r') as f:
-                        secrets = json.load(f)
-                        # Deep merge secrets into config
-                        self._deep_merge(self.config, secrets)
-                except PermissionError as e:
-                    print(f"Secrets file not readable ({self.secrets_path}): {e}. Continuing without secrets.")
-                except (json.JSONDecodeError, OSError) as e:
-                    print(f"Error reading secrets file ({self.secrets_path}): {e}. Continuing without secrets.")
+            # Load and merge secrets if they exist
+            self._merge_secrets()
             
             return self.config
             
@@ -57,6 +76,21 @@ class ConfigManager:
             print(f"Error loading configuration: {str(e)}")
             raise
 
+    def _merge_secrets(self, secrets: Optional[Dict[str, Any]] = None) -> None:
+        """Deep merge secrets into self.config, reading the secrets file if none are given (be permissive on errors)."""
+        if secrets is None:
+            if not os.path.exists(self.secrets_path):
+                return
+            try:
+                secrets = _load_json_file(self.secrets_path)
+            except PermissionError as e:
+                print(f"Secrets file not readable ({self.secrets_path}): {e}. Continuing without secrets.")
+                return
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Error reading secrets file ({self.secrets_path}): {e}. Continuing without secrets.")
+                return
+        self._deep_merge(self.config, secrets)
+
     def _strip_secrets_recursive(self, data_to_filter: Dict[str, Any], secrets: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively remove secret keys from a dictionary."""
         result = {}
@@ -78,8 +112,7 @@ class ConfigManager:
         secrets_content = {}
         if os.path.exists(self.secrets_path):
             try:
-                with open(self.secrets_path, 'r') as f_secrets:
-                    secrets_content = json.load(f_secrets)
+                secrets_content = _load_json_file(self.secrets_path)
             except Exception as e:
                 print(f"Warning: Could not load secrets file {self.secrets_path} during save: {e}")
                 # Continue without stripping if secrets can't be loaded, or handle as critical error
@@ -90,8 +123,7 @@ class ConfigManager:
         config_to_write = self._strip_secrets_recursive(new_config_data, secrets_content)
 
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(config_to_write, f, indent=4)
+            _dump_json_file(config_to_write, self.config_path)
             
             # Update the in-memory config to the new state (which includes secrets for runtime)
             self.config = new_config_data 
@@ -111,9 +143,8 @@ class ConfigManager:
         try:
             if not os.path.exists(self.secrets_path):
                 return None
-            with open(self.secrets_path, 'r') as f:
-                secrets = json.load(f)
-                return secrets.get(key)
+            secrets = _load_json_file(self.secrets_path)
+            return secrets.get(key)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error reading secrets file: {e}")
             return None
@@ -137,11 +168,8 @@ class ConfigManager:
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
         
         # Copy template to config
-        with open(self.template_path, 'r') as template_file:
-            template_data = json.load(template_file)
-        
-        with open(self.config_path, 'w') as config_file:
-            json.dump(template_data, config_file, indent=4)
+        template_data = _load_json_file(self.template_path)
+        _dump_json_file(template_data, self.config_path)
         
         print(f"Created config.json from template at {os.path.abspath(self.config_path)}")
 
@@ -152,25 +180,22 @@ class ConfigManager:
             return
         
         try:
-            with open(self.template_path, 'r') as f:
-                template_config = json.load(f)
+            template_config = _load_json_file(self.template_path)
             
             # Check if migration is needed
             if self._config_needs_migration(self.config, template_config):
                 print("Config migration needed - adding new configuration items with defaults")
                 
-                # Create backup of current config
+                # Create backup of current config (a byte-exact copy of the file we just loaded)
                 backup_path = f"{self.config_path}.backup"
-                with open(backup_path, 'w') as backup_file:
-                    json.dump(self.config, backup_file, indent=4)
+                shutil.copyfile(self.config_path, backup_path)
                 print(f"Created backup of current config at {os.path.abspath(backup_path)}")
                 
                 # Merge template defaults into current config
                 self._merge_template_defaults(self.config, template_config)
                 
                 # Save migrated config
-                with open(self.config_path, 'w') as f:
-                    json.dump(self.config, f, indent=4)
+                _dump_json_file(self.config, self.config_path)
                 
                 print(f"Config migration completed and saved to {os.path.abspath(self.config_path)}")
             else:
@@ -235,8 +260,7 @@ class ConfigManager:
             raise FileNotFoundError(f"{file_type.capitalize()} configuration file not found at {os.path.abspath(path_to_load)}")
 
         try:
-            with open(path_to_load, 'r') as f:
-                return json.load(f)
+            return _load_json_file(path_to_load)
         except json.JSONDecodeError:
             print(f"Error parsing {file_type} configuration file: {path_to_load}")
             raise
@@ -257,14 +281,21 @@ class ConfigManager:
         try:
             # Create directory if it doesn't exist, especially for config/
             os.makedirs(os.path.dirname(path_to_save), exist_ok=True)
-            with open(path_to_save, 'w') as f:
-                json.dump(data, f, indent=4)
+            _dump_json_file(data, path_to_save)
             print(f"{file_type.capitalize()} configuration successfully saved to {os.path.abspath(path_to_save)}")
             
             # If we just saved the main config or secrets, the merged self.config might be stale.
-            # Reload it to reflect the new state.
-            if file_type == "main" or file_type == "secrets":
-                self.load_config()
+            # Rebuild it from the data we just wrote rather than reading that file back.
+            if file_type == "main":
+                self.config = copy.deepcopy(data)
+                self._migrate_config()
+                self._merge_secrets()
+            else:
+                if not os.path.exists(self.config_path):
+                    self._create_config_from_template()
+                self.config = _load_json_file(self.config_path)
+                self._migrate_config()
+                self._merge_secrets(copy.deepcopy(data))
 
         except IOError as e:
             print(f"Error writing {file_type} configuration to file {os.path.abspath(path_to_save)}: {e}")
@@ -4,10 +4,56 @@ Intelligently calculates display durations based on content volume
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# A mode is a sports mode if any of these appears anywhere in its key
+_SPORTS_KEYWORDS = (
+    'nfl', 'nba', 'mlb', 'nhl', 'wnba', 'milb', 'soccer',
+    'ncaa_fb', 'ncaa_baseball', 'ncaam_basketball', 'ncaaw_basketball',
+    'ncaam_hockey', 'ncaaw_hockey', 'golf', 'tennis'
+)
+_SPORTS_PATTERN = re.compile('|'.join(map(re.escape, _SPORTS_KEYWORDS)))
+
+
+# Manager attributes holding the games to show, after a non-empty games_list;
+# the first one that exists wins, even if empty
+_GAME_LIST_ATTRS = ('live_games', 'recent_games', 'upcoming_games')
+_MISSING = object()
+
+
+# Sports scaling defaults, used when the config has no 'sports' section (or
+# leaves a setting out)
+_DEFAULT_SPORTS_CONFIG = {
+    'base_per_item': 8,      # Seconds per item for single item
+    'min_per_item': 4,       # Minimum seconds per item when many items
+    'max_total': 180,         # Maximum total duration for any sport
+    'scale_factor': 0.4      # How quickly to reduce per-item time (0-1)
+}
+
+
+class _SportsDurationSettings:
+    """Sports config values as slot attributes, read on every duration calculation."""
+    
+    __slots__ = ('base_per_item', 'min_per_item', 'max_total', 'scale_factor', 'reduction_rate')
+    
+    def __init__(self, sports_config: Dict[str, Any]):
+        for name in ('base_per_item', 'min_per_item', 'max_total', 'scale_factor'):
+            setattr(self, name, sports_config.get(name, _DEFAULT_SPORTS_CONFIG[name]))
+        
+        # reduction_rate = (base - min) * scale_factor / 10
+        # This means it takes ~10-15 items to reach min_per_item
+        self.reduction_rate = (self.base_per_item - self.min_per_item) * self.scale_factor / 10
+
+
+@lru_cache(maxsize=256)
+def _is_sports_mode_key(mode_key: str) -> bool:
+    """One regex search per distinct mode key; the set of mode keys is small."""
+    return _SPORTS_PATTERN.search(mode_key) is not None
+
 
 class DynamicDurationManager:
     """
@@ -39,24 +85,34 @@ class DynamicDurationManager:
         self.fixed_durations = self.display_config.get('display_durations', {})
         
         # Load sport-specific configuration
-        self.sports_config = self.dynamic_config.get('sports', {
-            'base_per_item': 8,      # Seconds per item for single item
-            'min_per_item': 4,       # Minimum seconds per item when many items
-            'max_total': 180,         # Maximum total duration for any sport
-            'scale_factor': 0.4      # How quickly to reduce per-item time (0-1)
-        })
+        self.sports_config = self.dynamic_config.get('sports', dict(_DEFAULT_SPORTS_CONFIG))
         
         # Static content configuration
         self.static_config = {
             'clock': self.dynamic_config.get('clock', {'fixed': 10}),
             'weather': self.dynamic_config.get('weather', {'per_screen': 10})
         }
+        self._load_settings()
+        
+        # Durations only depend on (mode_key, item_count) and the config, so
+        # repeat calls within a refresh are memoized; update_config() clears it
+        self._compute_duration = lru_cache(maxsize=256)(self._compute_duration_impl)
+        
+        # mode_key -> bound handler(mode_key, item_count); keys other than the
+        # static ones are classified on first sight and added by _get_handler()
+        self._mode_handlers = {'clock': self._clock_handler}
         
         logger.info(f"DynamicDurationManager initialized - Enabled: {self.enabled}")
         if self.enabled:
             logger.info(f"Sports config: {self.sports_config}")
             logger.info(f"Static config: {self.static_config}")
     
+    def _load_settings(self):
+        """Copy the config values used per calculation into plain attributes."""
+        self._sports = _SportsDurationSettings(self.sports_config)
+        self._clock_duration = int(self.static_config['clock'].get('fixed', 10))
+        self._weather_per_screen = int(self.static_config['weather'].get('per_screen', 15))
+    
     def get_duration(self, mode_key: str, manager: Any = None, item_count: Optional[int] = None) -> int:
         """
         Get the appropriate duration for a display mode.
@@ -78,25 +134,49 @@ class DynamicDurationManager:
         if item_count is None and manager is not None:
             item_count = self._get_item_count(mode_key, manager)
         
+        return self._compute_duration(mode_key, item_count)
+    
+    def _compute_duration_impl(self, mode_key: str, item_count: Optional[int]) -> int:
+        """Duration for a mode once its item count is known (memoized as _compute_duration)."""
+        handler = self._mode_handlers.get(mode_key)
+        if handler is None:
+            handler = self._get_handler(mode_key)
+        return handler(mode_key, item_count)
+    
+    def _get_handler(self, mode_key: str):
+        """Classify a mode key the first time it's seen and remember its handler."""
         # Calculate duration based on mode type
         if mode_key == 'clock':
-            return self._get_clock_duration()
-        
+            handler = self._clock_handler
         elif mode_key.startswith('weather'):
-            return self._get_weather_duration(mode_key, item_count or 1)
-        
+            handler = self._weather_handler
         elif self._is_sports_mode(mode_key):
-            return self._get_sports_duration(mode_key, item_count or 0)
-        
+            handler = self._sports_handler
         else:
-            # Default to fixed duration for unknown modes
-            if 'nfl' in mode_key.lower():
-                logger.info(f"DEBUG: Not recognized as sports mode, returning default")
-            return self.fixed_durations.get(mode_key, 30)
+            handler = self._fixed_handler
+        
+        self._mode_handlers[mode_key] = handler
+        return handler
+    
+    def _clock_handler(self, mode_key: str, item_count: Optional[int]) -> int:
+        # Clock is always the same fixed duration
+        return self._clock_duration
+    
+    def _weather_handler(self, mode_key: str, item_count: Optional[int]) -> int:
+        # Weather shows per_screen seconds for each screen
+        return self._weather_per_screen * (item_count or 1)
+    
+    def _sports_handler(self, mode_key: str, item_count: Optional[int]) -> int:
+        return self._get_sports_duration(mode_key, item_count or 0)
+    
+    def _fixed_handler(self, mode_key: str, item_count: Optional[int]) -> int:
+        # Default to fixed duration for unknown modes
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mode %s not recognized, using fixed duration", mode_key)
+        return self.fixed_durations.get(mode_key, 30)
     
     def _get_item_count(self, mode_key: str, manager: Any) -> int:
         """
-        logger.info(f"DEBUG _get_item_count: mode_key={mode_key}, manager={type(manager).__name__ if manager else None}, has_games_list={hasattr(manager, 'games_list') if manager else False}")
         Determine the number of items from a manager.
         
         Args:
@@ -108,50 +188,23 @@ class DynamicDurationManager:
         """
 
 
-        # Sports managers - check for games
-        if hasattr(manager, 'games_list') and len(manager.games_list) > 0:
-            count = len(manager.games_list)
-            return count
-        elif hasattr(manager, 'live_games'):
-            return len(manager.live_games)
-        elif hasattr(manager, 'recent_games'):
-            return len(manager.recent_games)
-        elif hasattr(manager, 'upcoming_games'):
-            return len(manager.upcoming_games)
-        # Weather managers - multiple screens
-        elif mode_key.startswith('weather'):
-            # Weather typically has 1-3 screens (current, hourly, daily)
-            return 1
+        # Sports managers - check for games (getattr with a default instead of
+        # hasattr + attribute access: one lookup per candidate)
+        games_list = getattr(manager, 'games_list', None)
+        if games_list:
+            return len(games_list)
+        for attr in _GAME_LIST_ATTRS:
+            games = getattr(manager, attr, _MISSING)
+            if games is not _MISSING:
+                return len(games)
         
-        # Default
+        # Weather managers typically have 1-3 screens (current, hourly, daily)
+        # but count as one item; everything else defaults to 1 too
         return 1
     
     def _is_sports_mode(self, mode_key: str) -> bool:
         """Check if a mode is a sports mode."""
-        sports_keywords = [
-            'nfl', 'nba', 'mlb', 'nhl', 'wnba', 'milb', 'soccer',
-            'ncaa_fb', 'ncaa_baseball', 'ncaam_basketball', 'ncaaw_basketball',
-            'ncaam_hockey', 'ncaaw_hockey', 'golf', 'tennis'
-        ]
-        return any(keyword in mode_key for keyword in sports_keywords)
-    
-    def _get_clock_duration(self) -> int:
-        """Get duration for clock display."""
-        return self.static_config['clock'].get('fixed', 10)
-    
-    def _get_weather_duration(self, mode_key: str, screen_count: int = 1) -> int:
-        """
-        Get duration for weather display.
-        
-        Args:
-            mode_key: Weather mode key
-            screen_count: Number of weather screens
-            
-        Returns:
-            Duration in seconds
-        """
-        per_screen = self.static_config['weather'].get('per_screen', 15)
-        return per_screen * screen_count
+        return _is_sports_mode_key(mode_key)
     
     def _get_sports_duration(self, mode_key: str, item_count: int) -> int:
         """
@@ -175,33 +228,28 @@ class DynamicDurationManager:
         if item_count == 0:
             return 5
         
-        # Get config values
-        base_per_item = self.sports_config['base_per_item']
-        min_per_item = self.sports_config['min_per_item']
-        max_total = self.sports_config['max_total']
-        scale_factor = self.sports_config['scale_factor']
+        sports = self._sports
         
         # Single item - use base duration
         if item_count == 1:
-            return base_per_item
+            return sports.base_per_item
         
         # Multiple items - calculate scaled duration
         # Linear scaling: per_item = base - (count - 1) * reduction_rate
-        # reduction_rate = (base - min) * scale_factor / 10
-        # This means it takes ~10-15 items to reach min_per_item
-        reduction_rate = (base_per_item - min_per_item) * scale_factor / 10
-        per_item_duration = max(min_per_item, base_per_item - (item_count - 1) * reduction_rate)
+        per_item_duration = max(sports.min_per_item,
+                                sports.base_per_item - (item_count - 1) * sports.reduction_rate)
         
         # Calculate total duration
         total_duration = int(per_item_duration * item_count)
         
         # Apply max bound
-        final_duration = min(total_duration, max_total)
+        final_duration = min(total_duration, sports.max_total)
         
-        logger.debug(
-            f"Sports duration calculated for {mode_key}: "
-            f"{item_count} items, {per_item_duration:.1f}s each = {final_duration}s total"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sports duration calculated for %s: %d items, %.1fs each = %ds total",
+                mode_key, item_count, per_item_duration, final_duration
+            )
         
         return final_duration
     
@@ -229,6 +277,8 @@ class DynamicDurationManager:
         self.sports_config = self.dynamic_config.get('sports', self.sports_config)
         self.static_config['clock'] = self.dynamic_config.get('clock', self.static_config['clock'])
         self.static_config['weather'] = self.dynamic_config.get('weather', self.static_config['weather'])
+        self._load_settings()
+        self._compute_duration.cache_clear()
         
         logger.info("DynamicDurationManager configuration updated")
 
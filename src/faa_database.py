@@ -25,22 +25,360 @@ Usage:
     # Lookup by N-number from callsign
     info = faa_db.lookup(callsign='N12345')
     
-    # Returns dict with 'type', 'manufacturer', 'model', etc.
+    # Returns an AircraftInfo with .type, .manufacturer, .model, etc.
+    # (faa_db.lookup_dict() gives the same as a dict)
 """
 
+import io
 import os
+import re
+import sys
 import csv
 import json
+import mmap
+import pickle
 import time
 import zipfile
 import logging
+import multiprocessing
 import requests
 import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Compiled per-row classifier, built by scripts/build_aircraft_fast.py
+try:
+    from src.faa_fast import (
+        cargo_codes as _fast_cargo_codes,
+        classify as _fast_classify,
+        set_rules as _fast_set_rules,
+        type_codes as _fast_type_codes,
+    )
+    FAST_EXT_AVAILABLE = True
+except ImportError:
+    FAST_EXT_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Text fields of an aircraft record, stored per row as an index into a string
+# table (a few thousand distinct manufacturers/models/types over ~300K rows)
+STRING_FIELDS = ('type', 'type_aircraft', 'type_engine', 'manufacturer', 'model',
+                 'registrant', 'cargo_carrier')
+
+# Fields holding short codes ('JET', '4', 'UPS', ...): their strings are
+# interned, so records share the same objects as the code literals even when
+# the table was unpickled from the cache
+CODE_FIELDS = ('type', 'type_aircraft', 'type_engine', 'cargo_carrier')
+
+# MASTER.txt STATUS CODE values of registrations we keep (blank is kept too)
+VALID_STATUS_CODES = ('V', 'A', 'M', 'T', 'N', 'R', 'S')
+
+
+# Worker processes for parsing MASTER.txt. Opt-in: the default of 1 parses
+# in-process; set FAA_PARSE_WORKERS to e.g. 4 on a multi-core Pi
+try:
+    PARSE_WORKERS = max(1, int(os.environ.get('FAA_PARSE_WORKERS', 1)))
+except ValueError:
+    PARSE_WORKERS = 1
+
+
+class AircraftInfo(NamedTuple):
+    """One FAA aircraft record (read-only; _asdict() gives the lookup() dict)."""
+    type: str
+    type_aircraft: str
+    type_engine: str
+    manufacturer: str
+    model: str
+    n_number: str
+    registrant: str
+    is_cargo: bool
+    cargo_carrier: str
+    source: str
+
+
+class _FAATables(NamedTuple):
+    """
+    The lookup tables from one load. Never modified once published to
+    FAADatabase._tables, so lookups read them without locking.
+    """
+    columns: Dict[str, array]           # STRING_FIELDS -> string id per row
+    n_numbers: list                     # N-number (without N prefix) as bytes per row
+    strings: list                       # String table for the columns
+    by_icao24: Dict[int, int]           # Mode S hex as int -> row index
+    by_nnumber: Dict[bytes, int]        # N-number as bytes -> row index
+
+
+def _icao24_key(mode_s_hex: str) -> Optional[int]:
+    """by_icao24 key for a Mode S hex code (leading zeros and case don't matter), or None."""
+    try:
+        return int(mode_s_hex, 16) or None
+    except ValueError:
+        return None
+
+
+def _parse_master_range(filepath: str, start: int, end: int, acft_ref: Dict) -> tuple:
+    """
+    Parse the MASTER.txt lines starting in byte range [start, end).
+    
+    Runs in a worker process for FAADatabase._parse_master (so no logging
+    here). Rows are numbered from 0 and text fields are ids into this
+    range's own string table.
+    
+    Returns:
+        (count, columns, n_numbers, strings, by_icao24, by_nnumber)
+    """
+    return _build_master_tables(_iter_master_range(filepath, start, end), acft_ref)
+
+
+def _iter_master_range(filepath: str, start: int, end: int):
+    """
+    Yield the fields _build_master_tables needs from each kept MASTER.txt
+    line starting in byte range [start, end), leaving the classification
+    to it (aircraft_type and cargo_type are None).
+    """
+    with open(filepath, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    with mm:
+        # Actual CSV column indices from FAA file:
+        # 0: N-NUMBER
+        # 1: SERIAL NUMBER
+        # 2: MFR MDL CODE
+        # 3: ENG MFR MDL
+        # 4: YEAR MFR
+        # 5: TYPE REGISTRANT
+        # 6: NAME
+        # 7-8: STREET, STREET2
+        # 9-14: CITY, STATE, ZIP, REGION, COUNTY, COUNTRY
+        # 15-16: LAST ACTION DATE, CERT ISSUE DATE
+        # 17: CERTIFICATION
+        # 18: TYPE AIRCRAFT  <-- This is what we need!
+        # 19: TYPE ENGINE
+        # 20: STATUS CODE
+        # 21: MODE S CODE (octal)
+        # 22: FRACT OWNER
+        # 23: AIR WORTH DATE
+        # 24-28: OTHER NAMES (1-5)
+        # 29: EXPIRATION DATE
+        # 30: UNIQUE ID
+        # 31: KIT MFR
+        # 32: KIT MODEL
+        # 33: MODE S CODE HEX  <-- This is the ICAO24!
+        #
+        # The FAA file is plain comma-separated fixed-width text, so each
+        # mapped line is split directly (stopping after column 33) instead
+        # of going through csv.reader; a line with quotes still gets the
+        # csv module's parsing
+        
+        mm.seek(start)
+        while mm.tell() < end:
+            line = mm.readline().decode('utf-8', 'replace')
+            if '"' in line:
+                row = next(csv.reader([line]), [])
+            else:
+                row = line.split(',', 34)
+            if len(row) < 21:  # Need at least through STATUS CODE
+                continue
+            
+            n_number = row[0].strip().upper()
+            status_code = row[20].strip()
+            
+            # Skip invalid/deregistered aircraft
+            if status_code and status_code not in VALID_STATUS_CODES:
+                continue
+            
+            if not n_number:
+                continue
+            
+            # Skip header-like rows
+            if n_number == 'N-NUMBER':
+                continue
+            
+            # Mode S hex is in column 33
+            mode_s_hex = ''
+            if len(row) > 33:
+                mode_s_hex = row[33].strip().upper()
+            
+            yield (n_number, row[2].strip(), row[6].strip().upper(),
+                   row[18].strip(), row[19].strip(), mode_s_hex, None, None)
+
+
+def _read_fields_polars(filepath: str, maxsplit: int, skip_rows: int = 0) -> 'pl.DataFrame':
+    """
+    Read a comma-separated FAA file with polars, each line split like
+    line.split(',', maxsplit) into columns field_0 .. field_<maxsplit>.
+    
+    An empty field is '' and a field past the end of a short line is null.
+    pl.read_csv can't tell those apart (both come back null), and the
+    parsers must skip only the short lines. Raises ValueError on a quoted
+    field, which only the csv-module parsers handle.
+    """
+    # One string column per line: \x1f (unit separator) never appears in the files
+    lines = pl.read_csv(
+        filepath, has_header=False, skip_rows=skip_rows, separator='\x1f', quote_char=None,
+        new_columns=['line'], infer_schema_length=0, encoding='utf8-lossy',
+    ).get_column('line')
+    if lines.str.contains('"', literal=True).any():
+        raise ValueError("quoted fields")
+    return lines.str.splitn(',', maxsplit + 1).struct.unnest()
+
+
+def _parse_master_polars(filepath: str, acft_ref: Dict) -> tuple:
+    """
+    Parse all of MASTER.txt with polars, split the way _iter_master_range
+    splits it (see there for the layout).
+    
+    The rows are classified here a column at a time, with the same rules
+    as FAADatabase._classify_type and _is_cargo_carrier.
+    
+    Returns the same tables as _parse_master_range.
+    """
+    df = _read_fields_polars(filepath, 34, skip_rows=1)
+    
+    def field(index, name):
+        return pl.col(f'field_{index}').fill_null('').str.strip_chars().alias(name)
+    
+    # Need at least through STATUS CODE (column 20), as _iter_master_range
+    df = df.filter(pl.col('field_20').is_not_null()).select(
+        field(0, 'n_number').str.to_uppercase(),
+        field(2, 'mfr_model_code'),
+        field(6, 'registrant').str.to_uppercase(),
+        field(18, 'type_aircraft'),
+        field(19, 'type_engine'),
+        field(20, 'status_code'),
+        field(33, 'mode_s_hex').str.to_uppercase(),
+    ).filter(
+        ((pl.col('status_code') == '') | pl.col('status_code').is_in(VALID_STATUS_CODES))
+        & (pl.col('n_number') != '') & (pl.col('n_number') != 'N-NUMBER')
+    )
+    
+    # FAADatabase._classify_type as a column expression
+    type_aircraft = pl.col('type_aircraft')
+    aircraft_type = pl.when(
+        ~pl.col('type_engine').is_in(list(FAADatabase.ENGINE_TURBINE_CODES))
+        & type_aircraft.is_in(list(FAADatabase.PISTON_TYPE_MAPPING))
+    ).then(
+        type_aircraft.replace_strict(FAADatabase.PISTON_TYPE_MAPPING, default='UNK', return_dtype=pl.String)
+    ).otherwise(
+        type_aircraft.replace_strict(FAADatabase.TYPE_MAPPING, default='UNK', return_dtype=pl.String)
+    )
+    
+    # All keywords in the registrant in one Aho-Corasick pass, then the
+    # carrier of the best-priority one, or ''
+    keywords = [keyword for keyword, _ in FAADatabase.CARGO_KEYWORDS]
+    cargo_type = pl.col('registrant').str.extract_many(keywords, overlapping=True).list.eval(
+        pl.element().replace_strict({keyword: i for i, keyword in enumerate(keywords)}, return_dtype=pl.Int32)
+    ).list.min().replace_strict(
+        {i: carrier for i, (_, carrier) in enumerate(FAADatabase.CARGO_KEYWORDS)},
+        default='', return_dtype=pl.String,
+    )
+    
+    df = df.with_columns(
+        aircraft_type=aircraft_type,
+        cargo_type=cargo_type,
+    ).with_columns(
+        aircraft_type=pl.when((pl.col('cargo_type') != '') & pl.col('aircraft_type').is_in(FAADatabase.CARGO_ICON_TYPES))
+        .then(pl.col('cargo_type')).otherwise(pl.col('aircraft_type'))
+    )
+    
+    rows = zip(*(df.get_column(name).to_list() for name in (
+        'n_number', 'mfr_model_code', 'registrant', 'type_aircraft', 'type_engine',
+        'mode_s_hex', 'aircraft_type', 'cargo_type')))
+    return _build_master_tables(rows, acft_ref)
+
+
+def _build_master_tables(rows, acft_ref: Dict) -> tuple:
+    """
+    Classify MASTER.txt rows and build their columnar tables.
+    
+    Args:
+        rows: (n_number, mfr_model_code, registrant, type_aircraft,
+              type_engine, mode_s_hex, aircraft_type, cargo_type) per kept
+              row, stripped and with n_number/registrant/mode_s_hex
+              uppercased; the row is classified here if aircraft_type is None
+        acft_ref: Parsed ACFTREF.txt
+    
+    Returns:
+        (count, columns, n_numbers, strings, by_icao24, by_nnumber)
+    """
+    count = 0
+    by_icao24 = {}
+    by_nnumber = {}
+    n_numbers = []
+    strings = []
+    string_ids = {}
+    columns = {field: array('i') for field in STRING_FIELDS}
+    appenders = [columns[field].append for field in STRING_FIELDS]
+    
+    def string_id(value):
+        sid = string_ids.get(value)
+        if sid is None:
+            sid = string_ids[value] = len(strings)
+            strings.append(value)
+        return sid
+    
+    if FAST_EXT_AVAILABLE:
+        type_codes = _fast_type_codes()
+        cargo_codes = _fast_cargo_codes()
+    
+    for (n_number, mfr_model_code, registrant, type_aircraft, type_engine, mode_s_hex,
+            aircraft_type, cargo_type) in rows:
+        # Look up reference info
+        ref_info = acft_ref.get(mfr_model_code, {})
+        
+        # Determine our aircraft type, and check if this is a cargo
+        # carrier by registrant name
+        if aircraft_type is None:
+            if FAST_EXT_AVAILABLE:
+                packed = _fast_classify(type_aircraft, type_engine, registrant)
+                aircraft_type = type_codes[packed & 255]
+                cargo_type = cargo_codes[packed >> 8]
+            else:
+                aircraft_type = FAADatabase._classify_type(type_aircraft, type_engine, ref_info)
+                cargo_type = FAADatabase._is_cargo_carrier(registrant)
+            if cargo_type and aircraft_type in FAADatabase.CARGO_ICON_TYPES:
+                aircraft_type = cargo_type  # UPS, FDX, AMAZON, DHL, or CARGO
+        
+        # Append the record's row (same order as STRING_FIELDS)
+        # N-numbers are kept as bytes (smaller than str), and the same
+        # object is the by_nnumber key
+        n_number = n_number.encode()
+        row_index = len(n_numbers)
+        n_numbers.append(n_number)
+        for append, value in zip(appenders, (
+                aircraft_type, type_aircraft, type_engine,
+                ref_info.get('manufacturer', ''), ref_info.get('model', ''),
+                registrant, cargo_type)):
+            append(string_id(value))
+        
+        # Store by N-number
+        by_nnumber[n_number] = row_index
+        
+        # Store by ICAO24 hex if available, as its integer value
+        if mode_s_hex:
+            icao_key = _icao24_key(mode_s_hex)
+            if icao_key is not None:
+                by_icao24[icao_key] = row_index
+        
+        count += 1
+    
+    return count, columns, n_numbers, strings, by_icao24, by_nnumber
+
 
 class FAADatabase:
     """
@@ -59,7 +397,7 @@ class FAADatabase:
         '2': 'BALLOON', # Hot air balloon
         '3': 'BALLOON', # Blimp/Dirigible (use balloon icon)
         '4': 'GA',      # Fixed wing single engine
-        '5': 'JET',     # Fixed wing multi engine - refined in _classify_type()
+        '5': 'JET',     # Fixed wing multi engine - see PISTON_TYPE_MAPPING
         '6': 'HELO',    # Rotorcraft - THE KEY ONE!
         '7': 'GA',      # Weight-shift-control (ultralight)
         '8': 'CHUTE',   # Powered Parachute
@@ -73,9 +411,65 @@ class FAADatabase:
     # 5=Turbo-fan, 6=Ramjet, 7=2-Cycle, 8=4-Cycle, 9=Unknown, 10=Electric, 11=Rotary
     ENGINE_TURBINE_CODES = {'2', '3', '4', '5', '6'}  # These are jets/turbines
     
+    # Type Aircraft codes whose icon depends on the engine: without a turbine
+    # engine these replace TYPE_MAPPING's type
+    PISTON_TYPE_MAPPING = {
+        '5': 'TWIN',    # Piston twin (Baron, Seneca, etc.) rather than JET
+    }
+    
+    # Registrant name keywords -> cargo carrier type code, in priority order
+    # (a registrant matching several keywords gets the first one's code)
+    CARGO_KEYWORDS = (
+        # Specific carriers with branded icons
+        ('UNITED PARCEL', 'UPS'),
+        ('UPS', 'UPS'),
+        ('FEDERAL EXPRESS', 'FDX'),
+        ('FEDEX', 'FDX'),
+        ('AMAZON', 'AMAZON'),
+        ('PRIME AIR', 'AMAZON'),
+        ('DHL', 'DHL'),
+        ('ATLAS AIR', 'AMAZON'),    # Atlas Air often flies for Amazon
+        ('ABX AIR', 'AMAZON'),      # ABX Air often flies for DHL/Amazon
+        # Other cargo carriers -> generic CARGO
+        ('KALITTA', 'CARGO'),
+        ('CARGOLUX', 'CARGO'),
+        ('POLAR AIR', 'CARGO'),
+        ('SOUTHERN AIR', 'CARGO'),
+        ('WESTERN GLOBAL', 'CARGO'),
+        ('WORLD AIRWAYS', 'CARGO'),
+        ('NIPPON CARGO', 'CARGO'),
+        ('CATHAY CARGO', 'CARGO'),
+        ('AIR TRANSPORT INT', 'CARGO'),
+        ('AMERIJET', 'CARGO'),
+        ('MARTINAIRE', 'CARGO'),
+        ('EMPIRE AIRLINES', 'CARGO'),
+        ('MOUNTAIN AIR CARGO', 'CARGO'),
+    )
+    
+    # Aircraft types shown with the cargo carrier's icon instead
+    CARGO_ICON_TYPES = ('JET', 'TWIN')
+    
+    # Automaton over all CARGO_KEYWORDS (built on first use if pyahocorasick
+    # is installed), so a registrant is scanned once instead of per keyword
+    _cargo_automaton = None
+    
+    # Without pyahocorasick: one regex alternation of all CARGO_KEYWORDS, so
+    # the (usually non-cargo) registrant is scanned once in C
+    _cargo_pattern = re.compile('|'.join(re.escape(keyword) for keyword, _ in CARGO_KEYWORDS))
+    _cargo_priority = {keyword: priority for priority, (keyword, _) in enumerate(CARGO_KEYWORDS)}
+    
+    # Parsed lookup tables, saved next to MASTER.txt so later starts can skip
+    # parsing it; bump CACHE_VERSION whenever the stored layout changes
+    CACHE_FILENAME = "faa_cache.pkl"
+    CACHE_VERSION = 3
+    
     # Download URL
     FAA_DATABASE_URL = "https://registry.faa.gov/database/ReleasableAircraft.zip"
     
+    # Read the download 1MB at a time, logging progress every 8MB
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    PROGRESS_EVERY_CHUNKS = 8
+    
     def __init__(self, data_dir: str = "/home/ledpi/LEDMatrix/data/faa"):
         """
         Initialize FAA Database.
@@ -86,15 +480,18 @@ class FAADatabase:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Lookup tables - populated by _load_database()
-        self.by_icao24 = {}     # Mode S hex -> aircraft info
-        self.by_nnumber = {}    # N-number (without N prefix) -> aircraft info
+        # Lookup tables - populated by _load_database(). Aircraft records
+        # are one entry per row in each column (struct of arrays rather
+        # than one dict per aircraft). A reload builds a new set and
+        # replaces this attribute in one assignment, so readers just take
+        # a reference and need no lock
+        self._tables = _FAATables({field: array('i') for field in STRING_FIELDS}, [], [], {}, {})
         
         # Metadata
         self.last_update = None
         self.aircraft_count = 0
         self._loaded = False
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # Serializes reloads; lookups don't take it
         
         # Try to load existing database
         self._load_database()
@@ -122,14 +519,20 @@ class FAADatabase:
                     meta = json.load(f)
                     self.last_update = meta.get('last_update')
             
-            # Load aircraft reference file first (for manufacturer/model names)
-            acft_ref = {}
-            if ref_file.exists():
-                acft_ref = self._parse_acftref(ref_file)
-                logger.info(f"Loaded {len(acft_ref)} aircraft reference entries")
-            
-            # Parse MASTER.txt and build lookup tables
-            count = self._parse_master(master_file, acft_ref)
+            # Reuse the tables parsed from these exact files, if cached
+            signature = self._source_signature(master_file, ref_file)
+            count = self._load_cache(signature)
+            if count is not None:
+                logger.info("Loaded parsed FAA database from cache")
+            else:
+                # Load aircraft reference file first (for manufacturer/model names)
+                acft_ref = {}
+                if ref_file.exists():
+                    acft_ref = self._parse_acftref(ref_file)
+                    logger.info(f"Loaded {len(acft_ref)} aircraft reference entries")
+                
+                # Parse MASTER.txt and build lookup tables
+                count = self._parse_master(master_file, acft_ref, signature)
             
             self.aircraft_count = count
             self._loaded = True
@@ -144,6 +547,85 @@ class FAADatabase:
             logger.error(f"Failed to load FAA database: {e}")
             return False
     
+    @staticmethod
+    def _source_signature(master_file: Path, ref_file: Path) -> tuple:
+        """(size, mtime) of the source files, to tell whether the cache matches them."""
+        signature = []
+        for path in (master_file, ref_file):
+            try:
+                st = path.stat()
+                signature.append((st.st_size, st.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _load_cache(self, signature: tuple) -> Optional[int]:
+        """
+        Load the lookup tables from the parse cache.
+        
+        Returns:
+            Aircraft count, or None if there's no cache for these source files
+        """
+        cache_file = self.data_dir / self.CACHE_FILENAME
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable FAA cache {cache_file}: {e}")
+            return None
+        
+        if (not isinstance(cached, dict) or cached.get('version') != self.CACHE_VERSION
+                or cached.get('source') != signature):
+            return None
+        
+        self._publish(_FAATables(cached['columns'], cached['n_numbers'], cached['strings'],
+                                 cached['by_icao24'], cached['by_nnumber']))
+        return cached['count']
+    
+    def _publish(self, tables: _FAATables) -> None:
+        """Make tables the ones lookups use (they must not be modified afterwards)."""
+        # Replace the string table entries used by CODE_FIELDS with
+        # interned strings
+        strings = tables.strings
+        for field in CODE_FIELDS:
+            for sid in set(tables.columns[field]):
+                strings[sid] = sys.intern(strings[sid])
+        
+        self._tables = tables
+    
+    @property
+    def by_icao24(self) -> Dict[int, int]:
+        """Mode S hex as int -> row index, in the current tables."""
+        return self._tables.by_icao24
+    
+    @property
+    def by_nnumber(self) -> Dict[bytes, int]:
+        """N-number (without N prefix) as bytes -> row index, in the current tables."""
+        return self._tables.by_nnumber
+    
+    def _save_cache(self, signature: tuple, count: int) -> None:
+        """Write the current lookup tables to the parse cache."""
+        cache_file = self.data_dir / self.CACHE_FILENAME
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        tables = self._tables
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({
+                    'version': self.CACHE_VERSION,
+                    'source': signature,
+                    'count': count,
+                    'columns': tables.columns,
+                    'n_numbers': tables.n_numbers,
+                    'strings': tables.strings,
+                    'by_icao24': tables.by_icao24,
+                    'by_nnumber': tables.by_nnumber,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Could not write FAA cache {cache_file}: {e}")
+    
     def _parse_acftref(self, filepath: Path) -> Dict[str, Dict]:
         """
         Parse ACFTREF.txt to get manufacturer and model names.
@@ -152,6 +634,12 @@ class FAADatabase:
         """
         ref = {}
         
+        if POLARS_AVAILABLE:
+            try:
+                return self._parse_acftref_polars(filepath)
+            except Exception as e:
+                logger.warning(f"polars could not read ACFTREF.txt ({e}), using the csv module")
+        
         try:
             with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
                 reader = csv.reader(f)
@@ -185,166 +673,167 @@ class FAADatabase:
         
         return ref
     
-    def _parse_master(self, filepath: Path, acft_ref: Dict) -> int:
+    @staticmethod
+    def _parse_acftref_polars(filepath: Path) -> Dict[str, Dict]:
+        """_parse_acftref() with polars, reading only the columns we use."""
+        fields = ('manufacturer', 'model', 'type_aircraft', 'type_engine', 'num_engines', 'num_seats')
+        # Split past column 10 so it doesn't swallow the rest of the line
+        df = _read_fields_polars(str(filepath), 11)
+        # Need at least through TYPE_AIRCRAFT (column 3), as _parse_acftref
+        df = df.filter(pl.col('field_3').is_not_null()).select(
+            pl.col(f'field_{index}').fill_null('').str.strip_chars().alias(name)
+            for index, name in zip((0, 1, 2, 3, 4, 9, 10), ('code', *fields))
+        ).filter(pl.col('code') != '')
+        
+        return {
+            code: dict(zip(fields, values))
+            for code, *values in df.iter_rows()
+        }
+    
+    def _parse_master(self, filepath: Path, acft_ref: Dict, cache_signature: Optional[tuple] = None) -> int:
         """
         Parse MASTER.txt to build lookup tables.
         
+        The file is read by polars if it's installed, otherwise split into
+        byte ranges parsed by worker processes (see _parse_master_range),
+        whose partial tables are concatenated here in file order. If cache_signature is given and the whole file parses,
+        the tables are also saved to the parse cache under that signature.
+        
         Returns count of aircraft processed.
         """
         count = 0
+        complete = False
+        by_icao24 = {}
+        by_nnumber = {}
+        n_numbers = []
+        strings = []
+        string_ids = {}
+        columns = {field: array('i') for field in STRING_FIELDS}
+        
+        def string_id(value):
+            sid = string_ids.get(value)
+            if sid is None:
+                sid = string_ids[value] = len(strings)
+                strings.append(value)
+            return sid
         
         try:
-            with open(filepath, 'r', encoding='utf-8-sig', errors='replace') as f:
-                reader = csv.reader(f)
+            for part in self._parse_master_parts(filepath, acft_ref):
+                part_count, part_columns, part_n_numbers, part_strings, part_by_icao24, part_by_nnumber = part
                 
-                # Skip header row
-                header = next(reader, None)
-                if header:
-                    logger.debug(f"MASTER.txt columns: {len(header)}")
+                # Re-number the part's string ids into the shared table and
+                # its row indices to follow the rows parsed so far
+                offset = len(n_numbers)
+                remap = [string_id(value) for value in part_strings]
+                for field in STRING_FIELDS:
+                    columns[field].extend(map(remap.__getitem__, part_columns[field]))
+                n_numbers.extend(part_n_numbers)
+                for key, row_index in part_by_nnumber.items():
+                    by_nnumber[key] = row_index + offset
+                for key, row_index in part_by_icao24.items():
+                    by_icao24[key] = row_index + offset
                 
-                # Actual CSV column indices from FAA file:
-                # 0: N-NUMBER
-                # 1: SERIAL NUMBER
-                # 2: MFR MDL CODE
-                # 3: ENG MFR MDL
-                # 4: YEAR MFR
-                # 5: TYPE REGISTRANT
-                # 6: NAME
-                # 7-8: STREET, STREET2
-                # 9-14: CITY, STATE, ZIP, REGION, COUNTY, COUNTRY
-                # 15-16: LAST ACTION DATE, CERT ISSUE DATE
-                # 17: CERTIFICATION
-                # 18: TYPE AIRCRAFT  <-- This is what we need!
-                # 19: TYPE ENGINE
-                # 20: STATUS CODE
-                # 21: MODE S CODE (octal)
-                # 22: FRACT OWNER
-                # 23: AIR WORTH DATE
-                # 24-28: OTHER NAMES (1-5)
-                # 29: EXPIRATION DATE
-                # 30: UNIQUE ID
-                # 31: KIT MFR
-                # 32: KIT MODEL
-                # 33: MODE S CODE HEX  <-- This is the ICAO24!
-                
-                for row in reader:
-                    if len(row) < 21:  # Need at least through STATUS CODE
-                        continue
-                    
-                    n_number = row[0].strip().upper()
-                    mfr_model_code = row[2].strip() if len(row) > 2 else ''
-                    registrant = row[6].strip().upper() if len(row) > 6 else ''
-                    type_aircraft = row[18].strip() if len(row) > 18 else ''
-                    type_engine = row[19].strip() if len(row) > 19 else ''
-                    status_code = row[20].strip() if len(row) > 20 else ''
-                    
-                    # Mode S hex is in column 33
-                    mode_s_hex = ''
-                    if len(row) > 33:
-                        mode_s_hex = row[33].strip().upper()
-                    
-                    # Skip invalid/deregistered aircraft
-                    if status_code and status_code not in ('V', 'A', 'M', 'T', 'N', 'R', 'S'):
-                        continue
-                    
-                    if not n_number:
-                        continue
-                    
-                    # Skip header-like rows
-                    if n_number == 'N-NUMBER':
-                        continue
-                    
-                    # Look up reference info
-                    ref_info = acft_ref.get(mfr_model_code, {})
-                    
-                    # Determine our aircraft type
-                    aircraft_type = self._classify_type(type_aircraft, type_engine, ref_info)
-                    
-                    # Check if this is a cargo carrier by registrant name
-                    cargo_type = self._is_cargo_carrier(registrant)
-                    if cargo_type and aircraft_type in ('JET', 'TWIN'):
-                        aircraft_type = cargo_type  # UPS, FDX, AMAZON, DHL, or CARGO
-                    
-                    # Build info dict
-                    info = {
-                        'type': aircraft_type,
-                        'type_aircraft': type_aircraft,
-                        'type_engine': type_engine,
-                        'manufacturer': ref_info.get('manufacturer', ''),
-                        'model': ref_info.get('model', ''),
-                        'n_number': f"N{n_number}",
-                        'registrant': registrant,
-                        'is_cargo': bool(cargo_type),
-                        'cargo_carrier': cargo_type,
-                        'source': 'FAA'
-                    }
-                    
-                    # Store by N-number
-                    self.by_nnumber[n_number] = info
-                    
-                    # Store by ICAO24 hex if available
-                    if mode_s_hex:
-                        # Clean up hex - remove leading zeros for consistent lookup
-                        mode_s_hex = mode_s_hex.lstrip('0')
-                        if mode_s_hex:
-                            self.by_icao24[mode_s_hex] = info
-                    
-                    count += 1
-                    
-                    # Progress logging for large file
-                    if count % 50000 == 0:
-                        logger.debug(f"Processed {count:,} aircraft...")
+                count += part_count
+                logger.debug(f"Processed {count:,} aircraft...")
+            
+            complete = True
         
         except Exception as e:
             logger.error(f"Error parsing MASTER.txt: {e}")
             import traceback
             logger.error(traceback.format_exc())
         
+        self._publish(_FAATables(columns, n_numbers, strings, by_icao24, by_nnumber))
+        
+        if complete and cache_signature is not None:
+            self._save_cache(cache_signature, count)
         return count
     
-    def _classify_type(self, type_aircraft: str, type_engine: str, ref_info: Dict) -> str:
+    def _parse_master_parts(self, filepath: Path, acft_ref: Dict):
         """
-        Classify aircraft to our icon types based on FAA codes.
+        Parse MASTER.txt with polars, or else in PARSE_WORKERS byte ranges,
+        returning the partial tables in file order.
         
-        Priority:
-        1. Type aircraft code (most definitive)
-        2. Engine type for multi-engine (turbine = JET, piston = TWIN)
-        3. Default mapping
+        Falls back to parsing in this process with a single worker, or if
+        worker processes can't be started.
         """
-        # Rotorcraft is definitive
-        if type_aircraft == '6':
-            return 'HELO'
-        
-        # Gyroplane is also rotary wing
-        if type_aircraft == '9':
-            return 'HELO'
+        if POLARS_AVAILABLE:
+            try:
+                return [_parse_master_polars(str(filepath), acft_ref)]
+            except Exception as e:
+                logger.warning(f"polars could not read MASTER.txt ({e}), using the built-in parser")
         
-        # Single engine fixed wing - almost always GA
-        if type_aircraft == '4':
-            return 'GA'
-        
-        # Multi-engine fixed wing - distinguish TWIN (piston) from JET (turbine)
-        if type_aircraft == '5':
-            if type_engine in self.ENGINE_TURBINE_CODES:
-                return 'JET'   # Turboprop, turbojet, turbofan = JET icon
-            return 'TWIN'      # Piston twin (Baron, Seneca, etc.)
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Skip header row
+                header = mm.readline()
+                if header:
+                    logger.debug(f"MASTER.txt columns: {header.count(b',') + 1}")
+                
+                # Equal byte ranges, each extended to end on a line boundary
+                bounds = [mm.tell()]
+                for k in range(1, PARSE_WORKERS):
+                    newline = mm.find(b'\n', max(bounds[-1], size * k // PARSE_WORKERS))
+                    if newline < 0:
+                        break
+                    bounds.append(newline + 1)
+                bounds.append(size)
         
-        # Glider
-        if type_aircraft == '1':
-            return 'GLIDER'
+        ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+        if len(ranges) > 1:
+            try:
+                # Never fork: the display controller has live threads (and
+                # their locks) that a forked child would inherit mid-use
+                try:
+                    mp_context = multiprocessing.get_context('forkserver')
+                except ValueError:
+                    mp_context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=len(ranges), mp_context=mp_context) as executor:
+                    return list(executor.map(_parse_master_range, *zip(*[
+                        (str(filepath), start, end, acft_ref) for start, end in ranges])))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel MASTER.txt parse unavailable ({e}), parsing in-process")
         
-        # Balloon or Blimp
-        if type_aircraft in ('2', '3'):
-            return 'BALLOON'
+        return [_parse_master_range(str(filepath), bounds[0], size, acft_ref)]
+    
+    @staticmethod
+    def _record(tables: _FAATables, row_index: int) -> AircraftInfo:
+        """Build the read-only record for one row of the record columns."""
+        strings = tables.strings
+        columns = tables.columns
+        (aircraft_type, type_aircraft, type_engine, manufacturer, model,
+         registrant, cargo_type) = (strings[columns[field][row_index]] for field in STRING_FIELDS)
         
-        # Powered Parachute
-        if type_aircraft == '8':
-            return 'CHUTE'
+        return AircraftInfo(
+            type=aircraft_type,
+            type_aircraft=type_aircraft,
+            type_engine=type_engine,
+            manufacturer=manufacturer,
+            model=model,
+            n_number=f"N{tables.n_numbers[row_index].decode()}",
+            registrant=registrant,
+            is_cargo=bool(cargo_type),
+            cargo_carrier=cargo_type,
+            source='FAA'
+        )
+    
+    @classmethod
+    def _classify_type(cls, type_aircraft: str, type_engine: str, ref_info: Dict) -> str:
+        """
+        Classify aircraft to our icon types based on FAA codes.
         
-        # Use mapping for everything else
-        return self.TYPE_MAPPING.get(type_aircraft, 'UNK')
+        TYPE_MAPPING decides, except that PISTON_TYPE_MAPPING does for an
+        aircraft without a turbine engine (turboprop, turbojet, turbofan).
+        """
+        if type_engine not in cls.ENGINE_TURBINE_CODES and type_aircraft in cls.PISTON_TYPE_MAPPING:
+            return cls.PISTON_TYPE_MAPPING[type_aircraft]
+        return cls.TYPE_MAPPING.get(type_aircraft, 'UNK')
     
-    def _is_cargo_carrier(self, registrant: str) -> str:
+    @classmethod
+    def _is_cargo_carrier(cls, registrant: str) -> str:
         """
         Check if registrant name indicates a cargo carrier.
         
@@ -357,50 +846,52 @@ class FAADatabase:
         if not registrant:
             return ''
         
-        # Specific carriers with branded icons
-        if 'UNITED PARCEL' in registrant or 'UPS' in registrant:
-            return 'UPS'
-        
-        if 'FEDERAL EXPRESS' in registrant or 'FEDEX' in registrant:
-            return 'FDX'
-        
-        if 'AMAZON' in registrant or 'PRIME AIR' in registrant:
-            return 'AMAZON'
+        if AHOCORASICK_AVAILABLE:
+            automaton = cls._cargo_automaton
+            if automaton is None:
+                automaton = ahocorasick.Automaton()
+                for priority, (keyword, _) in enumerate(cls.CARGO_KEYWORDS):
+                    automaton.add_word(keyword, priority)
+                automaton.make_automaton()
+                cls._cargo_automaton = automaton
+            
+            best = None
+            for _, priority in automaton.iter(registrant):
+                if best is None or priority < best:
+                    best = priority
+            return cls.CARGO_KEYWORDS[best][1] if best is not None else ''
         
-        if 'DHL' in registrant:
-            return 'DHL'
+        match = cls._cargo_pattern.search(registrant)
+        if match is None:
+            return ''
         
-        # Atlas Air often flies for Amazon
-        if 'ATLAS AIR' in registrant:
-            return 'AMAZON'
+        # The regex finds the leftmost keyword; a higher-priority one could
+        # still appear later in the name
+        priority = cls._cargo_priority[match.group()]
+        for keyword, carrier in cls.CARGO_KEYWORDS[:priority]:
+            if keyword in registrant:
+                return carrier
+        return cls.CARGO_KEYWORDS[priority][1]
+    
+    @staticmethod
+    def _find_row(tables: _FAATables, icao24: str = None, callsign: str = None) -> Optional[int]:
+        """Row index in tables of the aircraft matching icao24 or an N-number callsign, or None."""
+        # Try ICAO24 first (most reliable)
+        if icao24:
+            row = tables.by_icao24.get(_icao24_key(icao24))
+            if row is not None:
+                return row
         
-        # ABX Air often flies for DHL/Amazon
-        if 'ABX AIR' in registrant:
-            return 'AMAZON'
+        # Try N-number from callsign
+        if callsign:
+            callsign_upper = callsign.upper().strip()
+            if callsign_upper.startswith('N'):
+                n_num = callsign_upper[1:].encode()  # Remove 'N' prefix
+                return tables.by_nnumber.get(n_num)
         
-        # Other cargo carriers -> generic CARGO
-        other_cargo = [
-            'KALITTA',
-            'CARGOLUX',
-            'POLAR AIR',
-            'SOUTHERN AIR',
-            'WESTERN GLOBAL',
-            'WORLD AIRWAYS',
-            'NIPPON CARGO',
-            'CATHAY CARGO',
-            'AIR TRANSPORT INT',
-            'AMERIJET',
-            'MARTINAIRE',
-            'EMPIRE AIRLINES',
-            'MOUNTAIN AIR CARGO',
-        ]
-        
-        if any(keyword in registrant for keyword in other_cargo):
-            return 'CARGO'
-        
-        return ''
-    
-    def lookup(self, icao24: str = None, callsign: str = None) -> Optional[Dict[str, Any]]:
+        return None
+    
+    def lookup(self, icao24: str = None, callsign: str = None) -> Optional[AircraftInfo]:
         """
         Look up aircraft information.
         
@@ -409,37 +900,33 @@ class FAADatabase:
             callsign: Aircraft callsign (if N-number format)
         
         Returns:
-            Dict with aircraft info, or None if not found
+            AircraftInfo (read-only; info.type, info.model, ...), or None if not found
         """
-        if not self._loaded:
+        tables = self._tables
+        row_index = self._find_row(tables, icao24, callsign)
+        if row_index is None:
             return None
-        
-        with self._lock:
-            # Try ICAO24 first (most reliable)
-            if icao24:
-                icao_upper = icao24.upper().lstrip('0')
-                if icao_upper in self.by_icao24:
-                    return self.by_icao24[icao_upper].copy()
-            
-            # Try N-number from callsign
-            if callsign:
-                callsign_upper = callsign.upper().strip()
-                if callsign_upper.startswith('N'):
-                    n_num = callsign_upper[1:]  # Remove 'N' prefix
-                    if n_num in self.by_nnumber:
-                        return self.by_nnumber[n_num].copy()
-        
-        return None
+        return self._record(tables, row_index)
+    
+    def lookup_dict(self, icao24: str = None, callsign: str = None) -> Optional[Dict[str, Any]]:
+        """lookup() as a dict (the format lookup() returned before AircraftInfo), or None if not found."""
+        info = self.lookup(icao24, callsign)
+        return info._asdict() if info is not None else None
     
     def get_aircraft_type(self, icao24: str = None, callsign: str = None) -> Optional[str]:
         """
         Quick lookup to get just the aircraft type.
         
+        Reads the type column directly, without building a record.
+        
         Returns:
             Type code ('GA', 'JET', 'HELO', etc.) or None if not found
         """
-        info = self.lookup(icao24=icao24, callsign=callsign)
-        return info.get('type') if info else None
+        tables = self._tables
+        row_index = self._find_row(tables, icao24, callsign)
+        if row_index is None:
+            return None
+        return tables.strings[tables.columns['type'][row_index]]
     
     def download_and_update(self, force: bool = False) -> bool:
         """
@@ -466,38 +953,34 @@ class FAADatabase:
         logger.info("Downloading FAA aircraft database (~60MB)...")
         
         try:
-            # Download zip file
-            zip_path = self.data_dir / "ReleasableAircraft.zip"
-            
+            # Download zip file into memory; only the files we need from it
+            # are written out (the parsers and parse cache work from them)
             response = requests.get(self.FAA_DATABASE_URL, stream=True, timeout=120)
             response.raise_for_status()
             
             total_size = int(response.headers.get('content-length', 0))
             downloaded = 0
             
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with io.BytesIO() as buf:
+                for chunks, chunk in enumerate(response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE), 1):
+                    buf.write(chunk)
                     downloaded += len(chunk)
-                    if total_size > 0 and downloaded % (1024 * 1024) == 0:
+                    if total_size > 0 and chunks % self.PROGRESS_EVERY_CHUNKS == 0:
                         pct = (downloaded / total_size) * 100
                         logger.debug(f"Download progress: {pct:.1f}%")
-            
-            logger.info(f"Downloaded {downloaded / (1024*1024):.1f} MB")
-            
-            # Extract required files
-            logger.info("Extracting FAA data files...")
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Extract only the files we need
-                for filename in ['MASTER.txt', 'ACFTREF.txt']:
-                    try:
-                        zf.extract(filename, self.data_dir)
-                        logger.debug(f"Extracted {filename}")
-                    except KeyError:
-                        logger.warning(f"File {filename} not found in archive")
-            
-            # Clean up zip file to save space
-            zip_path.unlink()
+                
+                logger.info(f"Downloaded {downloaded / (1024*1024):.1f} MB")
+                
+                # Extract required files
+                logger.info("Extracting FAA data files...")
+                with zipfile.ZipFile(buf, 'r') as zf:
+                    # Extract only the files we need
+                    for filename in ['MASTER.txt', 'ACFTREF.txt']:
+                        try:
+                            zf.extract(filename, self.data_dir)
+                            logger.debug(f"Extracted {filename}")
+                        except KeyError:
+                            logger.warning(f"File {filename} not found in archive")
             
             # Save metadata
             meta_file = self.data_dir / "metadata.json"
@@ -507,12 +990,10 @@ class FAADatabase:
                     'source': self.FAA_DATABASE_URL
                 }, f)
             
-            # Reload the database
+            # Reload the database; lookups keep using the old tables until
+            # the new ones are published
             with self._lock:
-                self.by_icao24.clear()
-                self.by_nnumber.clear()
-            
-            success = self._load_database()
+                success = self._load_database()
             
             if success:
                 logger.info("FAA database update complete!")
@@ -539,6 +1020,11 @@ class FAADatabase:
         }
 
 
+if FAST_EXT_AVAILABLE:
+    _fast_set_rules(FAADatabase.TYPE_MAPPING, FAADatabase.PISTON_TYPE_MAPPING,
+                    FAADatabase.ENGINE_TURBINE_CODES, FAADatabase.CARGO_KEYWORDS)
+
+
 # Global singleton instance
 _faa_db_instance = None
 _faa_db_lock = threading.Lock()
@@ -589,7 +1075,7 @@ if __name__ == '__main__':
         
         if result:
             print(f"\nAircraft Found:")
-            for key, value in result.items():
+            for key, value in result._asdict().items():
                 print(f"  {key}: {value}")
         else:
             print(f"\nNo aircraft found for: {query}")
@@ -0,0 +1,160 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled per-row classification for src/faa_database.py.
+
+FAADatabase._classify_type() and _is_cargo_carrier() run once for each of
+the ~300k rows in MASTER.txt. classify() gives the same answers from lookup
+tables indexed by the one-character FAA codes, plus a memmem() scan of the
+registrant for the cargo keywords, and returns both packed into one int:
+
+    type_codes()[packed & 255], cargo_codes()[packed >> 8]
+
+The tables are loaded by set_rules() from FAADatabase's TYPE_MAPPING,
+PISTON_TYPE_MAPPING, ENGINE_TURBINE_CODES and CARGO_KEYWORDS, so the rules
+themselves live only there. faa_database.py uses this module when it has
+been built (python3 scripts/build_aircraft_fast.py) and its pure Python
+versions otherwise.
+"""
+
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
+from libc.stdlib cimport free, malloc
+from libc.string cimport memset
+
+cdef extern from "string.h" nogil:
+    void *memmem(const void *haystack, size_t haystacklen,
+                 const void *needle, size_t needlelen)
+
+# Type tables, indexed by the ASCII code character (0 = not a one-character
+# ASCII code): index into _type_codes, or -1 in _piston_type for no override
+cdef int _type[128]
+cdef int _piston_type[128]
+cdef bint _turbine[128]
+cdef tuple _type_codes = ('UNK',)
+
+# Cargo keyword table in priority order; _keywords keeps the bytes alive for
+# the C pointers
+cdef list _keywords = []
+cdef tuple _cargo_codes = ('',)
+cdef const char **_keyword_ptrs = NULL
+cdef size_t *_keyword_lens = NULL
+cdef int *_keyword_cargo = NULL
+cdef int _keyword_count = 0
+
+memset(_type, 0, sizeof(_type))
+memset(_piston_type, -1, sizeof(_piston_type))
+memset(_turbine, 0, sizeof(_turbine))
+
+
+cdef int _ascii_code(str value) except -1:
+    if len(value) != 1 or ord(value) >= 128 or value == '\0':
+        raise ValueError(f"FAA code {value!r} is not one ASCII character")
+    return ord(value)
+
+
+def set_rules(type_mapping, piston_type_mapping, turbine_codes, cargo_keywords):
+    """
+    Load FAADatabase.TYPE_MAPPING, PISTON_TYPE_MAPPING, ENGINE_TURBINE_CODES
+    and CARGO_KEYWORDS ((keyword, carrier code) pairs in priority order) for
+    classify().
+    """
+    global _type_codes, _keywords, _cargo_codes
+    global _keyword_ptrs, _keyword_lens, _keyword_cargo, _keyword_count
+    cdef int i, n = len(cargo_keywords)
+    cdef int types[128]
+    cdef int piston_types[128]
+    cdef bint turbine[128]
+    cdef const char **ptrs
+    cdef size_t *lens
+    cdef int *cargo
+    cdef bytes data
+
+    # Validate and build everything before replacing any table
+    codes = ['UNK']
+    memset(types, 0, sizeof(types))
+    memset(piston_types, -1, sizeof(piston_types))
+    memset(turbine, 0, sizeof(turbine))
+    for code, aircraft_type in type_mapping.items():
+        if aircraft_type not in codes:
+            codes.append(aircraft_type)
+        types[_ascii_code(code)] = codes.index(aircraft_type)
+    for code, aircraft_type in piston_type_mapping.items():
+        if aircraft_type not in codes:
+            codes.append(aircraft_type)
+        piston_types[_ascii_code(code)] = codes.index(aircraft_type)
+    for code in turbine_codes:
+        turbine[_ascii_code(code)] = True
+    if len(codes) > 256:
+        raise ValueError("more than 256 aircraft types")
+
+    ptrs = <const char **>malloc(n * sizeof(char *))
+    lens = <size_t *>malloc(n * sizeof(size_t))
+    cargo = <int *>malloc(n * sizeof(int))
+    if not ptrs or not lens or not cargo:
+        free(ptrs)
+        free(lens)
+        free(cargo)
+        raise MemoryError()
+
+    carriers = ['']
+    encoded = []
+    for i, (keyword, carrier) in enumerate(cargo_keywords):
+        if carrier not in carriers:
+            carriers.append(carrier)
+        data = keyword.encode('utf-8')
+        encoded.append(data)
+        ptrs[i] = data
+        lens[i] = len(data)
+        cargo[i] = carriers.index(carrier)
+
+    for i in range(128):
+        _type[i] = types[i]
+        _piston_type[i] = piston_types[i]
+        _turbine[i] = turbine[i]
+    _type_codes = tuple(codes)
+
+    free(_keyword_ptrs)
+    free(_keyword_lens)
+    free(_keyword_cargo)
+    _keywords = encoded
+    _cargo_codes = tuple(carriers)
+    _keyword_ptrs, _keyword_lens, _keyword_cargo, _keyword_count = ptrs, lens, cargo, n
+
+
+def type_codes():
+    """Aircraft type for each value of packed & 255."""
+    return _type_codes
+
+
+def cargo_codes():
+    """Cargo carrier code for each value of packed >> 8 ('' = not cargo)."""
+    return _cargo_codes
+
+
+cdef inline int _code(str value):
+    # Table index of a one-character ASCII code; anything else matches no
+    # table entry (set_rules only accepts such codes)
+    if len(value) != 1:
+        return 0
+    cdef Py_UCS4 c = value[0]
+    return c if c < 128 else 0
+
+
+cpdef int classify(str type_aircraft, str type_engine, str registrant):
+    """FAADatabase._classify_type() | _is_cargo_carrier() << 8 for one row."""
+    cdef int code = _code(type_aircraft)
+    cdef int aircraft_type = _type[code]
+    cdef Py_ssize_t length
+    cdef const char *text
+    cdef int i
+
+    if _piston_type[code] >= 0 and not _turbine[_code(type_engine)]:
+        aircraft_type = _piston_type[code]
+
+    if not registrant:
+        return aircraft_type
+
+    text = PyUnicode_AsUTF8AndSize(registrant, &length)
+    for i in range(_keyword_count):
+        if memmem(text, length, _keyword_ptrs[i], _keyword_lens[i]) != NULL:
+            return aircraft_type | _keyword_cargo[i] << 8
+    return aircraft_type
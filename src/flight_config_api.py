@@ -394,13 +394,17 @@ def register_flight_config_routes(app):
             # Import shared lookup module (plugin-portable!)
             has_enrichment = False
             try:
-                from src.aircraft_lookup import lookup_aircraft_info, infer_aircraft_type, calculate_bearing
+                from src.aircraft_lookup import (
+                    lookup_aircraft_info_bulk, infer_aircraft_type, calculate_bearings, calculate_distances_km
+                )
                 has_enrichment = True
             except ImportError:
                 logger.warning("aircraft_lookup module not available - basic data only")
                 # Define fallback functions
-                def lookup_aircraft_info(icao24):
-                    return {}
+                def lookup_aircraft_info_bulk(icao24s):
+                    empty = [None] * len(icao24s)
+                    return {field: empty for field in
+                            ('display_type', 'typecode', 'registration', 'operator', 'source')}
                 def infer_aircraft_type(callsign, alt, spd, icao):
                     return 'UNK'
                 def calculate_bearing(hlat, hlon, tlat, tlon):
@@ -411,13 +415,23 @@ def register_flight_config_routes(app):
                         angle += 360
                     directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
                     return directions[int((angle + 22.5) / 45) % 8]
-            
-            flights = []
+                def calculate_bearings(hlat, hlon, tlats, tlons):
+                    return [calculate_bearing(hlat, hlon, tlat, tlon) for tlat, tlon in zip(tlats, tlons)]
+                def calculate_distances_km(hlat, hlon, tlats, tlons):
+                    distances = []
+                    for tlat, tlon in zip(tlats, tlons):
+                        dx = (tlon - hlon) * 111.0 * math.cos(math.radians(hlat))
+                        dy = (tlat - hlat) * 111.0
+                        distances.append(math.sqrt(dx * dx + dy * dy))
+                    return distances
+            
+            # First pass: drop incomplete / ground states
+            candidates = []
             for state in (states or []):
                 icao24 = state[0]
                 callsign = state[1]
                 if callsign:
-                    callsign = callsign.strip()
+                    callsign = callsign.strip().upper()
                 
                 lon = state[5]
                 lat = state[6]
@@ -431,21 +445,25 @@ def register_flight_config_routes(app):
                 if on_ground or (altitude_m and altitude_m < min_altitude_m):
                     continue
                 
-                # Calculate distance
-                dx = (lon - home_lon) * 111.0 * math.cos(math.radians(home_lat))
-                dy = (lat - home_lat) * 111.0
-                distance_km = math.sqrt(dx * dx + dy * dy)
-                
+                candidates.append((icao24, callsign, lon, lat, altitude_m, velocity))
+            
+            # Distance, direction and aircraft info for the whole sweep in one
+            # call each (info comes back as one list per field)
+            cand_lats = [c[3] for c in candidates]
+            cand_lons = [c[2] for c in candidates]
+            distances = calculate_distances_km(home_lat, home_lon, cand_lats, cand_lons)
+            directions = calculate_bearings(home_lat, home_lon, cand_lats, cand_lons)
+            aircraft_info = lookup_aircraft_info_bulk([c[0] for c in candidates])
+            
+            flights = []
+            for i, ((icao24, callsign, lon, lat, altitude_m, velocity), distance_km, direction) in enumerate(zip(
+                    candidates, distances, directions)):
                 # Convert units
                 altitude_ft = int(altitude_m * 3.28084) if altitude_m else None
                 speed_knots = int(velocity * 1.94384) if velocity else None
                 distance_miles = distance_km * 0.621371
                 
-                # Calculate direction
-                direction = calculate_bearing(home_lat, home_lon, lat, lon)
-                
                 # Enrich with database lookups
-                aircraft_info = lookup_aircraft_info(icao24)
                 aircraft_type = infer_aircraft_type(callsign, altitude_ft, speed_knots, icao24)
                 
                 flights.append({
@@ -457,10 +475,10 @@ def register_flight_config_routes(app):
                     'direction': direction,
                     'speed_knots': speed_knots,
                     'aircraft_type': aircraft_type,
-                    'display_type': aircraft_info.get('display_type'),
-                    'typecode': aircraft_info.get('typecode'),
-                    'registration': aircraft_info.get('registration'),
-                    'operator': aircraft_info.get('operator')
+                    'display_type': aircraft_info['display_type'][i],
+                    'typecode': aircraft_info['typecode'][i],
+                    'registration': aircraft_info['registration'][i],
+                    'operator': aircraft_info['operator'][i]
                 })
             
             # Sort by distance
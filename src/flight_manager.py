@@ -3,6 +3,7 @@ import time
 import math
 import threading
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict, Any, List, Tuple, Optional
 from PIL import Image, ImageDraw, ImageFont
 import logging
@@ -22,6 +23,28 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+COMPASS_DIRECTIONS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+
+# Aircraft type code -> icon filename in assets/logos/aircraft (read-only)
+AIRCRAFT_ICON_FILES = MappingProxyType({
+    'JET': 'jet.png',
+    'MIL': 'military.png',
+    'HELO': 'helicopter.png',
+    'GA': 'ga.png',
+    'UNK': 'unknown.png',
+    'MIL_HELO': 'military_helicopter.png',
+    'STAR': 'star.png',
+    'GLIDER': 'glider.png',
+    'TWIN': 'twin.png',
+    'BALLOON': 'balloon.png',
+    'CHUTE': 'parachute.png',
+    'CARGO': 'cargo.png',
+    'UPS': 'ups.png',
+    'FDX': 'fedex.png',
+    'AMAZON': 'amazon.png',
+    'DHL': 'dhl.png'
+})
+
 class FlightLiveManager:
     """
     LIVE Flight Tracker - Interrupts display when flights are overhead.
@@ -48,6 +71,8 @@ class FlightLiveManager:
         self.enabled = self.flight_config.get('enabled', False)
         self.home_lat = self.flight_config.get('home_lat', 41.6)  # Des Moines area default
         self.home_lon = self.flight_config.get('home_lon', -93.6)
+        # Longitude scale at home, shared by every distance/bearing in a sweep
+        self._cos_home_lat = math.cos(math.radians(self.home_lat))
         self.radius_km = self.flight_config.get('radius_km', 8.0)  # Default ~5 miles
         
         # OAuth2 credentials
@@ -265,7 +290,7 @@ class FlightLiveManager:
         lat_delta = self.radius_km / 111.0
         
         # Longitude degrees vary with latitude: 1 degree ≈ 111 * cos(latitude) km
-        lon_delta = self.radius_km / (111.0 * math.cos(math.radians(self.home_lat)))
+        lon_delta = self.radius_km / (111.0 * self._cos_home_lat)
         
         lat_min = self.home_lat - lat_delta
         lat_max = self.home_lat + lat_delta
@@ -279,7 +304,7 @@ class FlightLiveManager:
         Calculate approximate distance in km from home to given coordinates.
         Uses simple Euclidean approximation (good enough for small distances).
         """
-        dx = (lon - self.home_lon) * 111.0 * math.cos(math.radians(self.home_lat))
+        dx = (lon - self.home_lon) * 111.0 * self._cos_home_lat
         dy = (lat - self.home_lat) * 111.0
         return math.sqrt(dx*dx + dy*dy)
 
@@ -289,7 +314,7 @@ class FlightLiveManager:
         Returns cardinal/intercardinal direction (N, NE, E, SE, S, SW, W, NW).
         """
         # Calculate bearing angle
-        dx = (lon - self.home_lon) * math.cos(math.radians(self.home_lat))
+        dx = (lon - self.home_lon) * self._cos_home_lat
         dy = lat - self.home_lat
         
         # Get angle in degrees (0 = North, 90 = East, etc.)
@@ -298,9 +323,8 @@ class FlightLiveManager:
             angle += 360
         
         # Convert to 8-point compass
-        directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
         index = int((angle + 22.5) / 45) % 8
-        return directions[index]
+        return COMPASS_DIRECTIONS[index]
     def _load_aircraft_icons(self):
         """Load aircraft type icons from assets directory."""
         icon_dir = None
@@ -317,33 +341,14 @@ class FlightLiveManager:
         if not icon_dir:
             self.logger.warning("Aircraft icons directory not found")
             return
-        icon_files = {
-            'JET': 'jet.png',
-            'MIL': 'military.png',
-            'HELO': 'helicopter.png',
-            'GA': 'ga.png',
-            'UNK': 'unknown.png',
-            'MIL_HELO': 'military_helicopter.png',
-            'STAR': 'star.png',
-            'GLIDER': 'glider.png',
-            'TWIN': 'twin.png',
-            'BALLOON': 'balloon.png',
-            'CHUTE': 'parachute.png',
-            'CARGO': 'cargo.png',
-            'UPS': 'ups.png',
-            'FDX': 'fedex.png',
-            'AMAZON': 'amazon.png',
-            'DHL': 'dhl.png'
-        }
-        
-        for type_code, filename in icon_files.items():
+        for type_code, filename in AIRCRAFT_ICON_FILES.items():
             icon_path = icon_dir / filename
             if icon_path.exists():
                 try:
                     icon = Image.open(icon_path).convert('RGBA')
-                    # Resize to 16x16 if needed
-                    if icon.size != (16, 16):
-                        icon = icon.resize((16, 16), Image.LANCZOS)
+                    # Resize once to the 12x12 draw size so rendering can paste directly
+                    if icon.size != (12, 12):
+                        icon = icon.resize((12, 12), Image.LANCZOS)
                     self.aircraft_icons[type_code] = icon
                     self.logger.debug(f"Loaded aircraft icon: {type_code}")
                 except Exception as e:
@@ -425,7 +430,7 @@ class FlightLiveManager:
                         icao24 = state[0]
                         callsign = state[1]
                         if callsign:
-                            callsign = callsign.strip()
+                            callsign = callsign.strip().upper()
                         
                         lon = state[5]
                         lat = state[6]
@@ -461,7 +466,7 @@ class FlightLiveManager:
                             'altitude_ft': altitude_ft,
                             'altitude_m': altitude_m,
                             'distance_km': distance_km,
-                            'direction': calculate_bearing(self.home_lat, self.home_lon, lat, lon),
+                            'direction': calculate_bearing(self.home_lat, self.home_lon, lat, lon, self._cos_home_lat),
                             'aircraft_type': infer_aircraft_type(callsign, altitude_ft, speed_knots, icao24),
                             'display_type': aircraft_info.get('display_type'),  # e.g., "Boeing 737-824"
                             'typecode': aircraft_info.get('typecode'),          # e.g., "B738"
@@ -698,7 +703,7 @@ class FlightLiveManager:
         # Check if military aircraft (show star prefix)
         is_military = aircraft_type in ('MIL', 'MIL_HELO')
         
-        # Get aircraft icon (will be resized to 12x12)
+        # Get aircraft icon (pre-resized to 12x12 at load time)
         icon = self.aircraft_icons.get(aircraft_type)
         star_icon = self.aircraft_icons.get('STAR') if is_military else None
         
@@ -717,14 +722,12 @@ class FlightLiveManager:
         
         # Draw star icon first if military
         if star_icon:
-            small_star = star_icon.resize((12, 12), Image.LANCZOS) if star_icon.size != (12, 12) else star_icon
-            img.paste(small_star, (current_x, 1), small_star if small_star.mode == 'RGBA' else None)
+            img.paste(star_icon, (current_x, 1), star_icon)
             current_x += star_width + star_spacing
         
-        # Draw aircraft icon if available (resize to 12x12)
+        # Draw aircraft icon if available
         if icon:
-            small_icon = icon.resize((12, 12), Image.LANCZOS) if icon.size != (12, 12) else icon
-            img.paste(small_icon, (current_x, 1), small_icon if small_icon.mode == 'RGBA' else None)
+            img.paste(icon, (current_x, 1), icon)
             current_x += icon_width + icon_spacing
         
         # Draw callsign
@@ -18,6 +18,7 @@ import requests
 import time
 import math
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict, Any, List, Tuple, Optional
 from PIL import Image, ImageDraw, ImageFont
 import logging
@@ -75,6 +76,43 @@ class FlightLiveManager:
     
     HELO_CALLSIGNS = {'LIFE', 'MEDEVAC', 'MERCY', 'ANGEL', 'RESCUE', 'HELI'}
     
+    # Manufacturer substring -> short display name, checked in order
+    MANUFACTURER_SHORTCUTS = (
+        ('BOEING', 'Boeing'),
+        ('AIRBUS', 'Airbus'),
+        ('CESSNA', 'Cessna'),
+        ('PIPER', 'Piper'),
+        ('BEECHCRAFT', 'Beech'),
+        ('BOMBARDIER', 'Bombardier'),
+        ('EMBRAER', 'Embraer'),
+        ('GULFSTREAM', 'Gulfstream'),
+        ('LEARJET', 'Learjet'),
+        ('CIRRUS', 'Cirrus'),
+        ('ROBINSON', 'Robinson'),
+        ('BELL', 'Bell'),
+        ('SIKORSKY', 'Sikorsky'),
+        ('EUROCOPTER', 'Eurocopter'),
+        ('TEXTRON', 'Textron'),
+        ('RAYTHEON', 'Raytheon'),
+        ('DE HAVILLAND', 'DHC'),
+        ('DE HAVILLAND CANADA', 'DHC'),
+        ('LOCKHEED', 'Lockheed'),
+        ('MCDONNELL DOUGLAS', 'MD'),
+    )
+    
+    COMPASS_DIRECTIONS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+    
+    # Aircraft type -> icon filename in assets/logos/aircraft (read-only)
+    ICON_FILES = MappingProxyType({
+        'JET': 'jet.png',
+        'MIL': 'military.png',
+        'HELO': 'helicopter.png',
+        'MIL_HELO': 'military_helicopter.png',  # Military helicopter
+        'GA': 'ga.png',
+        'UNK': 'unknown.png',
+        'STAR': 'star.png',  # Military prefix indicator
+    })
+    
     def __init__(self, config: Dict[str, Any], display_manager, cache_manager):
         self.config = config
         self.display_manager = display_manager
@@ -87,6 +125,8 @@ class FlightLiveManager:
         self.enabled = self.flight_config.get('enabled', False)
         self.home_lat = self.flight_config.get('home_lat', 41.6)  # Des Moines area default
         self.home_lon = self.flight_config.get('home_lon', -93.6)
+        # Longitude scale at home, shared by every distance/bearing in a sweep
+        self._cos_home_lat = math.cos(math.radians(self.home_lat))
         self.radius_km = self.flight_config.get('radius_km', 8.0)  # Default ~5 miles
         
         # OAuth2 credentials
@@ -181,7 +221,10 @@ class FlightLiveManager:
         for db_path in db_paths:
             if os.path.exists(db_path):
                 try:
-                    self.aircraft_db = AircraftDatabase(db_path)
+                    # Opt-in: copy the ~50MB database into RAM to avoid SD card reads
+                    self.aircraft_db = AircraftDatabase(
+                        db_path, in_memory=self.flight_config.get('aircraft_db_in_memory', False)
+                    )
                     if self.aircraft_db.is_ready():
                         self.logger.info(f"Aircraft database loaded: {db_path}")
                         return
@@ -198,17 +241,7 @@ class FlightLiveManager:
             # Try alternate location
             icons_dir = Path(os.path.expanduser("~/LEDMatrix/assets/logos/aircraft"))
         
-        icon_files = {
-            'JET': 'jet.png',
-            'MIL': 'military.png',
-            'HELO': 'helicopter.png',
-            'MIL_HELO': 'military_helicopter.png',  # Military helicopter
-            'GA': 'ga.png',
-            'UNK': 'unknown.png',
-            'STAR': 'star.png',  # Military prefix indicator
-        }
-        
-        for icon_type, filename in icon_files.items():
+        for icon_type, filename in self.ICON_FILES.items():
             icon_path = icons_dir / filename
             if icon_path.exists():
                 try:
@@ -275,7 +308,7 @@ class FlightLiveManager:
     def _calculate_bounding_box(self) -> Tuple[float, float, float, float]:
         """Calculate bounding box for API query."""
         lat_delta = self.radius_km / 111.0
-        lon_delta = self.radius_km / (111.0 * math.cos(math.radians(self.home_lat)))
+        lon_delta = self.radius_km / (111.0 * self._cos_home_lat)
         
         return (
             self.home_lat - lat_delta,
@@ -286,7 +319,7 @@ class FlightLiveManager:
     
     def _calculate_distance(self, lat: float, lon: float) -> float:
         """Calculate approximate distance in km from home to given coordinates."""
-        dx = (lon - self.home_lon) * 111.0 * math.cos(math.radians(self.home_lat))
+        dx = (lon - self.home_lon) * 111.0 * self._cos_home_lat
         dy = (lat - self.home_lat) * 111.0
         return math.sqrt(dx*dx + dy*dy)
     
@@ -300,15 +333,14 @@ class FlightLiveManager:
         lat2 = math.radians(lat)
         
         x = math.sin(d_lon) * math.cos(lat2)
-        y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(d_lon)
+        y = self._cos_home_lat * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(d_lon)
         
         bearing = math.degrees(math.atan2(x, y))
         bearing = (bearing + 360) % 360
         
         # Convert to compass direction
-        directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
         index = round(bearing / 45) % 8
-        return directions[index]
+        return self.COMPASS_DIRECTIONS[index]
     
     def _infer_aircraft_type(self, callsign: str, altitude_ft: Optional[int], 
                              speed_knots: Optional[int]) -> str:
@@ -432,31 +464,8 @@ class FlightLiveManager:
     
     def _shorten_manufacturer(self, manufacturer: str) -> str:
         """Shorten manufacturer names for LED display."""
-        shortcuts = {
-            'BOEING': 'Boeing',
-            'AIRBUS': 'Airbus',
-            'CESSNA': 'Cessna',
-            'PIPER': 'Piper',
-            'BEECHCRAFT': 'Beech',
-            'BOMBARDIER': 'Bombardier',
-            'EMBRAER': 'Embraer',
-            'GULFSTREAM': 'Gulfstream',
-            'LEARJET': 'Learjet',
-            'CIRRUS': 'Cirrus',
-            'ROBINSON': 'Robinson',
-            'BELL': 'Bell',
-            'SIKORSKY': 'Sikorsky',
-            'EUROCOPTER': 'Eurocopter',
-            'TEXTRON': 'Textron',
-            'RAYTHEON': 'Raytheon',
-            'DE HAVILLAND': 'DHC',
-            'DE HAVILLAND CANADA': 'DHC',
-            'LOCKHEED': 'Lockheed',
-            'MCDONNELL DOUGLAS': 'MD',
-        }
-        
         upper = manufacturer.upper()
-        for long_name, short_name in shortcuts.items():
+        for long_name, short_name in self.MANUFACTURER_SHORTCUTS:
             if long_name in upper:
                 return short_name
         
@@ -578,7 +587,7 @@ class FlightLiveManager:
                         icao24 = state[0]
                         callsign = state[1]
                         if callsign:
-                            callsign = callsign.strip()
+                            callsign = callsign.strip().upper()
                         
                         lon = state[5]
                         lat = state[6]
@@ -628,14 +637,17 @@ class FlightLiveManager:
                             'timestamp': current_time
                         }
                         
-                        # Enrich with aircraft database info
-                        flight = self._enrich_flight_data(flight)
-                        
                         new_live_flights.append(flight)
                         
                         if len(new_live_flights) >= self.max_flights:
                             break
                     
+                    # Enrich with aircraft database info; one batched query
+                    # warms the lookup cache for every kept flight
+                    if self.aircraft_db and self.aircraft_db.is_ready():
+                        self.aircraft_db.lookup_many(f['icao24'] for f in new_live_flights)
+                    new_live_flights = [self._enrich_flight_data(f) for f in new_live_flights]
+                    
                     # Sort by distance (closest first)
                     new_live_flights.sort(key=lambda f: f['distance_km'])
                 
@@ -90,8 +90,8 @@ class BaseNCAAFBManager(Football):
         # Expand ranking tokens (AP_TOP_25, CFP_TOP_12, etc.) in favorite_teams
         if RANKINGS_AVAILABLE and self.favorite_teams:
             original_count = len(self.favorite_teams)
-            self.favorite_teams = RankingsService.expand_favorite_teams(
-                self.favorite_teams,
+            self.favorite_teams = RankingsService.expand_favorite_teams_cached(
+                tuple(self.favorite_teams),
                 'ncaa_fb'
             )
             if len(self.favorite_teams) != original_count:
@@ -108,8 +108,8 @@ class BaseNCAAWBasketballManager(Basketball):
         # Expand ranking tokens (AP_TOP_25, AP_TOP_10) if rankings service available
         if RANKINGS_AVAILABLE and hasattr(self, 'favorite_teams') and self.favorite_teams:
             original_count = len(self.favorite_teams)
-            self.favorite_teams = RankingsService.expand_favorite_teams(
-                self.favorite_teams, 
+            self.favorite_teams = RankingsService.expand_favorite_teams_cached(
+                tuple(self.favorite_teams),
                 'ncaaw_basketball'
             )
             if len(self.favorite_teams) != original_count:
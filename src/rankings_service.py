@@ -32,7 +32,7 @@ import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import requests
 
 logger = logging.getLogger(__name__)
@@ -61,6 +61,7 @@ RANKING_TOKENS = {
 
 # Cache settings
 DEFAULT_CACHE_DURATION = 3600  # 1 hour - rankings don't change often
+EXPANSION_CACHE_DURATION = 600  # 10 minutes - shared by managers of the same sport
 CACHE_DIR = Path('/var/cache/ledmatrix/rankings')
 FALLBACK_CACHE_DIR = Path('/tmp/ledmatrix_rankings_cache')
 
@@ -146,6 +147,7 @@ class RankingsService:
     
     _cache = RankingsCache()
     _rankings_data: Dict[str, Dict] = {}  # In-memory cache for current session
+    _expansion_cache: Dict[tuple, tuple] = {}  # (favorites, sport) -> (timestamp, expanded)
     
     @classmethod
     def fetch_rankings(cls, sport: str, force_refresh: bool = False) -> Optional[Dict]:
@@ -325,6 +327,37 @@ class RankingsService:
         
         return result
     
+    @classmethod
+    def expand_favorite_teams_cached(
+        cls,
+        favorite_teams: Tuple[str, ...],
+        sport: str,
+        max_age: int = EXPANSION_CACHE_DURATION
+    ) -> List[str]:
+        """
+        Cached version of expand_favorite_teams().
+        
+        Live/recent/upcoming managers for the same sport all expand the same
+        favorite_teams during __init__, so the expansion is shared process-wide
+        for up to max_age seconds.
+        
+        Args:
+            favorite_teams: Tuple of team abbreviations and/or ranking tokens
+            sport: Sport identifier for looking up rankings
+            max_age: Seconds an expansion stays valid
+            
+        Returns:
+            A new list with tokens replaced by actual team abbreviations
+        """
+        cache_key = (tuple(favorite_teams), sport)
+        cached = cls._expansion_cache.get(cache_key)
+        if cached and time.time() - cached[0] <= max_age:
+            return list(cached[1])
+        
+        expanded = cls.expand_favorite_teams(list(favorite_teams), sport)
+        cls._expansion_cache[cache_key] = (time.time(), tuple(expanded))
+        return expanded
+    
     @classmethod
     def is_ranking_token(cls, value: str) -> bool:
         """Check if a value is a ranking token."""
@@ -356,6 +389,7 @@ class RankingsService:
     def clear_cache(cls):
         """Clear all cached rankings data."""
         cls._rankings_data.clear()
+        cls._expansion_cache.clear()
         logger.info("Rankings cache cleared")
 
 
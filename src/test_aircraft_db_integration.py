@@ -150,7 +150,8 @@ def test_display_string():
     rows = cursor.fetchall()
     
     for row in rows:
-        icao24 = row[0]
+        # icao24 is a 3-byte BLOB in current databases, TEXT in older ones
+        icao24 = row[0].hex() if isinstance(row[0], bytes) else row[0]
         display = db.get_display_string(icao24, max_length=25)
         print(f"  {icao24}: {display}")
         print(f"    Raw: {row[1]} {row[2]} ({row[3]}) - {row[4]}")
@@ -176,7 +177,7 @@ def test_cache_performance():
     
     # Get a sample of icao24 codes
     cursor = db.conn.execute("SELECT icao24 FROM aircraft LIMIT 100")
-    codes = [row[0] for row in cursor.fetchall()]
+    codes = [row[0].hex() if isinstance(row[0], bytes) else row[0] for row in cursor.fetchall()]
     
     # First pass - cold cache
     start = time.time()
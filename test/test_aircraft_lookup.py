@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src/aircraft_lookup.py: the compass bearing helpers, the
+memoized aircraft type inference and the haversine distance mode.
+
+Each of the 8 compass sectors is 45 degrees wide and centered on its
+direction, so the boundaries sit at 22.5, 67.5, ... 337.5 degrees. Every
+boundary is checked just before and just after it (16 cases) on each
+bearing path: calculate_bearing (compiled and pure Python),
+calculate_bearings (NumPy and loop fallback) and aircraft_fast.bearing_index.
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import aircraft_lookup
+from src.aircraft_lookup import _DIRECTIONS, calculate_bearing, calculate_bearings, cos_home_lat
+
+HOME_LAT, HOME_LON = 41.5868, -93.6250
+EPSILON = 1e-6  # degrees of bearing either side of a boundary
+
+# (bearing in degrees, expected direction) just before and after each boundary
+BOUNDARY_CASES = [
+    case
+    for k in range(8)
+    for case in (
+        (22.5 + 45 * k - EPSILON, _DIRECTIONS[k]),
+        (22.5 + 45 * k + EPSILON, _DIRECTIONS[(k + 1) % 8]),
+    )
+]
+BOUNDARY_IDS = [f"{bearing:.6f}-{direction}" for bearing, direction in BOUNDARY_CASES]
+
+
+def _target(bearing_deg, reach_deg=0.5):
+    """Coordinates reach_deg (of latitude) from home at the given compass bearing."""
+    theta = math.radians(bearing_deg)
+    dx = math.sin(theta) * reach_deg
+    dy = math.cos(theta) * reach_deg
+    return HOME_LAT + dy, HOME_LON + dx / cos_home_lat(HOME_LAT)
+
+
+def test_boundary_cases_cover_all_sectors():
+    """Test that the 16 boundary cases land in every direction twice"""
+    assert len(BOUNDARY_CASES) == 16
+    directions = [direction for _, direction in BOUNDARY_CASES]
+    assert all(directions.count(direction) == 2 for direction in _DIRECTIONS)
+
+
+@pytest.mark.parametrize("bearing,expected", BOUNDARY_CASES, ids=BOUNDARY_IDS)
+def test_calculate_bearing_sector_boundaries(bearing, expected):
+    """Test calculate_bearing on either side of each sector boundary"""
+    lat, lon = _target(bearing)
+    assert calculate_bearing(HOME_LAT, HOME_LON, lat, lon) == expected
+    assert calculate_bearing(HOME_LAT, HOME_LON, lat, lon, cos_home_lat(HOME_LAT)) == expected
+
+
+@pytest.mark.parametrize("bearing,expected", BOUNDARY_CASES, ids=BOUNDARY_IDS)
+def test_calculate_bearing_python_sector_boundaries(monkeypatch, bearing, expected):
+    """Test the pure Python calculate_bearing path when aircraft_fast is not built"""
+    monkeypatch.setattr(aircraft_lookup, 'FAST_EXT_AVAILABLE', False)
+    lat, lon = _target(bearing)
+    assert calculate_bearing(HOME_LAT, HOME_LON, lat, lon) == expected
+
+
+@pytest.mark.skipif(not aircraft_lookup.NUMPY_AVAILABLE, reason="numpy not installed")
+def test_calculate_bearings_sector_boundaries():
+    """Test that the NumPy sweep matches every boundary case in one call"""
+    targets = [_target(bearing) for bearing, _ in BOUNDARY_CASES]
+    lats = [lat for lat, _ in targets]
+    lons = [lon for _, lon in targets]
+    assert calculate_bearings(HOME_LAT, HOME_LON, lats, lons) == [
+        direction for _, direction in BOUNDARY_CASES]
+
+
+def test_calculate_bearings_fallback_sector_boundaries(monkeypatch):
+    """Test the calculate_bearings loop used when numpy is not installed"""
+    monkeypatch.setattr(aircraft_lookup, 'NUMPY_AVAILABLE', False)
+    targets = [_target(bearing) for bearing, _ in BOUNDARY_CASES]
+    lats = [lat for lat, _ in targets]
+    lons = [lon for _, lon in targets]
+    assert calculate_bearings(HOME_LAT, HOME_LON, lats, lons) == [
+        direction for _, direction in BOUNDARY_CASES]
+
+
+@pytest.mark.skipif(not aircraft_lookup.FAST_EXT_AVAILABLE,
+                    reason="aircraft_fast not built (scripts/build_aircraft_fast.py)")
+@pytest.mark.parametrize("bearing,expected", BOUNDARY_CASES, ids=BOUNDARY_IDS)
+def test_fast_bearing_index_sector_boundaries(bearing, expected):
+    """Test aircraft_fast.bearing_index on either side of each sector boundary"""
+    from src.aircraft_fast import bearing_index
+    lat, lon = _target(bearing)
+    index = bearing_index(HOME_LAT, HOME_LON, lat, lon, cos_home_lat(HOME_LAT))
+    assert _DIRECTIONS[index] == expected
+
+
+def test_calculate_bearing_cardinal_directions():
+    """Test that targets due N/E/S/W of home get the cardinal directions"""
+    assert calculate_bearing(HOME_LAT, HOME_LON, HOME_LAT + 1, HOME_LON) == 'N'
+    assert calculate_bearing(HOME_LAT, HOME_LON, HOME_LAT, HOME_LON + 1) == 'E'
+    assert calculate_bearing(HOME_LAT, HOME_LON, HOME_LAT - 1, HOME_LON) == 'S'
+    assert calculate_bearing(HOME_LAT, HOME_LON, HOME_LAT, HOME_LON - 1) == 'W'
+
+
+class FakeFAADatabase:
+    """FAA database stand-in that finishes loading when told to."""
+
+    def __init__(self):
+        self.ready = False
+
+    def is_ready(self):
+        return self.ready
+
+    def get_aircraft_type(self, icao24=None, callsign=None):
+        return 'HELO'
+
+
+def test_infer_aircraft_type_uses_faa_once_ready(monkeypatch):
+    """Test that heuristic answers memoized while the FAA database loads aren't reused after"""
+    faa_db = FakeFAADatabase()
+    monkeypatch.setattr(aircraft_lookup, '_get_faa_db', lambda: faa_db)
+    monkeypatch.setattr(aircraft_lookup, '_cached_faa_db', None)
+    aircraft_lookup.clear_caches()
+
+    assert aircraft_lookup.infer_aircraft_type('N12345', 3000, 100, 'a12345') == 'GA'
+    faa_db.ready = True
+    assert aircraft_lookup.infer_aircraft_type('N12345', 3000, 100, 'a12345') == 'HELO'
+    aircraft_lookup.clear_caches()
+
+
+def test_haversine_distances_agree(monkeypatch):
+    """Test that the AIRCRAFT_USE_HAVERSINE scalar and sweep paths give the same distances"""
+    monkeypatch.setattr(aircraft_lookup, 'USE_HAVERSINE', True)
+    targets = [_target(bearing, reach_deg=3.0) for bearing, _ in BOUNDARY_CASES]
+    lats = [lat for lat, _ in targets]
+    lons = [lon for _, lon in targets]
+
+    expected = [aircraft_lookup.calculate_distance_km(HOME_LAT, HOME_LON, lat, lon) for lat, lon in targets]
+    assert all(300 < distance < 450 for distance in expected)
+    assert aircraft_lookup.calculate_distances_km(HOME_LAT, HOME_LON, lats, lons) == pytest.approx(expected)
+    monkeypatch.setattr(aircraft_lookup, 'FAST_EXT_AVAILABLE', False)
+    assert [aircraft_lookup.calculate_distance_km(HOME_LAT, HOME_LON, lat, lon)
+            for lat, lon in targets] == pytest.approx(expected)
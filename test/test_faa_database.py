@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src/faa_database.py parsing.
+
+The polars reader and the built-in (mmap + str.split) parser must build the
+same tables from the same MASTER.txt and ACFTREF.txt, including the edge
+cases of the FAA files: blank and invalid STATUS CODEs, lines that stop
+before STATUS CODE, and lines without the MODE S CODE HEX column. The
+optional cargo keyword scanners must agree with the regex one.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import faa_database
+from src.faa_database import FAADatabase
+
+requires_polars = pytest.mark.skipif(not faa_database.POLARS_AVAILABLE, reason="polars not installed")
+
+MASTER_HEADER = (
+    'N-NUMBER,SERIAL NUMBER,MFR MDL CODE,ENG MFR MDL,YEAR MFR,TYPE REGISTRANT,NAME,'
+    'STREET,STREET2,CITY,STATE,ZIP CODE,REGION,COUNTY,COUNTRY,LAST ACTION DATE,'
+    'CERT ISSUE DATE,CERTIFICATION,TYPE AIRCRAFT,TYPE ENGINE,STATUS CODE,MODE S CODE,'
+    'FRACT OWNER,AIR WORTH DATE,OTHER NAMES(1),OTHER NAMES(2),OTHER NAMES(3),'
+    'OTHER NAMES(4),OTHER NAMES(5),EXPIRATION DATE,UNIQUE ID,KIT MFR, KIT MODEL,'
+    'MODE S CODE HEX,'
+)
+
+ACFTREF_LINES = [
+    'CODE,MFR,MODEL,TYPE-ACFT,TYPE-ENG,AC-CAT,BUILD-CERT-IND,NO-ENG,NO-SEATS,AC-WEIGHT,SPEED,',
+    '1380200,BOEING                        ,767-300             ,5,5 ,1,0,02,290,CLASS 3,0000,,,',
+    '2072704,CESSNA                        ,172S                ,4,1 ,1,0,01,004,CLASS 1,0124,,,',
+    '6300012,ROBINSON HELICOPTER           ,R44 II              ,6,1 ,1,0,01,004,CLASS 1,0000,,,',
+    '3420213,PIPER                         ,PA-34-220T          ,5,1 ,1,0,02,006,CLASS 1,0000,,,',
+    '9999999,SHORT LINE                    ,X1',
+    '       ,NO CODE                       ,X2                  ,4,1 ,1,0,01,002,CLASS 1,0000,,,',
+]
+
+
+def _master_line(n_number, mfr_model_code, registrant, type_aircraft, type_engine,
+                 status_code, mode_s_hex='', fields=35):
+    """One space-padded MASTER.txt line, cut to its first `fields` fields."""
+    row = [''] * 35
+    row[0] = n_number.ljust(5)
+    row[2] = mfr_model_code.ljust(7)
+    row[6] = registrant.ljust(50)
+    row[18] = type_aircraft
+    row[19] = type_engine.ljust(2)
+    row[20] = status_code
+    row[33] = mode_s_hex.ljust(10)
+    return ','.join(row[:fields])
+
+
+MASTER_LINES = [
+    MASTER_HEADER,
+    _master_line('100AB', '1380200', 'UNITED PARCEL SERVICE CO', '5', '5', 'V', 'A00001'),
+    _master_line('200CD', '2072704', 'SMITH JOHN', '4', '1', 'V', 'A1B2C3'),
+    # Blank STATUS CODE, both unpadded and padded, is kept
+    _master_line('300EF', '6300012', 'FEDERAL EXPRESS CORP', '6', '1', '', 'AB1234'),
+    _master_line('400GH', '3420213', 'ATLAS AIR INC', '5', '1', '   ', 'C0FFEE'),
+    _master_line('500JK', '1380200', 'KALITTA AIR LLC', '5', '5', '', ''),
+    # Deregistered, so skipped
+    _master_line('600LM', '1380200', 'DHL AIRWAYS', '5', '5', 'D', 'ABCDEF'),
+    # Stops before STATUS CODE, so skipped
+    _master_line('700NP', '2072704', 'SHORT LINE', '4', '1', 'V', fields=20),
+    # Stops before MODE S CODE HEX, so kept without an ICAO24
+    _master_line('800QR', '2072704', 'NO HEX LLC', '4', '1', 'V', fields=25),
+    '',
+    _master_line('', '2072704', 'NO N-NUMBER', '4', '1', 'V', 'A55555'),
+    _master_line('900ST', 'UNKNOWN', 'PRIME AIR AMAZON', 'O', '', 'A', 'a77777'),
+    _master_line('100AB', '2072704', 'REREGISTERED', '4', '1', 'V', 'A00001'),
+]
+
+
+def _load(tmp_path, monkeypatch, use_polars):
+    """Parse the synthetic files into a fresh FAADatabase with or without polars."""
+    data_dir = tmp_path / ('polars' if use_polars else 'builtin')
+    data_dir.mkdir()
+    (data_dir / 'MASTER.txt').write_text('\n'.join(MASTER_LINES) + '\n')
+    (data_dir / 'ACFTREF.txt').write_text('\n'.join(ACFTREF_LINES) + '\n')
+    monkeypatch.setattr(faa_database, 'POLARS_AVAILABLE', use_polars)
+    db = FAADatabase(str(data_dir))
+    return db, db._parse_acftref(data_dir / 'ACFTREF.txt')
+
+
+@requires_polars
+def test_polars_and_builtin_parsers_build_identical_tables(tmp_path, monkeypatch):
+    """Test that the polars and built-in parsers produce the same tables"""
+    builtin, builtin_ref = _load(tmp_path, monkeypatch, use_polars=False)
+    polars, polars_ref = _load(tmp_path, monkeypatch, use_polars=True)
+
+    assert builtin.is_ready() and polars.is_ready()
+    assert polars_ref == builtin_ref
+    assert polars.aircraft_count == builtin.aircraft_count
+    assert polars._tables == builtin._tables
+
+
+@requires_polars
+def test_blank_status_code_is_kept(tmp_path, monkeypatch):
+    """Test that registrations with a blank STATUS CODE are parsed by polars"""
+    db, _ = _load(tmp_path, monkeypatch, use_polars=True)
+
+    assert db.lookup(callsign='N300EF').cargo_carrier == 'FDX'
+    assert db.lookup(icao24='c0ffee').type == 'AMAZON'
+    assert db.lookup(callsign='N500JK').type == 'CARGO'
+
+
+@requires_polars
+def test_short_and_invalid_rows_are_skipped(tmp_path, monkeypatch):
+    """Test that truncated, deregistered and N-number-less lines are skipped"""
+    db, _ = _load(tmp_path, monkeypatch, use_polars=True)
+
+    assert db.lookup(callsign='N600LM') is None
+    assert db.lookup(callsign='N700NP') is None
+    assert db.lookup(icao24='a55555') is None
+    assert db.lookup(callsign='N800QR').registrant == 'NO HEX LLC'
+    assert db.aircraft_count == 8
+
+
+# Registrants with no, one and several cargo keywords, in and out of priority order
+CARGO_REGISTRANTS = [
+    '', 'SMITH JOHN', 'UNITED PARCEL SERVICE CO', 'SUPSTAR AVIATION', 'DHL UPS LEASING',
+    'ABX AIR FEDEX', 'ATLAS AIR DHL', 'KALITTA PRIME AIR', 'MOUNTAIN AIR CARGO INC',
+    'POLAR AIR CARGOLUX', 'AIR TRANSPORT INTL', 'WORLD AIRWAYS AMAZON',
+]
+
+
+def _cargo_carriers(monkeypatch, use_automaton):
+    monkeypatch.setattr(faa_database, 'AHOCORASICK_AVAILABLE', use_automaton)
+    return [FAADatabase._is_cargo_carrier(registrant) for registrant in CARGO_REGISTRANTS]
+
+
+def test_cargo_carrier_keyword_priority(monkeypatch):
+    """Test that the first CARGO_KEYWORDS entry found in a registrant wins"""
+    assert _cargo_carriers(monkeypatch, use_automaton=False) == [
+        '', '', 'UPS', 'UPS', 'UPS', 'FDX', 'DHL', 'AMAZON', 'CARGO', 'CARGO', 'CARGO', 'AMAZON']
+
+
+@pytest.mark.skipif(not faa_database.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")
+def test_cargo_automaton_matches_regex_scan(monkeypatch):
+    """Test that the pyahocorasick scan gives the regex scan's carrier codes"""
+    assert (_cargo_carriers(monkeypatch, use_automaton=True)
+            == _cargo_carriers(monkeypatch, use_automaton=False))
+
+
+# Every one-character code plus the multi-character and empty ones in the files
+FAA_CODES = ['', ' ', '10', '11', 'Ü', *map(chr, range(32, 127))]
+
+
+@pytest.mark.skipif(not faa_database.FAST_EXT_AVAILABLE,
+                    reason="faa_fast not built (scripts/build_aircraft_fast.py)")
+def test_fast_classify_matches_python(monkeypatch):
+    """Test that faa_fast.classify gives _classify_type and _is_cargo_carrier's answers"""
+    from src.faa_fast import cargo_codes, classify, type_codes
+    monkeypatch.setattr(faa_database, 'AHOCORASICK_AVAILABLE', False)
+
+    for type_aircraft in FAA_CODES:
+        for type_engine in FAA_CODES:
+            packed = classify(type_aircraft, type_engine, '')
+            assert type_codes()[packed & 255] == FAADatabase._classify_type(type_aircraft, type_engine, {})
+    for registrant in CARGO_REGISTRANTS:
+        packed = classify('5', '5', registrant)
+        assert cargo_codes()[packed >> 8] == FAADatabase._is_cargo_carrier(registrant)
+
+
+@pytest.mark.skipif(not faa_database.FAST_EXT_AVAILABLE,
+                    reason="faa_fast not built (scripts/build_aircraft_fast.py)")
+def test_fast_set_rules_rejects_long_codes():
+    """Test that faa_fast refuses rules its one-character tables can't hold"""
+    from src.faa_fast import classify, set_rules, type_codes
+    with pytest.raises(ValueError):
+        set_rules({'10': 'GA'}, {}, set(), ())
+    # The rules loaded by faa_database are still in place
+    assert type_codes()[classify('6', '', '') & 255] == 'HELO'
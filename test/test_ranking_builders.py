@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Smoke tests for scripts/build_tennis_rankings.py and
+scripts/build_golfer_rankings.py.
+
+The ESPN session is replaced by a fake that finds every searched name, and
+the output goes to a temporary file, so build_rankings() runs end to end
+without the network.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add the scripts directory to the path for imports (the builders import espn_client)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import build_golfer_rankings
+import build_tennis_rankings
+
+
+class FakeResponse:
+    """Search response listing one player of the searched sport named like the query."""
+
+    status_code = 200
+
+    def __init__(self, sport, query):
+        self.content = json.dumps({'items': [{
+            'sport': sport,
+            'id': str(abs(hash(query.casefold())) % 100000),
+            'displayName': query.title(),
+        }]}).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Stand-in for espn_client.SESSION that answers searches for one sport."""
+
+    def __init__(self, sport):
+        self.sport = sport
+        self.queries = []
+
+    def get(self, url, params=None, timeout=None):
+        self.queries.append(params['query'])
+        return FakeResponse(self.sport, params['query'])
+
+
+@pytest.fixture
+def tennis(monkeypatch, tmp_path):
+    monkeypatch.setattr(build_tennis_rankings, 'SESSION', FakeSession('tennis'))
+    monkeypatch.setattr(build_tennis_rankings, 'OUTPUT_PATH', str(tmp_path / 'tennis_rankings.json'))
+    build_tennis_rankings.TENNIS_SEARCH._search_cached.cache_clear()
+    return build_tennis_rankings
+
+
+@pytest.fixture
+def golf(monkeypatch, tmp_path):
+    monkeypatch.setattr(build_golfer_rankings, 'SESSION', FakeSession('golf'))
+    monkeypatch.setattr(build_golfer_rankings, 'OUTPUT_PATH', str(tmp_path / 'golfer_rankings.json'))
+    build_golfer_rankings.GOLF_SEARCH._search_cached.cache_clear()
+    return build_golfer_rankings
+
+
+def test_tennis_build_rankings(tennis):
+    """Test that a tennis build finds every listed player and writes the file"""
+    players = tennis.load_source_players()[0]['tennis']
+    output = tennis.build_rankings()
+
+    assert output['stats']['failed'] == 0
+    assert output['stats']['total'] == len(players)
+    assert output['stats']['atp'] + output['stats']['wta'] == len(players)
+    assert {p['name'] for p in output['players']} == {p['name'] for p in players}
+    assert json.load(open(tennis.OUTPUT_PATH)) == output
+
+
+def test_tennis_build_rankings_unchanged_skips_search(tennis):
+    """Test that a rebuild with the same player list makes no ESPN requests"""
+    first = tennis.build_rankings()
+    tennis.SESSION.queries.clear()
+
+    assert tennis.build_rankings() == first
+    assert tennis.SESSION.queries == []
+
+
+def test_golfer_build_rankings(golf):
+    """Test that a golf build ranks every listed golfer on each tour"""
+    output = golf.build_rankings()
+
+    for tour, _, names in golf.TOURS:
+        assert [p['rank'] for p in output[tour]] == list(range(1, len(names) + 1))
+        assert [p['name'] for p in output[tour]] == [name.title() for name in names]